@@ -119,6 +119,7 @@ async def handle_client(websocket: Any):
         
         # Handle incoming messages
         async for message in websocket:
+            recv_time = time.time()
             try:
                 data = json.loads(message)
                 msg_type = data.get("type")
@@ -141,6 +142,23 @@ async def handle_client(websocket: Any):
                         direction, moving, anim, frame
                     )
                     
+                elif msg_type == "player_input":
+                    # Sequence-numbered inputs, the server simulates the movement itself
+                    inputs = data.get("inputs", [])
+                    if isinstance(inputs, list):
+                        PLAYER_HANDLER.apply_inputs(player_id, inputs)
+
+                elif msg_type == "ping":
+                    # Application-level ping, echo the client's timestamp back
+                    # with our receive (t1) and send (t2) times for clock synchronization
+                    await websocket.send(json.dumps({
+                        "type": "pong",
+                        "id": data.get("id"),
+                        "t0": data.get("t0"),
+                        "t1": recv_time,
+                        "t2": time.time()
+                    }))
+
                 elif msg_type == "chat_send":
                     # Send chat message - use server-assigned ID
                     text = str(data.get("text", ""))
@@ -0,0 +1,375 @@
+"""
+Network-condition simulator.
+
+A WebSocket relay that sits between the game client and server.py and adds
+latency, jitter, loss, reordering and bandwidth caps, so online behaviour can be
+tested on a single machine.
+
+    python server.py
+    python -m server.netsim --delay 80 --jitter 20 --loss 0.02
+    # then point the client at the relay: ONLINE_SERVER_URL = "http://localhost:8990"
+
+Scenarios change the conditions over time (built-in name or a JSON file):
+
+    python -m server.netsim --scenario flaky --seed 1 --report netsim_report.json
+
+A scenario file looks like:
+
+    {
+      "duration": 30,
+      "phases": [
+        {"at": 0,  "conditions": {"delay_ms": 40, "jitter_ms": 5}},
+        {"at": 10, "conditions": {"delay_ms": 200, "loss": 0.05}, "down": {"bandwidth_kbps": 64}},
+        {"at": 20, "disconnect": true}
+      ]
+    }
+"""
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+import websockets
+from websockets.asyncio.server import serve
+
+from src.utils import Logger
+
+LISTEN_PORT = 8990
+UPSTREAM_URL = "ws://localhost:8989"
+
+# Message types that may be dropped. Everything else (chat, registration) is only delayed,
+# which is what happens to a reliable stream when packets are lost.
+LOSSY_TYPES = {"players_update", "player_update", "player_input", "ping", "pong"}
+
+
+@dataclass
+class LinkConditions:
+    delay_ms: float = 0.0
+    jitter_ms: float = 0.0
+    distribution: str = "uniform"   # uniform | normal | pareto
+    loss: float = 0.0               # drop probability for LOSSY_TYPES
+    reorder: bool = False           # allow messages to overtake each other
+    bandwidth_kbps: float = 0.0     # 0 = unlimited
+    queue_limit_kb: float = 256.0   # tail drop of LOSSY_TYPES once this much data is waiting on the link
+
+    @classmethod
+    def from_dict(cls, data: dict, base: "LinkConditions | None" = None) -> "LinkConditions":
+        base = base or cls()
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown link condition(s): {', '.join(sorted(unknown))}")
+        return replace(base, **data)
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """One-way delay in seconds for a single message"""
+        extra = 0.0
+        if self.jitter_ms > 0:
+            if self.distribution == "normal":
+                extra = abs(rng.gauss(0.0, self.jitter_ms))
+            elif self.distribution == "pareto":
+                # Heavy tail: most messages are fast, a few are very late
+                extra = self.jitter_ms * (rng.paretovariate(2.5) - 1.0)
+            else:
+                extra = rng.uniform(0.0, self.jitter_ms)
+        return max(0.0, self.delay_ms + extra) / 1000
+
+
+@dataclass
+class LinkStats:
+    sent: int = 0
+    delivered: int = 0
+    dropped_loss: int = 0
+    dropped_queue: int = 0
+    reordered: int = 0
+    bytes: int = 0
+    max_queue_bytes: int = 0
+    latency_total: float = 0.0
+
+    def to_dict(self) -> dict:
+        avg = self.latency_total / self.delivered if self.delivered else 0.0
+        return {
+            "sent": self.sent,
+            "delivered": self.delivered,
+            "dropped_loss": self.dropped_loss,
+            "dropped_queue": self.dropped_queue,
+            "reordered": self.reordered,
+            "bytes": self.bytes,
+            "max_queue_bytes": self.max_queue_bytes,
+            "avg_latency_ms": round(avg * 1000, 2),
+        }
+
+
+class Link:
+    """One direction of a relayed connection"""
+
+    def __init__(self, name: str, conditions: LinkConditions, rng: random.Random, stats: LinkStats):
+        self.name = name
+        self.conditions = conditions
+        self.rng = rng
+        self.stats = stats
+        self._heap: list[tuple[float, int, float, str]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._link_free_at = 0.0        # when the (bandwidth-limited) link finishes the last message
+        self._last_delivery = 0.0       # used to keep FIFO order when reordering is off
+        self._last_seq_delivered = -1
+        self._queued_bytes = 0
+
+    def push(self, message: str) -> None:
+        c = self.conditions
+        now = time.monotonic()
+        self.stats.sent += 1
+
+        lossy = _message_type(message) in LOSSY_TYPES
+        if c.loss > 0 and lossy and self.rng.random() < c.loss:
+            self.stats.dropped_loss += 1
+            return
+
+        # Reliable messages are always queued, a full link only delays them
+        size = len(message)
+        if lossy and self._queued_bytes + size > c.queue_limit_kb * 1024:
+            self.stats.dropped_queue += 1
+            return
+
+        # Serialization delay on a capped link, then propagation delay
+        start = max(now, self._link_free_at)
+        if c.bandwidth_kbps > 0:
+            self._link_free_at = start + size * 8 / (c.bandwidth_kbps * 1000)
+        else:
+            self._link_free_at = start
+        due = self._link_free_at + c.sample_delay(self.rng)
+        if not c.reorder:
+            due = max(due, self._last_delivery)
+        self._last_delivery = due
+
+        self._queued_bytes += size
+        self.stats.max_queue_bytes = max(self.stats.max_queue_bytes, self._queued_bytes)
+        heapq.heappush(self._heap, (due, next(self._counter), now, message))
+        self._wakeup.set()
+
+    async def run(self, send) -> None:
+        """Deliver queued messages through `send` once they are due"""
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            due = self._heap[0][0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                self._wakeup.clear()
+                try:
+                    # A newly pushed message may be due earlier than the current head
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, seq, queued_at, message = heapq.heappop(self._heap)
+            self._queued_bytes -= len(message)
+            if seq < self._last_seq_delivered:
+                self.stats.reordered += 1
+            self._last_seq_delivered = max(self._last_seq_delivered, seq)
+            await send(message)
+            self.stats.delivered += 1
+            self.stats.bytes += len(message)
+            self.stats.latency_total += time.monotonic() - queued_at
+
+
+def _message_type(message: str | bytes) -> str:
+    try:
+        return str(json.loads(message).get("type"))
+    except Exception:
+        return ""
+
+
+@dataclass
+class Phase:
+    at: float
+    up: LinkConditions
+    down: LinkConditions
+    disconnect: bool = False
+
+
+@dataclass
+class Scenario:
+    name: str
+    phases: list[Phase] = field(default_factory=list)
+    duration: float | None = None
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict, base: LinkConditions) -> "Scenario":
+        phases: list[Phase] = []
+        up, down = base, base
+        for p in sorted(data.get("phases", []), key=lambda p: float(p.get("at", 0))):
+            both = p.get("conditions", {})
+            up = LinkConditions.from_dict({**both, **p.get("up", {})}, up)
+            down = LinkConditions.from_dict({**both, **p.get("down", {})}, down)
+            phases.append(Phase(float(p.get("at", 0)), up, down, bool(p.get("disconnect", False))))
+        return cls(name, phases, data.get("duration"))
+
+
+# Built-in scenarios, all times in seconds
+BUILTIN_SCENARIOS: dict[str, dict] = {
+    "lan": {"phases": [{"at": 0, "conditions": {"delay_ms": 1, "jitter_ms": 1}}]},
+    "wifi": {"phases": [{"at": 0, "conditions": {"delay_ms": 15, "jitter_ms": 25, "distribution": "pareto", "loss": 0.005}}]},
+    "mobile": {"phases": [{"at": 0, "conditions": {"delay_ms": 90, "jitter_ms": 60, "distribution": "normal",
+                                                   "loss": 0.02, "reorder": True, "bandwidth_kbps": 512}}]},
+    "congested": {"duration": 40, "phases": [
+        {"at": 0, "conditions": {"delay_ms": 30, "jitter_ms": 10}},
+        {"at": 10, "conditions": {"delay_ms": 150, "jitter_ms": 80}, "down": {"bandwidth_kbps": 48, "queue_limit_kb": 32}},
+        {"at": 30, "conditions": {"delay_ms": 30, "jitter_ms": 10, "bandwidth_kbps": 0, "queue_limit_kb": 256}},
+    ]},
+    "flaky": {"duration": 45, "phases": [
+        {"at": 0, "conditions": {"delay_ms": 40, "jitter_ms": 20}},
+        {"at": 10, "disconnect": True},
+        {"at": 15, "conditions": {"loss": 0.15, "jitter_ms": 120, "reorder": True}},
+        {"at": 25, "disconnect": True},
+        {"at": 30, "conditions": {"loss": 0.0, "jitter_ms": 20, "reorder": False}},
+    ]},
+}
+
+
+class NetSim:
+    def __init__(self, upstream: str, up: LinkConditions, down: LinkConditions, seed: int | None = None):
+        self.upstream = upstream
+        self.up = up
+        self.down = down
+        self.rng = random.Random(seed)
+        self.up_stats = LinkStats()
+        self.down_stats = LinkStats()
+        self.connections = 0
+        self.disconnects = 0
+        self._links: set[Link] = set()
+        self._clients: set[Any] = set()
+
+    def set_conditions(self, up: LinkConditions, down: LinkConditions) -> None:
+        self.up, self.down = up, down
+        for link in self._links:
+            link.conditions = up if link.name == "up" else down
+
+    async def disconnect_all(self) -> None:
+        self.disconnects += 1
+        for ws in list(self._clients):
+            await ws.close(code=1001, reason="netsim disconnect")
+
+    async def handle_client(self, client: Any) -> None:
+        self.connections += 1
+        self._clients.add(client)
+        up = Link("up", self.up, self.rng, self.up_stats)
+        down = Link("down", self.down, self.rng, self.down_stats)
+        self._links.update((up, down))
+        try:
+            async with websockets.connect(self.upstream) as server:
+                async def pump(source, link: Link) -> None:
+                    try:
+                        async for message in source:
+                            link.push(message)
+                    except websockets.exceptions.ConnectionClosed:
+                        pass
+
+                tasks = [
+                    asyncio.create_task(pump(client, up)),
+                    asyncio.create_task(pump(server, down)),
+                    asyncio.create_task(up.run(server.send)),
+                    asyncio.create_task(down.run(client.send)),
+                ]
+                _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for t in pending:
+                    t.cancel()
+        except Exception as e:
+            Logger.warning(f"[NetSim] Connection error: {e}")
+        finally:
+            self._links.difference_update((up, down))
+            self._clients.discard(client)
+            await client.close()
+
+    def report(self) -> dict:
+        return {
+            "connections": self.connections,
+            "disconnects": self.disconnects,
+            "up": self.up_stats.to_dict(),
+            "down": self.down_stats.to_dict(),
+        }
+
+
+async def run_scenario(sim: NetSim, scenario: Scenario) -> None:
+    started = time.monotonic()
+    for phase in scenario.phases:
+        await asyncio.sleep(max(0.0, phase.at - (time.monotonic() - started)))
+        Logger.info(f"[NetSim] t={phase.at:.1f}s {scenario.name}: up={phase.up} down={phase.down}"
+              + (" (disconnect)" if phase.disconnect else ""))
+        sim.set_conditions(phase.up, phase.down)
+        if phase.disconnect:
+            await sim.disconnect_all()
+    if scenario.duration is not None:
+        await asyncio.sleep(max(0.0, scenario.duration - (time.monotonic() - started)))
+
+
+async def print_stats(sim: NetSim, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        Logger.info(f"[NetSim] {json.dumps(sim.report())}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    base = LinkConditions(
+        delay_ms=args.delay, jitter_ms=args.jitter, distribution=args.distribution,
+        loss=args.loss, reorder=args.reorder, bandwidth_kbps=args.bandwidth,
+    )
+    scenario = None
+    if args.scenario:
+        if args.scenario in BUILTIN_SCENARIOS:
+            data = BUILTIN_SCENARIOS[args.scenario]
+        else:
+            with open(args.scenario, "r") as f:
+                data = json.load(f)
+        scenario = Scenario.from_dict(args.scenario, data, base)
+
+    sim = NetSim(args.upstream, base, base, seed=args.seed)
+    Logger.info(f"[NetSim] Relaying ws://0.0.0.0:{args.port} -> {args.upstream}")
+    stats_task = asyncio.create_task(print_stats(sim, args.stats_interval))
+    try:
+        async with serve(sim.handle_client, "0.0.0.0", args.port):
+            if scenario is not None:
+                await run_scenario(sim, scenario)
+                if scenario.duration is None:
+                    await asyncio.Future()
+            else:
+                await asyncio.Future()  # run forever
+    finally:
+        stats_task.cancel()
+        report = sim.report()
+        Logger.info(f"[NetSim] Final: {json.dumps(report)}")
+        if args.report:
+            with open(args.report, "w") as f:
+                json.dump(report, f, indent=2)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="WebSocket relay that simulates bad network conditions")
+    parser.add_argument("--port", type=int, default=LISTEN_PORT, help="port the client connects to")
+    parser.add_argument("--upstream", default=UPSTREAM_URL, help="URL of the real server")
+    parser.add_argument("--delay", type=float, default=0.0, help="one-way base delay in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay in ms")
+    parser.add_argument("--distribution", choices=("uniform", "normal", "pareto"), default="uniform")
+    parser.add_argument("--loss", type=float, default=0.0, help="drop probability of state messages")
+    parser.add_argument("--reorder", action="store_true", help="let jittered messages overtake each other")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="link capacity in kbit/s (0 = unlimited)")
+    parser.add_argument("--scenario", help=f"built-in ({', '.join(BUILTIN_SCENARIOS)}) or path to a JSON file")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible runs")
+    parser.add_argument("--report", help="write the final statistics to this JSON file")
+    parser.add_argument("--stats-interval", type=float, default=5.0, help="seconds between stat lines")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -2,6 +2,7 @@ import threading
 import time
 from dataclasses import dataclass
 from typing import Dict
+from server.world import TILE_SIZE, get_map_collision, get_world, arrival, player_tile, simulate_step
 
 TIMEOUT_TIME = 60.0
 CHECK_INTERVAL_TIME = 10.0
@@ -25,6 +26,8 @@ class Player:
     moving: bool = False
     anim: str = "down"
     frame: int = 0
+    # Last input sequence number applied by the server, -1 while the client only sends positions
+    ack: int = -1
 
     # HINT: This part might be helpful for direction change
     # Maybe you can add other parameters? 
@@ -51,9 +54,11 @@ class Player:
         ):
             self.last_update = time.monotonic()
 
-        self.x = x
-        self.y = y
-        self.map = map_name
+        # Once the client sends inputs, the position is owned by the server
+        if self.ack < 0:
+            self.x = x
+            self.y = y
+            self.map = map_name
         self.direction = direction
         self.moving = moving
         self.anim = anim
@@ -65,6 +70,10 @@ class Player:
         return (now - self.last_update) >= TIMEOUT_TIME
 
 
+def _near(a: tuple[float, float], b: tuple[float, float] | None) -> bool:
+    return b is not None and abs(a[0] - b[0]) < 1 and abs(a[1] - b[1]) < 1
+
+
 class PlayerHandler:
     _lock: threading.Lock
     _stop_event: threading.Event
@@ -158,6 +167,58 @@ class PlayerHandler:
 
             return True
 
+    def apply_inputs(self, pid: int, inputs: list[dict]) -> bool:
+        """Simulate a batch of input commands in order. Returns False for an unknown player."""
+        with self._lock:
+            p = self.players.get(pid)
+            if not p:
+                return False
+
+            for cmd in inputs:
+                seq = int(cmd.get("seq", -1))
+                if seq <= p.ack:
+                    continue  # duplicate or out of order, already applied
+                resync = cmd.get("resync")
+                if resync:
+                    x = float(resync.get("x", p.x))
+                    y = float(resync.get("y", p.y))
+                    map_name = str(resync.get("map", p.map))
+                    # A refused resync keeps the server position, the client follows it on reconcile
+                    if self._resync_allowed(p, x, y, map_name):
+                        p.x, p.y, p.map = x, y, map_name
+                collision = get_map_collision(p.map)
+                info = get_world().get(p.map)
+                p.x, p.y = simulate_step(
+                    int(p.x), int(p.y),
+                    float(cmd.get("mx", 0.0)), float(cmd.get("my", 0.0)),
+                    float(cmd.get("dt", 0.0)),
+                    collision,
+                    info.blockers if info else ()
+                )
+                p.ack = seq
+                p.last_update = time.monotonic()
+            return True
+
+    @staticmethod
+    def _resync_allowed(p: Player, x: float, y: float, map_name: str) -> bool:
+        """
+        Clients only move outside of their inputs when they teleport or (re)connect. Before the
+        first input the position is the client's anyway (see Player.update), after that it must be
+        where the player already is, a map spawn, or the arrival of the teleporter under the player.
+        """
+        collision = get_map_collision(map_name)
+        if collision is None or not (0 <= x < collision.width * TILE_SIZE and 0 <= y < collision.height * TILE_SIZE):
+            return False
+        if p.ack < 0 or (x, y, map_name) == (p.x, p.y, p.map):
+            return True
+        world = get_world()
+        info = world.get(map_name)
+        if info and _near((x, y), info.spawn):
+            return True
+        here = world.get(p.map)
+        tp = here.teleport_at(player_tile(p.x, p.y)) if here else None
+        return tp is not None and tp.destination == map_name and _near((x, y), arrival(tp))
+
     def list_players(self) -> dict:
         """Return dict of all players with full animation state."""
         with self._lock:
@@ -171,6 +232,7 @@ class PlayerHandler:
                     "direction": p.direction,
                     "moving": p.moving,
                     "anim": p.anim,
-                    "frame": p.frame
+                    "frame": p.frame,
+                    "ack": p.ack
                 }
             return player_list
\ No newline at end of file
@@ -0,0 +1,158 @@
+import json
+import math
+import os
+import threading
+
+import pygame as pg
+import pytmx
+
+from src.maps.bake import bake_tile_grid
+from src.maps.collision_shapes import AABBTree, load_object_shapes
+from src.maps.sweep import sweep_grid, sweep_box, sweep_shape, contact_offset
+from src.maps.tile_grid import TileGrid
+from src.utils import Teleport
+
+"""
+Server-side copy of the player movement step, sharing the client's sweep (src/maps/sweep.py).
+
+The server is authoritative about player positions: clients send their inputs,
+the server replays them here against the static collision layers of the map,
+plus the trainer/NPC rects of the world save (they never move), and broadcasts the
+result. The client runs the exact same step (Player._simulate_step) to predict its
+own movement, so keep both in sync. Spawns and teleporters also come from the world
+save, the server uses them to check where a client says it teleported to.
+"""
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAPS_DIR = os.path.join(ROOT_DIR, "assets", "maps")
+WORLD_SAVE = os.path.join(ROOT_DIR, "saves", "game0.json")     # same file GameScene loads
+
+TILE_SIZE = 64                      # GameSettings.TILE_SIZE
+PLAYER_SPEED = 4.0 * TILE_SIZE      # Player.speed
+MAX_INPUT_DT = 0.25                 # ignore absurd frame times sent by a client
+
+
+class MapCollision:
+    def __init__(self, grid: TileGrid, shapes=None):
+        self.width = grid.width
+        self.height = grid.height
+        self.grid = grid        # SOLID on the collision/house tiles
+        self.shapes = shapes    # AABBTree of the object layer shapes, None if the map has none
+
+    def sweep(self, x: int, y: int, dx: int, dy: int, boxes: list[tuple[int, int, int, int]] = ()) -> float:
+        """
+        Fraction of the move (dx, dy) a TILE_SIZE square at (x, y) can do before touching
+        a solid tile, shape or one of boxes (trainers/NPCs), 1.0 if nothing is in the way
+        """
+        rect = pg.Rect(x, y, TILE_SIZE, TILE_SIZE)
+        best = sweep_grid(self.grid, rect, dx, dy).time
+        if self.shapes is not None:
+            for shape in self.shapes.candidates(rect.union(rect.move(dx, dy))):
+                best = min(best, sweep_shape(rect, dx, dy, shape).time)
+        for box in boxes:
+            best = min(best, sweep_box(rect, dx, dy, pg.Rect(box)).time)
+        return best
+
+
+def _load_shapes(tmx: pytmx.TiledMap):
+    """Same object layer shapes as Map.shapes"""
+    if not any(isinstance(layer, pytmx.TiledObjectGroup) for layer in tmx.visible_layers):
+        return None
+    shapes = load_object_shapes(tmx, TILE_SIZE)
+    return AABBTree(shapes) if shapes else None
+
+
+_cache: dict[str, MapCollision | None] = {}
+_cache_lock = threading.Lock()
+
+
+def get_map_collision(map_name: str) -> MapCollision | None:
+    """Load (once) the collision tiles and shapes of a map, same layers as the client bake (bake_tile_grid)"""
+    name = os.path.basename(map_name)
+    with _cache_lock:
+        if name in _cache:
+            return _cache[name]
+        collision = None
+        path = os.path.join(MAPS_DIR, name)
+        if name.endswith(".tmx") and os.path.exists(path):
+            tmx = pytmx.TiledMap(path)
+            collision = MapCollision(bake_tile_grid(tmx), _load_shapes(tmx))
+        _cache[name] = collision
+        return collision
+
+
+class MapInfo:
+    """Spawn, teleporters and trainer/NPC rects of a map, as GameManager.from_dict loads them"""
+
+    def __init__(self, spawn: tuple[float, float], teleports: list[Teleport], blockers: list[tuple[int, int, int, int]]):
+        self.spawn = spawn
+        self.blockers = blockers
+        # Same index as Map._build_teleport_index
+        self.teleports: dict[tuple[int, int], Teleport] = {}
+        for tp in teleports:
+            self.teleports.setdefault(tp.tile, tp)
+
+    def teleport_at(self, tile: tuple[int, int]) -> Teleport | None:
+        return self.teleports.get(tile)
+
+
+_world: dict[str, MapInfo] | None = None
+
+
+def get_world() -> dict[str, MapInfo]:
+    """Load (once) the maps of the world save, {} if there is none"""
+    global _world
+    with _cache_lock:
+        if _world is not None:
+            return _world
+        _world = {}
+        if os.path.exists(WORLD_SAVE):
+            with open(WORLD_SAVE, "r") as f:
+                data = json.load(f)
+            for entry in data.get("map", []):
+                spawn = (entry["player"]["x"] * TILE_SIZE, entry["player"]["y"] * TILE_SIZE)
+                teleports = [Teleport.from_dict(t) for t in entry.get("teleport", [])]
+                # Every trainer, and the NPCs Map.from_dict creates (only shops)
+                entities = entry.get("enemy_trainers", []) + [n for n in entry.get("npcs", []) if n.get("type") == "shop"]
+                blockers = [(int(e["x"] * TILE_SIZE), int(e["y"] * TILE_SIZE), TILE_SIZE, TILE_SIZE) for e in entities]
+                _world[os.path.basename(entry["path"])] = MapInfo(spawn, teleports, blockers)
+        return _world
+
+
+def arrival(tp: Teleport) -> tuple[float, float] | None:
+    """Where tp drops the player, like GameManager.try_switch_map (spawn if it has no dest_pos)"""
+    if tp.dest_pos:
+        return tp.dest_pos.x, tp.dest_pos.y
+    info = get_world().get(tp.destination)
+    return info.spawn if info else None
+
+
+def player_tile(x: float, y: float) -> tuple[int, int]:
+    """Tile under the center of the player, Player.current_tile"""
+    return int((x + TILE_SIZE // 2) // TILE_SIZE), int((y + TILE_SIZE // 2) // TILE_SIZE)
+
+
+def _round(v: float) -> int:
+    return math.floor(v + 0.5)
+
+
+def simulate_step(x: int, y: int, mx: float, my: float, dt: float, collision: MapCollision | None,
+                  blockers: list[tuple[int, int, int, int]] = ()) -> tuple[int, int]:
+    """Move along x then y, each axis swept up to the first contact (mirror of Player._simulate_step)"""
+    dt = max(0.0, min(dt, MAX_INPUT_DT))
+    length = math.hypot(mx, my)
+    if length > 1.0:
+        mx, my = mx / length, my / length
+
+    ix, iy = int(x), int(y)
+    nx = _round(x + mx * PLAYER_SPEED * dt)
+    if collision:
+        t = collision.sweep(ix, iy, nx - ix, 0, blockers)
+        if t < 1.0:
+            nx = ix + contact_offset(nx - ix, t)
+    ny = _round(y + my * PLAYER_SPEED * dt)
+    if collision:
+        t = collision.sweep(nx, iy, 0, ny - iy, blockers)
+        if t < 1.0:
+            ny = iy + contact_offset(ny - iy, t)
+    return nx, ny
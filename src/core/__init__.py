@@ -1 +1 @@
-from .managers import GameManager, OnlineManager
\ No newline at end of file
+from .managers import GameManager, OnlineManager, OnlineProcessManager, TickScheduler
@@ -13,6 +13,7 @@ class Engine:
     screen: pg.Surface              # Screen Display of the Game
     clock: pg.time.Clock            # Clock for FPS control
     running: bool                   # Running state of the game
+    _full_redraw: bool              # Window exposed/restored, the screen has to be drawn again
 
     def __init__(self):
         Logger.info("Initializing Engine")
@@ -22,6 +23,7 @@ class Engine:
         self.screen = pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
         self.clock = pg.time.Clock()
         self.running = True
+        self._full_redraw = True
 
         pg.display.set_caption(GameSettings.TITLE)
 
@@ -50,12 +52,31 @@ class Engine:
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 self.running = False
+            if event.type in (pg.WINDOWEXPOSED, pg.WINDOWRESTORED, pg.WINDOWSIZECHANGED):
+                self._full_redraw = True
             input_manager.handle_events(event)
 
     def update(self, dt: float):
         scene_manager.update(dt)
 
     def render(self):
-        self.screen.fill((0, 0, 0))     # Make sure the display is cleared
-        scene_manager.draw(self.screen) # Draw the current scene
-        pg.display.flip()               # Render the display
+        rects = None
+        if GameSettings.DIRTY_RECTS and not self._full_redraw:
+            rects = scene_manager.dirty_rects()
+        self._full_redraw = False
+
+        if rects is None:
+            self.screen.fill((0, 0, 0))     # Make sure the display is cleared
+            scene_manager.draw(self.screen) # Draw the current scene
+            pg.display.flip()               # Render the display
+            return
+        if not rects:
+            return                          # Nothing changed, the last frame is still on screen
+
+        # Redraw the scene clipped to the changed area (blits outside it cost nothing)
+        # and push only those rects to the window
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        self.screen.fill((0, 0, 0))
+        scene_manager.draw(self.screen)
+        self.screen.set_clip(None)
+        pg.display.update(rects)
@@ -2,5 +2,8 @@ from .scene_manager import SceneManager
 from .input_manager import InputManager
 from .resource_manager import ResourceManager
 from .sound_manager import SoundManager
+from .path_service import PathService
+from .tick_scheduler import TickScheduler
 from .game_manager import GameManager
-from .online_manager import OnlineManager
\ No newline at end of file
+from .online_manager import OnlineManager
+from .online_process import OnlineProcessManager
\ No newline at end of file
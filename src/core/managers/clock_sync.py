@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import deque
+
+
+class ClockSync:
+    """
+    NTP-style estimate of the server clock relative to the local monotonic clock.
+
+    Every ping/pong exchange gives four timestamps:
+        t0  client send      (local monotonic)
+        t1  server receive   (server wall clock)
+        t2  server send      (server wall clock)
+        t3  client receive   (local monotonic)
+    offset = ((t1 - t0) + (t2 - t3)) / 2, so that server_time ~= local_time + offset.
+    delay  = (t3 - t0) - (t2 - t1), the network part of the round trip.
+
+    Samples with a large delay are the least accurate (queuing is rarely symmetric),
+    so only the fastest exchanges are used. A least-squares line through them gives
+    the offset at the current time and the drift between both clocks.
+    """
+
+    def __init__(self, max_samples: int = 32, min_samples: int = 3, min_drift_span: float = 10.0) -> None:
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[float, float, float]] = deque(maxlen=max_samples)  # (t, offset, delay)
+        self.min_samples = min_samples
+        # Over a short span, delay noise dominates the slope; only estimate drift past this (seconds)
+        self.min_drift_span = min_drift_span
+        self._offset = 0.0      # offset at _t_ref
+        self._drift = 0.0       # seconds of offset change per local second
+        self._t_ref = 0.0
+        self._synced = False
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def add_sample(self, t0: float, t1: float, t2: float, t3: float) -> None:
+        offset = ((t1 - t0) + (t2 - t3)) / 2
+        delay = max(0.0, (t3 - t0) - (t2 - t1))
+        with self._lock:
+            self._samples.append(((t0 + t3) / 2, offset, delay))
+            self._fit()
+
+    def _fit(self) -> None:
+        samples = list(self._samples)
+        best = min(s[2] for s in samples)
+        # Keep the exchanges within a small margin of the fastest one
+        good = [s for s in samples if s[2] <= best * 1.5 + 0.002]
+        t_ref = good[-1][0]
+        if len(good) >= self.min_samples:
+            n = len(good)
+            mean_t = sum(s[0] for s in good) / n
+            mean_o = sum(s[1] for s in good) / n
+            var_t = sum((s[0] - mean_t) ** 2 for s in good)
+            drift = 0.0
+            if var_t > 1e-6 and good[-1][0] - good[0][0] >= self.min_drift_span:
+                drift = sum((s[0] - mean_t) * (s[1] - mean_o) for s in good) / var_t
+                # Real clocks drift by tens of parts per million; anything larger is noise
+                drift = max(-2e-4, min(2e-4, drift))
+            self._offset = mean_o + drift * (t_ref - mean_t)
+            self._drift = drift
+        else:
+            self._offset = min(good, key=lambda s: s[2])[1]
+            self._drift = 0.0
+        self._t_ref = t_ref
+        self._synced = len(samples) >= self.min_samples
+
+    def offset(self, local_time: float | None = None) -> float:
+        """Server minus local clock, in seconds, at the given local monotonic time"""
+        t = time.monotonic() if local_time is None else local_time
+        with self._lock:
+            return self._offset + self._drift * (t - self._t_ref)
+
+    @property
+    def drift_ppm(self) -> float:
+        with self._lock:
+            return self._drift * 1e6
+
+    def server_to_local(self, server_time: float) -> float:
+        """Map a server timestamp (time.time() on the server) to local monotonic time"""
+        with self._lock:
+            # server = local + offset + drift * (local - t_ref)  ->  solve for local
+            return (server_time - self._offset + self._drift * self._t_ref) / (1 + self._drift)
+
+    def local_to_server(self, local_time: float) -> float:
+        return local_time + self.offset(local_time)
@@ -4,6 +4,7 @@ from src.core.services import sound_manager
 import json, os
 import pygame as pg
 from typing import TYPE_CHECKING
+from src.maps.sweep import SweepHit, sweep_box
 
 if TYPE_CHECKING:
     from src.maps.map import Map
@@ -45,6 +46,10 @@ class GameManager:
         self.should_change_scene = False
         self.next_map = ""
         self.current_shop_overlay = None
+
+        # Teleport graph for navigation across maps
+        from src.maps.world_graph import WorldGraph
+        self.world = WorldGraph(self.maps)
         
     @property
     def current_map(self) -> Map:
@@ -68,6 +73,7 @@ class GameManager:
             
     def try_switch_map(self) -> None:
         if self.should_change_scene:
+            self.maps[self.current_map_key].sight.move_target(None)
             self.current_map_key = self.next_map
             self.next_map = ""
             self.should_change_scene = False
@@ -78,20 +84,24 @@ class GameManager:
                 else:
                     self.player.position = self.maps[self.current_map_key].spawn
 
-                self.player.teleport_cooldown = 0.5
+                self.player.reset_tile_tracking()
             
     def check_collision(self, rect: pg.Rect) -> bool:
-        if self.maps[self.current_map_key].check_collision(rect):
+        m = self.maps[self.current_map_key]
+        if m.check_collision(rect):
             return True
-        for entity in self.enemy_trainers[self.current_map_key]:
-            if rect.colliderect(entity.animation.rect):
-                return True
-        npc_list = getattr(self.current_map, "npcs", [])
-        for npc in npc_list:
-            if rect.colliderect(npc.get_rect()):
-                return True
+        # Trainers and NPCs, only the spatial hash cells around rect
+        return m.entities.any_collides(rect)
 
-        return False
+    def sweep(self, rect: pg.Rect, dx: float, dy: float) -> SweepHit:
+        """Swept version of check_collision: first contact while moving rect by (dx, dy)"""
+        m = self.maps[self.current_map_key]
+        hit = m.sweep(rect, dx, dy)
+        for entity in m.entities.query(rect.union(rect.move(dx, dy))):
+            entity_hit = sweep_box(rect, dx, dy, m.entities.rect_of(entity))
+            if entity_hit.time < hit.time:
+                hit = entity_hit
+        return hit
     
     #shop
     def open_shop(self, shop):
@@ -171,6 +181,9 @@ class GameManager:
         for m in data["map"]:
             raw_data = m["enemy_trainers"]
             gm.enemy_trainers[m["path"]] = [EnemyTrainer.from_dict(t, gm) for t in raw_data]
+            for trainer in gm.enemy_trainers[m["path"]]:
+                maps[m["path"]].add_entity(trainer)
+                trainer.watch_from(maps[m["path"]].sight)
         
         Logger.info("Loading Player")
         if data.get("player"):
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class NetStats:
+    """Snapshot of the connection quality, safe to read from the game thread."""
+    connected: bool = False
+    rtt_ms: float = 0.0             # smoothed round-trip time
+    rtt_min_ms: float = 0.0
+    rtt_last_ms: float = 0.0
+    jitter_ms: float = 0.0          # mean deviation of the RTT samples
+    pings_lost: int = 0
+    bytes_in_per_s: float = 0.0
+    bytes_out_per_s: float = 0.0
+    msgs_in_per_s: dict[str, float] = field(default_factory=dict)
+    msgs_out_per_s: dict[str, float] = field(default_factory=dict)
+    snapshot_age_ms: float = -1.0   # -1 until the first players_update arrives
+    snapshot_delay_ms: float = -1.0 # server timestamp to arrival, -1 until the clock is synced
+    reconnects: int = 0
+    clock_synced: bool = False
+    clock_offset_ms: float = 0.0    # server clock minus local monotonic clock
+    clock_drift_ppm: float = 0.0
+    interp_delay_ms: float = 0.0
+
+
+class RttEstimator:
+    """RTT smoothing in the style of TCP (RFC 6298): srtt with alpha 1/8, rttvar with beta 1/4."""
+    ALPHA = 0.125
+    BETA = 0.25
+
+    def __init__(self) -> None:
+        self.srtt = 0.0
+        self.rttvar = 0.0
+        self.min_rtt = 0.0
+        self.last_rtt = 0.0
+        self.samples = 0
+
+    def add_sample(self, rtt: float) -> None:
+        self.last_rtt = rtt
+        if self.samples == 0:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+            self.min_rtt = rtt
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+            self.min_rtt = min(self.min_rtt, rtt)
+        self.samples += 1
+
+
+class TrafficMeter:
+    """
+    Counts bytes and messages per type, and turns them into per-second rates
+    over a rolling window. Written from the network thread, read from the game thread.
+    """
+    def __init__(self, window: float = 1.0) -> None:
+        self._lock = threading.Lock()
+        self._window = window
+        self._started = time.monotonic()
+        self._bytes = 0
+        self._msgs: Counter[str] = Counter()
+        self._bytes_rate = 0.0
+        self._msgs_rate: dict[str, float] = {}
+
+    def record(self, msg_type: str, n_bytes: int) -> None:
+        with self._lock:
+            self._bytes += n_bytes
+            self._msgs[msg_type] += 1
+            self._roll(time.monotonic())
+
+    def rates(self) -> tuple[float, dict[str, float]]:
+        with self._lock:
+            self._roll(time.monotonic())
+            return self._bytes_rate, dict(self._msgs_rate)
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self._started
+        if elapsed < self._window:
+            return
+        # If nothing was recorded for several windows, the rate must drop to zero
+        self._bytes_rate = self._bytes / elapsed
+        self._msgs_rate = {k: v / elapsed for k, v in self._msgs.items()}
+        self._bytes = 0
+        self._msgs.clear()
+        self._started = now
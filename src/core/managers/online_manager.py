@@ -5,8 +5,10 @@ import queue
 import collections
 import json
 from collections import deque
-from typing import Optional
+from typing import Callable, Optional
 from src.utils import Logger, GameSettings
+from .net_diagnostics import NetStats, RttEstimator, TrafficMeter
+from .clock_sync import ClockSync
 
 try:
     import websockets
@@ -17,6 +19,36 @@ except ImportError:
 from typing import Any
 
 
+def interpolate_snapshots(snapshots: deque[tuple[float, dict[int, dict]]], render_time: float) -> list[dict]:
+    """Remote players at render_time, lerped between the two (local time, {id: player}) snapshots around it"""
+    if render_time >= snapshots[-1][0]:
+        return list(snapshots[-1][1].values())
+    if render_time <= snapshots[0][0]:
+        return list(snapshots[0][1].values())
+
+    # Find the pair of snapshots that brackets render_time
+    older, newer = snapshots[0], snapshots[1]
+    for i in range(len(snapshots) - 1, 0, -1):
+        if snapshots[i - 1][0] <= render_time:
+            older, newer = snapshots[i - 1], snapshots[i]
+            break
+    t0, players0 = older
+    t1, players1 = newer
+    alpha = (render_time - t0) / (t1 - t0) if t1 > t0 else 1.0
+
+    result = []
+    for pid, p1 in players1.items():
+        p0 = players0.get(pid)
+        if p0 is None or p0["map"] != p1["map"]:
+            result.append(p1)
+            continue
+        p = dict(p1)
+        p["x"] = p0["x"] + (p1["x"] - p0["x"]) * alpha
+        p["y"] = p0["y"] + (p1["y"] - p0["y"]) * alpha
+        result.append(p)
+    return result
+
+
 class OnlineManager:
     list_players: list[dict]
     player_id: int
@@ -27,9 +59,15 @@ class OnlineManager:
     _stop_event: threading.Event
     _lock: threading.Lock
     _update_queue: queue.Queue
+    _input_queue: queue.Queue
     _chat_out_queue: queue.Queue
     _chat_messages: collections.deque
     _last_chat_id: int
+    # Diagnostics
+    _rtt: RttEstimator
+    _traffic_in: TrafficMeter
+    _traffic_out: TrafficMeter
+    _pending_pings: dict[int, float]
 
     def __init__(self):
         if websockets is None:
@@ -53,10 +91,41 @@ class OnlineManager:
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
         self._update_queue = queue.Queue(maxsize=10)
+        self._input_queue = queue.Queue(maxsize=240)
+        self._auth_state: dict | None = None     # latest server state of the local player
         self._chat_out_queue = queue.Queue(maxsize=50)
         self._chat_messages = deque(maxlen=200)
         self._last_chat_id = 0
 
+        # Diagnostics
+        self.ping_interval = 1.0        # seconds between application-level pings
+        self.ping_timeout = 5.0         # a ping without pong after this long counts as lost
+        self._rtt = RttEstimator()
+        self._traffic_in = TrafficMeter()
+        self._traffic_out = TrafficMeter()
+        self._pending_pings = {}
+        self._next_ping_id = 0
+        self._pings_lost = 0
+        self._last_snapshot_time = -1.0
+        self._last_snapshot_delay = -1.0
+        self._connections = 0
+
+        # Clock synchronization and remote player interpolation
+        self.clock = ClockSync()
+        # Remote players are drawn this far in the past (seconds). With adaptive_interp it follows
+        # the measured snapshot delay (mean + 2 deviations + one snapshot), never below min_interp_delay.
+        self.interp_delay = 0.1
+        self.min_interp_delay = 0.05
+        self.max_interp_delay = 0.5
+        self.adaptive_interp = True
+        self._snapshot_delay = RttEstimator()
+        self._snapshots: deque[tuple[float, dict[int, dict]]] = deque(maxlen=32)  # (local time, players)
+        self._snapshots_synced = False
+        # Called from the network thread with (local time, remote players) after every snapshot
+        self.snapshot_listener: Callable[[float, list[dict]], None] | None = None
+        # Called from the network thread with the message type after a "registered" or "chat_update"
+        self.event_listener: Callable[[str], None] | None = None
+
         Logger.info("OnlineManager initialized")
 
     def enter(self):
@@ -65,10 +134,43 @@ class OnlineManager:
     def exit(self):
         self.stop()
 
+    def poll(self) -> None:
+        """Nothing to drain here, the websocket thread updates the state directly"""
+
     def get_list_players(self) -> list[dict]:
-        """Get list of players"""
+        """Get list of players, interpolated between the two snapshots around now - interp_delay"""
         with self._lock:
-            return list(self.list_players)
+            if len(self._snapshots) < 2:
+                return list(self.list_players)
+            return interpolate_snapshots(self._snapshots, time.monotonic() - self.interp_delay)
+
+    def get_net_stats(self) -> NetStats:
+        """Get a snapshot of the connection quality (RTT, jitter, traffic, snapshot age)"""
+        bytes_in, msgs_in = self._traffic_in.rates()
+        bytes_out, msgs_out = self._traffic_out.rates()
+        with self._lock:
+            age = -1.0
+            if self._last_snapshot_time >= 0:
+                age = (time.monotonic() - self._last_snapshot_time) * 1000
+            return NetStats(
+                connected=self._ws is not None,
+                rtt_ms=self._rtt.srtt * 1000,
+                rtt_min_ms=self._rtt.min_rtt * 1000,
+                rtt_last_ms=self._rtt.last_rtt * 1000,
+                jitter_ms=self._rtt.rttvar * 1000,
+                pings_lost=self._pings_lost,
+                bytes_in_per_s=bytes_in,
+                bytes_out_per_s=bytes_out,
+                msgs_in_per_s=msgs_in,
+                msgs_out_per_s=msgs_out,
+                snapshot_age_ms=age,
+                snapshot_delay_ms=self._last_snapshot_delay * 1000,
+                reconnects=max(0, self._connections - 1),
+                clock_synced=self.clock.synced,
+                clock_offset_ms=self.clock.offset() * 1000,
+                clock_drift_ppm=self.clock.drift_ppm,
+                interp_delay_ms=self.interp_delay * 1000,
+            )
 
     def update(self, x: float, y: float, map_name: str,
                direction: str, moving: bool, anim: str, frame: int) -> bool:
@@ -91,6 +193,23 @@ class OnlineManager:
         except queue.Full:
             return False
 
+    def send_input(self, cmd: dict) -> bool:
+        """Queue a sequence-numbered input command. Unlike position updates these are never collapsed."""
+        if self.player_id == -1:
+            return False
+        try:
+            self._input_queue.put_nowait(cmd)
+            return True
+        except queue.Full:
+            return False
+
+    def pop_authoritative_state(self) -> dict | None:
+        """Latest server-simulated state of the local player ({ack, x, y, map}), once per snapshot"""
+        with self._lock:
+            state = self._auth_state
+            self._auth_state = None
+            return state
+
     def start(self) -> None:
         if self._ws_thread and self._ws_thread.is_alive():
             return
@@ -149,9 +268,13 @@ class OnlineManager:
                     self._ws = websocket
                     Logger.info("WebSocket connected")
                     reconnect_delay = 1.0  # Reset delay on successful connection
+                    with self._lock:
+                        self._connections += 1
+                        self._pending_pings.clear()
 
-                    # Start sender task
+                    # Start sender and ping tasks
                     sender_task = asyncio.create_task(self._ws_sender(websocket))
+                    ping_task = asyncio.create_task(self._ws_pinger(websocket))
 
                     # Handle incoming messages
                     try:
@@ -162,11 +285,12 @@ class OnlineManager:
                     except websockets.exceptions.ConnectionClosed:
                         Logger.warning("WebSocket connection closed")
                     finally:
-                        sender_task.cancel()
-                        try:
-                            await sender_task
-                        except asyncio.CancelledError:
-                            pass
+                        for task in (sender_task, ping_task):
+                            task.cancel()
+                            try:
+                                await task
+                            except asyncio.CancelledError:
+                                pass
 
             except Exception as e:
                 Logger.warning(f"WebSocket connection error: {e}, reconnecting in {reconnect_delay}s")
@@ -182,18 +306,50 @@ class OnlineManager:
         try:
             data = json.loads(message)
             msg_type = data.get("type")
+            self._traffic_in.record(str(msg_type), len(message))
 
             if msg_type == "registered":
                 self.player_id = int(data.get("id", -1))
                 Logger.info(f"OnlineManager registered with id={self.player_id}")
+                # Inputs queued for a previous connection belong to a player the server forgot
+                with self._lock:
+                    self._auth_state = None
+                try:
+                    while True:
+                        self._input_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                if self.event_listener is not None:
+                    self.event_listener(msg_type)
 
             elif msg_type == "players_update":
                 players_data = data.get("players", {})
+                now = time.monotonic()
+                # Place the snapshot on our own timeline using the server timestamp
+                snapshot_time = now
+                server_ts = data.get("timestamp")
+                if server_ts is not None and self.clock.synced:
+                    snapshot_time = min(now, self.clock.server_to_local(float(server_ts)))
                 with self._lock:
+                    if self.clock.synced and not self._snapshots_synced:
+                        # Earlier snapshots were stamped on arrival, not comparable anymore
+                        self._snapshots.clear()
+                        self._snapshots_synced = True
+                    if self._snapshots and snapshot_time <= self._snapshots[-1][0]:
+                        return  # Older than what we already have (reordered or duplicate)
                     filtered = []
                     for pid_str, player_data in players_data.items():
                         pid = int(pid_str)
-                        if pid != self.player_id:
+                        if pid == self.player_id:
+                            ack = int(player_data.get("ack", -1))
+                            if ack >= 0:
+                                self._auth_state = {
+                                    "ack": ack,
+                                    "x": float(player_data.get("x", 0)),
+                                    "y": float(player_data.get("y", 0)),
+                                    "map": str(player_data.get("map", "")),
+                                }
+                        else:
 
                             # HINT: This part might be helpful for direction change
                             # Maybe you can add other parameters?
@@ -208,6 +364,18 @@ class OnlineManager:
                                 "frame": int(player_data.get("frame", 0)),
                             })
                     self.list_players = filtered
+                    self._snapshots.append((snapshot_time, {p["id"]: p for p in filtered}))
+                    self._last_snapshot_time = now
+                    self._last_snapshot_delay = -1.0
+                    if self.clock.synced:
+                        self._last_snapshot_delay = now - snapshot_time
+                        self._snapshot_delay.add_sample(self._last_snapshot_delay)
+                        if self.adaptive_interp:
+                            d = self._snapshot_delay.srtt + 2 * self._snapshot_delay.rttvar + 1 / 60
+                            self.interp_delay = max(self.min_interp_delay, min(self.max_interp_delay, d))
+
+                if self.snapshot_listener is not None:
+                    self.snapshot_listener(snapshot_time, filtered)
 
             elif msg_type == "chat_update":
                 messages = data.get("messages", [])
@@ -217,6 +385,11 @@ class OnlineManager:
                         mid = int(m.get("id", self._last_chat_id))
                         if mid > self._last_chat_id:
                             self._last_chat_id = mid
+                if self.event_listener is not None:
+                    self.event_listener(msg_type)
+
+            elif msg_type == "pong":
+                self._handle_pong(data)
 
             elif msg_type == "error":
                 Logger.warning(f"Server error: {data.get('message', 'unknown')}")
@@ -258,9 +431,19 @@ class OnlineManager:
                             "frame": latest_update.get("frame"),
                         }
 
-                        await websocket.send(json.dumps(message))
+                        await self._send(websocket, message)
                         last_update = now
 
+                # Send every pending input, batched into one message
+                inputs = []
+                try:
+                    while True:
+                        inputs.append(self._input_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if inputs and self.player_id >= 0:
+                    await self._send(websocket, {"type": "player_input", "inputs": inputs})
+
                 # Send chat messages
                 try:
                     chat_text = self._chat_out_queue.get_nowait()
@@ -269,7 +452,7 @@ class OnlineManager:
                             "type": "chat_send",
                             "text": chat_text
                         }
-                        await websocket.send(json.dumps(message))
+                        await self._send(websocket, message)
                 except queue.Empty:
                     pass
 
@@ -279,6 +462,47 @@ class OnlineManager:
                 Logger.warning(f"WebSocket send error: {e}")
                 await asyncio.sleep(0.1)
 
+    async def _send(self, websocket: Any, message: dict) -> None:
+        """Send a message and account for it in the traffic counters"""
+        payload = json.dumps(message)
+        await websocket.send(payload)
+        self._traffic_out.record(str(message.get("type")), len(payload))
+
+    async def _ws_pinger(self, websocket: Any) -> None:
+        """Send application-level pings so RTT includes the server's message loop"""
+        # A quick burst first, so the clock is synchronized before the first snapshots matter
+        burst = 5
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            with self._lock:
+                ping_id = self._next_ping_id
+                self._next_ping_id += 1
+                self._pending_pings[ping_id] = now
+                # Expire pings whose pong never came back
+                for pid, sent in list(self._pending_pings.items()):
+                    if now - sent > self.ping_timeout:
+                        del self._pending_pings[pid]
+                        self._pings_lost += 1
+            try:
+                await self._send(websocket, {"type": "ping", "id": ping_id, "t0": now})
+            except Exception as e:
+                Logger.warning(f"WebSocket ping error: {e}")
+            if burst > 0:
+                burst -= 1
+                await asyncio.sleep(0.2)
+            else:
+                await asyncio.sleep(self.ping_interval)
+
+    def _handle_pong(self, data: dict) -> None:
+        now = time.monotonic()
+        with self._lock:
+            sent = self._pending_pings.pop(int(data.get("id", -1)), None)
+            if sent is None:
+                return  # Late or duplicate pong, already counted as lost
+            self._rtt.add_sample(now - sent)
+        if "t1" in data and "t2" in data:
+            self.clock.add_sample(sent, float(data["t1"]), float(data["t2"]), now)
+
     # -----------------------------
     # Chat API
     # -----------------------------
@@ -0,0 +1,336 @@
+import multiprocessing as mp
+import struct
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection, wait
+from src.utils import Logger, GameSettings
+from .net_diagnostics import NetStats
+from .online_manager import OnlineManager, interpolate_snapshots
+
+"""
+Online networking in a child process.
+
+The child runs a normal OnlineManager (websockets, JSON decoding, clock sync), so none
+of that competes with rendering for the GIL. Remote players go through shared memory,
+everything else (inputs, chat, stats, the local player's server state) through a Pipe.
+
+Shared memory is a ring of SLOTS snapshots:
+
+    header  : write_count u64, interp_delay f64
+    slot[i] : seq u64, time f64, count u32, pad u32, count * RECORD
+
+The writer fills slot write_count % SLOTS, bumping its seq to odd before and to even
+after (a seqlock), then increments write_count. The reader copies a slot and retries if
+seq was odd or changed meanwhile, so it never blocks the network process.
+"""
+
+SLOTS = 8
+MAX_PLAYERS = 512
+
+HEADER = struct.Struct("<Qd")
+SLOT_HEADER = struct.Struct("<QdII")
+# id, x, y, map name, direction, anim, moving, frame
+RECORD = struct.Struct("<iff24sBB?xH6x")
+SLOT_SIZE = SLOT_HEADER.size + MAX_PLAYERS * RECORD.size
+SHM_SIZE = HEADER.size + SLOTS * SLOT_SIZE
+
+DIRECTIONS = ("down", "left", "right", "up", "none")
+_DIRECTION_CODE = {name: i for i, name in enumerate(DIRECTIONS)}
+
+
+class SnapshotRing:
+    """Fixed-layout snapshot ring on top of a SharedMemory block (one writer, one reader)"""
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self.shm = shm
+        self.buf = shm.buf
+
+    def _slot_offset(self, index: int) -> int:
+        return HEADER.size + (index % SLOTS) * SLOT_SIZE
+
+    # -----------------------------
+    # Writer (network process)
+    # -----------------------------
+    def write(self, snapshot_time: float, players: list[dict], interp_delay: float) -> None:
+        write_count, _ = HEADER.unpack_from(self.buf, 0)
+        off = self._slot_offset(write_count)
+        seq = SLOT_HEADER.unpack_from(self.buf, off)[0]
+        count = min(len(players), MAX_PLAYERS)
+
+        SLOT_HEADER.pack_into(self.buf, off, seq + 1, snapshot_time, count, 0)
+        pos = off + SLOT_HEADER.size
+        for p in players[:count]:
+            RECORD.pack_into(
+                self.buf, pos,
+                p["id"], p["x"], p["y"], p["map"].encode()[:24],
+                _DIRECTION_CODE.get(p["direction"], 0), _DIRECTION_CODE.get(p["anim"], 0),
+                p["moving"], max(0, min(0xFFFF, p["frame"])),
+            )
+            pos += RECORD.size
+        SLOT_HEADER.pack_into(self.buf, off, seq + 2, snapshot_time, count, 0)
+        HEADER.pack_into(self.buf, 0, write_count + 1, interp_delay)
+
+    # -----------------------------
+    # Reader (game process)
+    # -----------------------------
+    def header(self) -> tuple[int, float]:
+        return HEADER.unpack_from(self.buf, 0)
+
+    def read(self, write_index: int) -> tuple[float, dict[int, dict]] | None:
+        """Decode one slot, or None if the writer overwrote it while we were copying"""
+        off = self._slot_offset(write_index)
+        for _ in range(3):
+            seq, snapshot_time, count, _ = SLOT_HEADER.unpack_from(self.buf, off)
+            if seq & 1:
+                continue
+            start = off + SLOT_HEADER.size
+            raw = bytes(self.buf[start:start + count * RECORD.size])
+            if SLOT_HEADER.unpack_from(self.buf, off)[0] != seq:
+                continue
+            players = {}
+            for pid, x, y, map_name, direction, anim, moving, frame in RECORD.iter_unpack(raw):
+                players[pid] = {
+                    "id": pid,
+                    "x": x,
+                    "y": y,
+                    "map": map_name.rstrip(b"\0").decode(),
+                    "direction": DIRECTIONS[direction],
+                    "moving": moving,
+                    "anim": DIRECTIONS[anim],
+                    "frame": frame,
+                }
+            return snapshot_time, players
+        return None
+
+
+def _network_process(conn: Connection, shm_name: str, server_url: str) -> None:
+    """Entry point of the child process"""
+    GameSettings.ONLINE_SERVER_URL = server_url
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = SnapshotRing(shm)
+    manager = OnlineManager()
+    send_lock = threading.Lock()
+
+    def send(message: tuple) -> None:
+        with send_lock:
+            conn.send(message)
+
+    def on_snapshot(snapshot_time: float, players: list[dict]) -> None:
+        ring.write(snapshot_time, players, manager.interp_delay)
+        state = manager.pop_authoritative_state()
+        if state is not None:
+            send(("auth", state))
+
+    last_chat_id = 0
+
+    def on_event(kind: str) -> None:
+        nonlocal last_chat_id
+        if kind == "registered":
+            send(("registered", manager.player_id))
+        elif kind == "chat_update":
+            # Only the messages the game has not seen yet
+            new_chat = [m for m in manager.get_recent_chat(200) if int(m.get("id", 0)) > last_chat_id]
+            if new_chat:
+                last_chat_id = max(int(m.get("id", 0)) for m in new_chat)
+                send(("chat", new_chat))
+
+    manager.snapshot_listener = on_snapshot
+    manager.event_listener = on_event
+    manager.start()
+
+    next_stats = 0.0
+    try:
+        while True:
+            # Sleep until the game sends a command or the stats are due, whatever comes
+            # from the server is forwarded by the websocket thread through the listeners
+            if wait([conn], timeout=max(0.0, next_stats - time.monotonic())):
+                while conn.poll():
+                    cmd, arg = conn.recv()
+                    if cmd == "update":
+                        manager.update(**arg)
+                    elif cmd == "input":
+                        manager.send_input(arg)
+                    elif cmd == "chat":
+                        manager.send_chat(arg)
+                    elif cmd == "stop":
+                        return
+
+            now = time.monotonic()
+            if now >= next_stats:
+                next_stats = now + 0.25
+                send(("stats", manager.get_net_stats()))
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        manager.snapshot_listener = None
+        manager.event_listener = None
+        manager.stop()
+        del ring
+        shm.close()
+
+
+class OnlineProcessManager:
+    """
+    Same interface as OnlineManager, but the network stack runs in a separate process
+    (GameSettings.ONLINE_SUBPROCESS). Reading remote players is a memory copy plus
+    struct unpacking, decoded snapshots are cached until a new one is published.
+    """
+    interp_delay: float
+    _process: mp.Process | None
+    _conn: Connection | None
+    _shm: shared_memory.SharedMemory | None
+    _ring: SnapshotRing | None
+
+    def __init__(self):
+        self._player_id = -1
+        self.interp_delay = 0.1
+        self._process = None
+        self._conn = None
+        self._shm = None
+        self._ring = None
+        self._auth_state: dict | None = None
+        self._chat_messages: deque[dict] = deque(maxlen=200)
+        self._stats = NetStats()
+        self._snapshots: deque[tuple[float, dict[int, dict]]] = deque(maxlen=SLOTS)
+        self._read_count = 0
+        Logger.info("OnlineProcessManager initialized")
+
+    def enter(self):
+        self.start()
+
+    def exit(self):
+        self.stop()
+
+    @property
+    def player_id(self) -> int:
+        """As of the last poll()"""
+        return self._player_id
+
+    def start(self) -> None:
+        if self._process and self._process.is_alive():
+            return
+        self._shm = shared_memory.SharedMemory(create=True, size=SHM_SIZE)
+        self._shm.buf[:HEADER.size] = bytes(HEADER.size)
+        self._ring = SnapshotRing(self._shm)
+        self._snapshots.clear()
+        self._read_count = 0
+
+        # spawn, not fork: the child must not inherit pygame's display and audio state
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_network_process,
+            args=(child_conn, self._shm.name, GameSettings.ONLINE_SERVER_URL),
+            name="OnlineNetwork",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        if self._conn:
+            try:
+                self._conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+        if self._process:
+            self._process.join(timeout=3)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+        if self._shm:
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        self._player_id = -1
+
+    def _send(self, cmd: str, arg) -> bool:
+        if self._conn is None:
+            return False
+        try:
+            self._conn.send((cmd, arg))
+            return True
+        except (BrokenPipeError, OSError):
+            Logger.warning("Network process is gone")
+            self._conn = None
+            return False
+
+    def poll(self) -> None:
+        """Drain the messages the network process sent since the last call (once per frame)"""
+        if self._conn is None:
+            return
+        try:
+            while self._conn.poll():
+                kind, arg = self._conn.recv()
+                if kind == "registered":
+                    self._player_id = arg
+                    self._auth_state = None
+                elif kind == "auth":
+                    self._auth_state = arg
+                elif kind == "chat":
+                    self._chat_messages.extend(arg)
+                elif kind == "stats":
+                    self._stats = arg
+        except (EOFError, OSError):
+            Logger.warning("Network process is gone")
+            self._conn = None
+
+    # -----------------------------
+    # Same API as OnlineManager
+    # -----------------------------
+    def get_list_players(self) -> list[dict]:
+        if self._ring is None:
+            return []
+        write_count, self.interp_delay = self._ring.header()
+        # Only decode what was published since the last frame, at most one ring's worth
+        for index in range(max(self._read_count, write_count - SLOTS), write_count):
+            snapshot = self._ring.read(index)
+            if snapshot is None:
+                continue
+            if self._snapshots and snapshot[0] <= self._snapshots[-1][0]:
+                # The clock got synchronized, earlier snapshots were stamped on arrival
+                self._snapshots.clear()
+            self._snapshots.append(snapshot)
+        self._read_count = write_count
+        if not self._snapshots:
+            return []
+        return interpolate_snapshots(self._snapshots, time.monotonic() - self.interp_delay)
+
+    def get_net_stats(self) -> NetStats:
+        return self._stats
+
+    def update(self, x: float, y: float, map_name: str,
+               direction: str, moving: bool, anim: str, frame: int) -> bool:
+        if self.player_id == -1:
+            return False
+        return self._send("update", {
+            "x": x, "y": y, "map_name": map_name, "direction": direction,
+            "moving": moving, "anim": anim, "frame": frame,
+        })
+
+    def send_input(self, cmd: dict) -> bool:
+        if self.player_id == -1:
+            return False
+        return self._send("input", cmd)
+
+    def pop_authoritative_state(self) -> dict | None:
+        state = self._auth_state
+        self._auth_state = None
+        return state
+
+    def send_chat(self, text: str) -> bool:
+        if self.player_id == -1:
+            return False
+        t = (text or "").strip()
+        if not t:
+            return False
+        return self._send("chat", t)
+
+    def get_recent_chat(self, limit: int = 50) -> list[dict]:
+        return list(self._chat_messages)[-limit:]
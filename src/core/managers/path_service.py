@@ -0,0 +1,104 @@
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+from src.utils import Logger
+from src.maps.pathfinding import Tile
+
+if TYPE_CHECKING:
+    from src.maps.world_graph import WorldGraph
+
+
+class PathTicket:
+    """Handle of a submitted request. Cancelling it drops the result, even if already computed."""
+
+    def __init__(self, owner: Any):
+        self.owner = owner
+        self.cancelled = False
+        self.done = False
+        self.result: Any = None
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class PathService:
+    """
+    Solves path requests on a worker thread so the game loop never waits for them.
+
+    Requests only get immutable inputs (WorldGraph snapshots, tiles), never a Map.
+    Callbacks run on the game thread, from poll(), which GameScene calls every frame.
+    A new request with the same owner (the player, a trainer...) cancels the previous one.
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue[tuple[PathTicket, Callable[[], Any], Callable[[Any], None]] | None] = queue.Queue()
+        self._done: queue.Queue[tuple[PathTicket, Callable[[Any], None]]] = queue.Queue()
+        self._latest: dict[int, PathTicket] = {}
+        self._thread: threading.Thread | None = None
+
+    def _ensure_started(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._worker, name="PathService", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread and self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join(timeout=1)
+        self._thread = None
+
+    def submit(self, job: Callable[[], Any], on_done: Callable[[Any], None], owner: Any = None) -> PathTicket:
+        ticket = PathTicket(owner)
+        if owner is not None:
+            previous = self._latest.get(id(owner))
+            if previous is not None:
+                previous.cancel()
+            self._latest[id(owner)] = ticket
+        self._ensure_started()
+        self._jobs.put((ticket, job, on_done))
+        return ticket
+
+    def plan_route(self, world: "WorldGraph", map_name: str, start: Tile, target: str,
+                   on_done: Callable[[tuple[list[str], list[Tile]]], None], owner: Any = None) -> PathTicket:
+        """Maps to go through to reach target and the tile path of the first leg (WorldGraph.route)"""
+        snapshot = world.snapshot()
+        return self.submit(lambda: world.route(snapshot, map_name, start, target), on_done, owner)
+
+    def find_reachable(self, world: "WorldGraph", map_name: str, start: Tile,
+                       on_done: Callable[[list[str]], None], owner: Any = None) -> PathTicket:
+        """Every map reachable from start (WorldGraph.reachable_from)"""
+        snapshot = world.snapshot()
+        return self.submit(lambda: world.reachable_from(snapshot, map_name, start), on_done, owner)
+
+    def poll(self) -> int:
+        """Run the callbacks of finished requests, returns how many were delivered"""
+        delivered = 0
+        while True:
+            try:
+                ticket, on_done = self._done.get_nowait()
+            except queue.Empty:
+                return delivered
+            if self._latest.get(id(ticket.owner)) is ticket:
+                del self._latest[id(ticket.owner)]
+            if ticket.cancelled:
+                continue
+            on_done(ticket.result)
+            delivered += 1
+
+    def _worker(self) -> None:
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                return
+            ticket, job, on_done = item
+            if ticket.cancelled:
+                continue
+            try:
+                ticket.result = job()
+            except Exception as e:
+                Logger.warning(f"Path request failed: {e}")
+                ticket.result = []
+            ticket.done = True
+            self._done.put((ticket, on_done))
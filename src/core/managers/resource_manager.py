@@ -1,34 +1,135 @@
+import os
 import pygame as pg
+from collections import OrderedDict
 from src.utils import load_img, load_font, load_sound
 
+
+def _surface_bytes(surface: pg.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
 class ResourceManager:
     """
     Make sure you are not loading the resource twice
     If the resource is already loaded, you can use the loaded image instead of loading it again.
     """
-    def __init__(self) -> None:
+    def __init__(self, max_texts: int = 512, max_scaled_bytes: int = 64 * 1024 * 1024) -> None:
         self._images: dict[str, pg.Surface] = {}
+        # Scaled copies of the images, least recently used first, dropped past max_scaled_bytes
+        self._scaled: OrderedDict[tuple[str, tuple[int, int]], pg.Surface] = OrderedDict()
+        self.max_scaled_bytes = max_scaled_bytes
+        self.scaled_bytes = 0
+        self.image_hits = 0
+        self.image_misses = 0
+        # Sliced and scaled animation frames, shared by every Animation of the same sheet
+        self._frames: dict[tuple, dict[str, list[pg.Surface]]] = {}
         self._sounds: dict[str, pg.mixer.Sound] = {}
-        self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._fonts: dict[tuple[str | None, int], pg.font.Font] = {}
+        # Rendered strings, least recently used first
+        self._texts: OrderedDict[tuple, pg.Surface] = OrderedDict()
+        self.max_texts = max_texts
+        self.text_hits = 0
+        self.text_misses = 0
 
-    def get_image(self, path: str) -> pg.Surface:
+    def get_image(self, path: str, size: tuple[int, int] | None = None) -> pg.Surface:
+        """
+        The image at path, scaled to size if given. Scaling is done once per size.
+        The surface is shared, blit it but don't draw on it.
+        """
         if path not in self._images:
             self._images[path] = load_img(path)
-        return self._images[path]
+        image = self._images[path]
+        if size is None or image.get_size() == tuple(size):
+            return image
+        key = (path, (size[0], size[1]))
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            self._scaled.move_to_end(key)
+            self.image_hits += 1
+            return scaled
+        self.image_misses += 1
+        scaled = pg.transform.scale(image, size)
+        self._scaled[key] = scaled
+        self.scaled_bytes += _surface_bytes(scaled)
+        # Keep at least the one just made, even if it alone is over the budget
+        while self.scaled_bytes > self.max_scaled_bytes and len(self._scaled) > 1:
+            _, old = self._scaled.popitem(last=False)
+            self.scaled_bytes -= _surface_bytes(old)
+        return scaled
+
+    def get_frames(self, path: str, rows: list[str], n_keyframes: int,
+                   size: tuple[int, int]) -> dict[str, list[pg.Surface]]:
+        """Frames of a sprite sheet (one row per name, n_keyframes columns) scaled to size"""
+        key = (path, tuple(rows), n_keyframes, (size[0], size[1]))
+        frames = self._frames.get(key)
+        if frames is not None:
+            return frames
+        sheet = self.get_image(path)
+        frame_w = sheet.get_width() // n_keyframes
+        frame_h = sheet.get_height() // len(rows)
+        frames = {}
+        for r, name in enumerate(rows):
+            frames[name] = [
+                pg.transform.smoothscale(sheet.subsurface(pg.Rect(c * frame_w, r * frame_h, frame_w, frame_h)), size)
+                for c in range(n_keyframes)
+            ]
+        self._frames[key] = frames
+        return frames
+
+    def image_stats(self) -> dict[str, int]:
+        return {"hits": self.image_hits, "misses": self.image_misses,
+                "cached": len(self._scaled), "bytes": self.scaled_bytes}
 
     def get_sound(self, path: str) -> pg.mixer.Sound:
         if path not in self._sounds:
             self._sounds[path] = load_sound(path)
         return self._sounds[path]
 
-    def get_font(self, path: str, size: int) -> pg.font.Font:
+    def get_font(self, path: str | None, size: int) -> pg.font.Font:
+        """
+        path: a font file path ("assets/fonts/x.ttf"), a file in assets/fonts ("x.ttf"),
+        a system font name ("Arial"), or None for pygame's default font
+        """
         key = (path, size)
         if key not in self._fonts:
-            self._fonts[key] = load_font(path, size)
+            if path is None:
+                self._fonts[key] = pg.font.Font(None, size)
+            elif os.path.isfile(path):
+                self._fonts[key] = pg.font.Font(path, size)
+            elif "." not in path:
+                self._fonts[key] = pg.font.SysFont(path, size)
+            else:
+                self._fonts[key] = load_font(path, size)
         return self._fonts[key]
 
+    def render_text(self, text: str, size: int, color: tuple = (0, 0, 0),
+                    font: str | None = None, antialias: bool = True) -> pg.Surface:
+        """
+        Font.render, but each string is only rendered once while it keeps being drawn.
+        The surface is shared, blit it but don't draw on it.
+        """
+        key = (font, size, text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            self.text_hits += 1
+            return surface
+        self.text_misses += 1
+        surface = self.get_font(font, size).render(text, antialias, color)
+        self._texts[key] = surface
+        if len(self._texts) > self.max_texts:
+            self._texts.popitem(last=False)
+        return surface
+
+    def text_stats(self) -> dict[str, int]:
+        return {"hits": self.text_hits, "misses": self.text_misses, "cached": len(self._texts)}
+
     def clear(self) -> None:
         """Clear all cached assets (useful when switching levels)."""
         self._images.clear()
+        self._scaled.clear()
+        self._frames.clear()
+        self.scaled_bytes = 0
         self._sounds.clear()
         self._fonts.clear()
+        self._texts.clear()
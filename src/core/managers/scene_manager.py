@@ -19,6 +19,7 @@ class SceneManager:
 
         self.fade_surface = pg.Surface((1280, 720)) 
         self.fade_surface.fill((0, 0, 0))
+        self._full_redraw = True        # first frame, and the one after a fade
         
     def register_scene(self, name: str, scene: Scene) -> None:
         self._scenes[name] = scene
@@ -47,6 +48,12 @@ class SceneManager:
         if self._current_scene:
             self._current_scene.update(dt)
             
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """Regions the next draw changes, None when the whole screen has to be redrawn"""
+        if self._full_redraw or self.transition_active or self._current_scene is None:
+            return None
+        return self._current_scene.dirty_rects()
+
     def draw(self, screen: pg.Surface) -> None:
         
         if self._current_scene:
@@ -54,6 +61,8 @@ class SceneManager:
         if self.transition_active:
             self.fade_surface.set_alpha(int(self.transition_alpha))
             screen.blit(self.fade_surface, (0, 0))
+        # The fade covers the whole screen, so the frame after it ends is a full one too
+        self._full_redraw = self.transition_active
             
     def _perform_scene_switch(self) -> None:
         if self._next_scene is None:
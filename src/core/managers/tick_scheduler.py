@@ -0,0 +1,64 @@
+import itertools
+import pygame as pg
+from typing import Any, Iterable
+
+from src.utils import GameSettings, PositionCamera
+
+
+class TickScheduler:
+    """
+    Level of detail for entity updates, by distance from the camera:
+      - on screen: updated every frame
+      - near (within near_margin of the screen): updated every near_interval frames
+      - far: suspended
+    Skipped frames are not lost, the time is owed to the entity and given back as one
+    bigger dt on its next update (capped by max_catch_up so a long sleep stays cheap).
+    Entities just need update(dt) and get_rect().
+    """
+
+    ON_SCREEN, NEAR, FAR = 0, 1, 2
+
+    def __init__(self, near_margin: int = GameSettings.TILE_SIZE * 8, near_interval: int = 4,
+                 max_catch_up: float = 2.0):
+        self.near_margin = near_margin
+        self.near_interval = near_interval
+        self.max_catch_up = max_catch_up
+        self._owed: dict[Any, float] = {}
+        self._phase: dict[Any, int] = {}    # spreads the near ticks over different frames
+        self._next_phase = itertools.count()
+        self._frame = 0
+        self.tier_counts = [0, 0, 0]        # entities per tier on the last frame
+
+    def tier(self, rect: pg.Rect, view: pg.Rect) -> int:
+        if rect.colliderect(view):
+            return self.ON_SCREEN
+        if rect.colliderect(view.inflate(self.near_margin * 2, self.near_margin * 2)):
+            return self.NEAR
+        return self.FAR
+
+    def update(self, entities: Iterable[Any], camera: PositionCamera, dt: float) -> None:
+        self._frame += 1
+        view = pg.Rect(int(camera.x), int(camera.y), GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+        counts = [0, 0, 0]
+        for entity in entities:
+            owed = self._owed.get(entity, 0.0) + dt
+            tier = self.tier(entity.get_rect(), view)
+            counts[tier] += 1
+            if tier == self.NEAR:
+                phase = self._phase.get(entity)
+                if phase is None:
+                    phase = self._phase[entity] = next(self._next_phase)
+                run = (self._frame + phase) % self.near_interval == 0
+            else:
+                run = tier == self.ON_SCREEN
+            if run:
+                self._owed.pop(entity, None)
+                entity.update(min(owed, self.max_catch_up))
+            else:
+                self._owed[entity] = owed
+        self.tier_counts = counts
+
+    def clear(self) -> None:
+        """Drop the owed time and phases, call when the ticked entities are replaced (map switch, load)"""
+        self._owed.clear()
+        self._phase.clear()
@@ -1,6 +1,7 @@
-from .managers import InputManager, ResourceManager, SceneManager, SoundManager
+from .managers import InputManager, ResourceManager, SceneManager, SoundManager, PathService
 
 input_manager = InputManager()
 resource_manager = ResourceManager()
 scene_manager = SceneManager()
 sound_manager = SoundManager()
+path_service = PathService()
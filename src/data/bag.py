@@ -2,9 +2,8 @@ import pygame as pg
 import json
 from src.utils import GameSettings,Position
 from src.utils.definition import Monster, Item
-from src.interface.components import Button
-from src.core.services import input_manager
-from src.sprites import Sprite
+from src.interface.components import Button, Panel
+from src.core.services import input_manager, resource_manager
 
 
 class Bag:
@@ -36,9 +35,7 @@ class Bag:
             40, 40,
             self.toggle
         )
-        self.font_title = pg.font.Font(None, 50)
-        self.font_small = pg.font.Font(None, 21)
-        self.font_tiny = pg.font.Font(None, 18)
+        self.panel = Panel((550, 500))
     def use_pokeball(self):
         for item in self._items_data:
             if item["name"].lower() == "pokeball":
@@ -76,78 +73,73 @@ class Bag:
             if mouse_wheel != 0 :
             
                 self.scroll += mouse_wheel * self.scroll_speed
-                # Clamp scroll so we don’t scroll too far
-                self.scroll = min(0,max(self.scroll,self.max_scroll)) 
-        
-
-    def draw(self, screen: pg.Surface):
+                self._clamp_scroll()
+
+    def _clamp_scroll(self):
+        #scrollable space (item list height - display), 45 px per item
+        self.max_scroll = min(0, self.scroll_area.height - len(self._items_data) * 45)
+        # Clamp scroll so we don’t scroll too far
+        self.scroll = min(0, max(self.scroll, self.max_scroll))
+
+    def panel_state(self) -> tuple:
+        """Everything the panel shows, it is only repainted when this changes"""
+        # Items can be used or sold while the bag is closed
+        self._clamp_scroll()
+        monsters = tuple((m["name"], m["level"], m.get("exp", 0), m["hp"], m["max_hp"], m["sprite_path"], m.get("type"))
+                         for m in self._monsters_data)
+        items = tuple((i["name"], i["count"], i["sprite_path"]) for i in self._items_data)
+        return self.scroll, self.close_button.img_button, monsters, items
+
+    def draw(self, screen: pg.Surface, dim: bool = True):
         if not self.visible:
             return
-        # --- Dim background ---
-        dim = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
-        dim.fill((0, 0, 0, 160))
-        screen.blit(dim, (0, 0))
-        
+        self.panel.draw(screen, self.panel_state(), self._paint, dim)
 
-        # Panel
-        panel_width, panel_height = 550, 500
-        panel_x = (GameSettings.SCREEN_WIDTH - panel_width) // 2
-        panel_y = (GameSettings.SCREEN_HEIGHT - panel_height) // 2
-        panel_rect = pg.Rect(panel_x, panel_y, panel_width, panel_height)
-
-        # Shadow
-        pg.draw.rect(screen, (50, 50, 50), panel_rect.move(6, 6), border_radius=20)
-        pg.draw.rect(screen, (255, 165, 0), panel_rect, border_radius=20)
-        pg.draw.rect(screen, (0, 0, 0), panel_rect, 3, border_radius=20)
+    def _paint(self, surface: pg.Surface):
+        panel_rect = self.panel.rect
+        panel_x, panel_y = panel_rect.topleft
 
         # Title
-        title = self.font_title.render("Bag", True, (0, 0, 0))
-        screen.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 30))
+        title = resource_manager.render_text("Bag", 50)
+        surface.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 30))
         #close button
-        self.close_button.draw(screen)
+        self.close_button.draw(surface)
 
         #monster 
         y_offset = panel_y + 82
         for monster in self._monsters_data:
             #monster white box
             card = pg.Rect(panel_x + 25, y_offset, 230, 60)
-            pg.draw.rect(screen, (255, 255, 255), card, border_radius=10)
-            pg.draw.rect(screen, (0, 0, 0), card, 2, border_radius=10)
+            pg.draw.rect(surface, (255, 255, 255), card, border_radius=10)
+            pg.draw.rect(surface, (0, 0, 0), card, 2, border_radius=10)
             #monster image 
-            sprite = Sprite("ingame_ui/"+monster["sprite_path"],(45, 45))
-            sprite.update_pos(Position(card.left + 15, card.centery - 26))
-            sprite.draw(screen)
+            surface.blit(resource_manager.get_image("ingame_ui/" + monster["sprite_path"], (45, 45)),
+                         (card.left + 15, card.centery - 26))
             # --- Element Icon ---
             element_type = monster.get("type", None)
             if element_type in self.element_icons:
                 icon_path = self.element_icons[element_type]
-                elem_icon = Sprite(icon_path, (22, 22))
-                elem_icon.update_pos(Position(card.right - 30, card.top + 3))
-                elem_icon.draw(screen)
+                surface.blit(resource_manager.get_image(icon_path, (22, 22)), (card.right - 30, card.top + 3))
             #monster name
-            name = self.font_small.render(monster["name"], True, (0, 0, 0))
-            screen.blit(name, (card.left + 80, card.top + 7))
+            name = resource_manager.render_text(monster["name"], 21)
+            surface.blit(name, (card.left + 80, card.top + 7))
             #level
-            level = self.font_small.render(f"Lv.{monster['level']}", True, (0, 0, 0))
-            screen.blit(level, (card.right - 60, card.top + 7))
+            level = resource_manager.render_text(f"Lv.{monster['level']}", 21)
+            surface.blit(level, (card.right - 60, card.top + 7))
             #exp
-            exp_text = self.font_tiny.render(
-                f"EXP: {monster.get('exp', 0)}/{10 + (monster['level'] - 1) * 5}",
-                True,
-                (0, 0, 0)
-            )
-            screen.blit(exp_text, (card.left + 80, card.top + 22))
+            exp_text = resource_manager.render_text(f"EXP: {monster.get('exp', 0)}/{10 + (monster['level'] - 1) * 5}", 18)
+            surface.blit(exp_text, (card.left + 80, card.top + 22))
             #max hp
             hp_bg = pg.Rect(card.left + 85, card.top + 45, 130, 10)
-            pg.draw.rect(screen, (0, 0, 0), hp_bg, 2)
+            pg.draw.rect(surface, (0, 0, 0), hp_bg, 2)
             #hp 
             hp_ratio = monster["hp"] / monster["max_hp"]
             hp_fill = pg.Rect(hp_bg.left, hp_bg.top, int(130 * hp_ratio), 10)
-            pg.draw.rect(screen, (50, 200, 50), hp_fill)
-            pg.draw.rect(screen, (0, 0, 0), hp_fill, 2)
+            pg.draw.rect(surface, (50, 200, 50), hp_fill)
+            pg.draw.rect(surface, (0, 0, 0), hp_fill, 2)
             #hp text
-            hp_text = self.font_small.render(f"{monster['hp']}/{monster['max_hp']}", True, (0, 0, 0))
-            screen.blit(
+            hp_text = resource_manager.render_text(f"{monster['hp']}/{monster['max_hp']}", 21)
+            surface.blit(
                 hp_text,
                 (
                     hp_bg.centerx - hp_text.get_width() // 2,  
@@ -159,31 +151,26 @@ class Bag:
 
         #item (scrollable)
         item_area = pg.Rect(panel_x + 285, panel_y + 90, 230, 360)
-        item_surface = pg.Surface((item_area.width, item_area.height), pg.SRCALPHA)
-        #item list long/heigth
-        total_height = len(self._items_data) * 45
-        #scrollable space (total height - display)
-        self.max_scroll = min(0, item_area.height - total_height)
 
-        y = self.scroll
+        #drawn straight on the panel, clipped to the list area
+        clip = surface.get_clip()
+        surface.set_clip(item_area.clip(clip))
+        y = item_area.top + self.scroll
         for item in self._items_data:
-            icon = Sprite(item["sprite_path"],(30, 30))
-            icon.update_pos(Position(10, y))
-            icon.draw(item_surface)
+            surface.blit(resource_manager.get_image(item["sprite_path"], (30, 30)), (item_area.left + 10, y))
             
 
-            name = self.font_small.render(item["name"], True, (0, 0, 0))
-            item_surface.blit(name, (60, y + 10))
+            name = resource_manager.render_text(item["name"], 21)
+            surface.blit(name, (item_area.left + 60, y + 10))
 
-            amount = self.font_small.render(str(item["count"]), True, (0, 0, 0))
+            amount = resource_manager.render_text(str(item["count"]), 21)
             rect = amount.get_rect()
-            rect.right = item_area.width - 10
+            rect.right = item_area.right - 10
             rect.top = y + 10
-            item_surface.blit(amount, rect)
+            surface.blit(amount, rect)
 
             y += 45
-
-        screen.blit(item_surface, item_area.topleft)
+        surface.set_clip(clip)
         
 
     def to_dict(self) -> dict[str, object]:
@@ -1,9 +1,8 @@
 import pygame as pg
 import json
 from src.utils import GameSettings,Position
-from src.sprites import Sprite
-from src.interface.components import Button
-from src.core.services import input_manager
+from src.interface.components import Button, Panel
+from src.core.services import input_manager, resource_manager
 
 class PCBox:
     def __init__(self, monsters: list[dict] | None = None):
@@ -12,8 +11,6 @@ class PCBox:
         self.visible = False
         self.gm = None
         
-        self.font_title = pg.font.Font(None, 50)
-        self.font_small = pg.font.Font(None, 22)
 
         self.selected_sourc= None
         self.selected_index= None
@@ -26,6 +23,7 @@ class PCBox:
         self.slot_size = 75
         self.slot_margin = 6
         self.pc_slot_rects= []
+        self.panel = Panel((self.panel_width, self.panel_height))
 
         self._build_layout()
 
@@ -195,38 +193,35 @@ class PCBox:
         self.selected_source = None
         self.selected_index = None
 
-    def draw(self, screen: pg.Surface):
+    def panel_state(self) -> tuple:
+        """Everything the panel shows, it is only repainted when this changes"""
+        party_list = self.gm.bag._monsters_data if self.gm and self.gm.bag else []
+        party = tuple((m["name"], m["level"], m["sprite_path"]) for m in party_list)
+        box = tuple(m["sprite_path"] for m in self.monsters)
+        return self.selected_source, self.selected_index, self.close_button.img_button, party, box
+
+    def draw(self, screen: pg.Surface, dim: bool = True):
         if not self.visible :
             return
+        self.panel.draw(screen, self.panel_state(), self._paint, dim)
 
-        sw, sh = GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT
-        panel_x = (sw - self.panel_width) // 2
-        panel_y = (sh - self.panel_height) // 2
-        panel_rect = pg.Rect(panel_x, panel_y, self.panel_width, self.panel_height)
-        
-        # dim background
-        dim = pg.Surface((sw, sh), pg.SRCALPHA)
-        dim.fill((0, 0, 0, 160))
-        screen.blit(dim, (0, 0))
-
-        # panel background + border 
-        pg.draw.rect(screen, (50, 50, 50), panel_rect.move(6, 6), border_radius=20)
-        pg.draw.rect(screen, (255, 165, 0), panel_rect, border_radius=20)
-        pg.draw.rect(screen, (0, 0, 0), panel_rect, 3, border_radius=20)
+    def _paint(self, surface: pg.Surface):
+        panel_rect = self.panel.rect
+        panel_x, panel_y = panel_rect.topleft
 
         #close button
-        self.close_button.draw(screen)
+        self.close_button.draw(surface)
 
         # title
-        title = self.font_title.render("PC Box", True, (0, 0, 0))
-        screen.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 25))
+        title = resource_manager.render_text("PC Box", 50)
+        surface.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 25))
 
         # label party
-        label_party = self.font_small.render("Party", True, (0, 0, 0))
-        screen.blit(label_party, (panel_x + 60, panel_y + 75))
+        label_party = resource_manager.render_text("Party", 22)
+        surface.blit(label_party, (panel_x + 60, panel_y + 75))
         # label box
-        label_box = self.font_small.render("Box", True, (0, 0, 0))
-        screen.blit(label_box, (panel_x + 355, panel_y + 75))
+        label_box = resource_manager.render_text("Box", 22)
+        surface.blit(label_box, (panel_x + 355, panel_y + 75))
 
         # draw party list
         party_list = self.gm.bag._monsters_data if self.gm and self.gm.bag else []
@@ -235,28 +230,27 @@ class PCBox:
             if self.selected_source == "party" and self.selected_index == i:
                 border_color = (255,0, 0)
 
-            pg.draw.rect(screen, (255, 255, 255), rect, border_radius=10)
-            pg.draw.rect(screen, border_color, rect, 2, border_radius=10)
+            pg.draw.rect(surface, (255, 255, 255), rect, border_radius=10)
+            pg.draw.rect(surface, border_color, rect, 2, border_radius=10)
 
             if i < len(party_list):
                 mon = party_list[i]
 
                 # sprite
                 try:
-                    sprite = Sprite("ingame_ui/" + mon["sprite_path"],(45, 45))
-                    sprite.update_pos(Position(rect.left + 8, rect.top + 5))
-                    sprite.draw(screen)
+                    surface.blit(resource_manager.get_image("ingame_ui/" + mon["sprite_path"], (45, 45)),
+                                 (rect.left + 8, rect.top + 5))
                     
                 except Exception:
                     pass
 
                 # name
-                name = self.font_small.render(mon["name"], True, (0, 0, 0))
-                screen.blit(name, (rect.left + 65, rect.top + 10))
+                name = resource_manager.render_text(mon["name"], 22)
+                surface.blit(name, (rect.left + 65, rect.top + 10))
 
                 # level
-                level = self.font_small.render(f"Lv.{mon['level']}", True, (0, 0, 0))
-                screen.blit(level, (rect.left + 65, rect.top + 30))
+                level = resource_manager.render_text(f"Lv.{mon['level']}", 22)
+                surface.blit(level, (rect.left + 65, rect.top + 30))
 
         # draw PC grid
         for i, rect in enumerate(self.pc_slot_rects):
@@ -264,34 +258,33 @@ class PCBox:
             if self.selected_source == "pc" and self.selected_index == i:
                 border_color = (255, 0, 0)
 
-            pg.draw.rect(screen, (255, 255, 255), rect, border_radius=8)
-            pg.draw.rect(screen, border_color, rect, 2, border_radius=8)
+            pg.draw.rect(surface, (255, 255, 255), rect, border_radius=8)
+            pg.draw.rect(surface, border_color, rect, 2, border_radius=8)
 
             if i < len(self.monsters):
                 mon = self.monsters[i]
                 try:
-                    sprite = Sprite("ingame_ui/" + mon["sprite_path"],(60, 60))
-                    sprite.rect.center = rect.center
-                    sprite.draw(screen)
+                    image = resource_manager.get_image("ingame_ui/" + mon["sprite_path"], (60, 60))
+                    surface.blit(image, image.get_rect(center=rect.center))
                     
                 except Exception:
                     pass
 
         # withdraw button
-        pg.draw.rect(screen, (255, 255, 255), self.btn_withdraw_rect, border_radius=10)
-        pg.draw.rect(screen, (0, 0, 0), self.btn_withdraw_rect, 2, border_radius=10)
-        label = self.font_small.render("Withdraw", True, (0, 0, 0))
-        screen.blit(
+        pg.draw.rect(surface, (255, 255, 255), self.btn_withdraw_rect, border_radius=10)
+        pg.draw.rect(surface, (0, 0, 0), self.btn_withdraw_rect, 2, border_radius=10)
+        label = resource_manager.render_text("Withdraw", 22)
+        surface.blit(
             label,
             (
                 self.btn_withdraw_rect.centerx - label.get_width() // 2,
                 self.btn_withdraw_rect.centery - label.get_height() // 2
             ))
         #deposit button
-        pg.draw.rect(screen, (255, 255, 255), self.btn_deposit_rect, border_radius=10)
-        pg.draw.rect(screen, (0, 0, 0), self.btn_deposit_rect, 2, border_radius=10)
-        label = self.font_small.render("Deposit", True, (0, 0, 0))
-        screen.blit(
+        pg.draw.rect(surface, (255, 255, 255), self.btn_deposit_rect, border_radius=10)
+        pg.draw.rect(surface, (0, 0, 0), self.btn_deposit_rect, 2, border_radius=10)
+        label = resource_manager.render_text("Deposit", 22)
+        surface.blit(
             label,
             (
                 self.btn_deposit_rect.centerx - label.get_width() // 2,
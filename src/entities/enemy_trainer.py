@@ -9,6 +9,14 @@ from src.sprites import Sprite
 from src.core import GameManager
 from src.core.services import input_manager, scene_manager
 from src.utils import GameSettings, Direction, Position, PositionCamera
+from src.maps.sight import SightIndex
+
+_SIGHT_STEPS = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+}
 
 
 class EnemyTrainerClassification(Enum):
@@ -24,8 +32,10 @@ class EnemyTrainer(Entity):
     max_tiles: int | None
     _movement: IdleMovement
     warning_sign: Sprite
-    detected: bool
+    detected: bool      # player is on one of the sight tiles, set by the map's SightIndex
     los_direction: Direction
+    sight: SightIndex | None
+    sight_tiles: int = 2    # trainer sees 2 tiles ahead
 
     @override
     def __init__(
@@ -38,6 +48,7 @@ class EnemyTrainer(Entity):
         facing: Direction | None = None,
     ) -> None:
         super().__init__(x, y, game_manager)
+        self.sight = None
         self.classification = classification
         self.max_tiles = max_tiles
         if classification == EnemyTrainerClassification.STATIONARY:
@@ -54,7 +65,6 @@ class EnemyTrainer(Entity):
     @override
     def update(self, dt: float) -> None:
         self._movement.update(self, dt)
-        self._has_los_to_player()
         #inside rect, prees f, enter battle
         if self.detected and input_manager.key_pressed(pygame.K_f):
             battle = scene_manager.get_scene("battle")
@@ -62,6 +72,7 @@ class EnemyTrainer(Entity):
             scene_manager.change_scene("battle")
             pass
         self.animation.update_pos(self.position)
+        self._sync_spatial()
 
     @override
     def draw(self, screen: pygame.Surface, camera: PositionCamera) -> None:
@@ -69,10 +80,10 @@ class EnemyTrainer(Entity):
         #inside invis rect (line of sight) draw !
         if self.detected:
             self.warning_sign.draw(screen, camera)
-        if GameSettings.DRAW_HITBOXES:
-            los_rect = self._get_los_rect()
-            if los_rect is not None:
-                pygame.draw.rect(screen, (255, 255, 0), camera.transform_rect(los_rect), 1)
+        if GameSettings.DRAW_HITBOXES and self.sight is not None:
+            TILE = GameSettings.TILE_SIZE
+            for tx, ty in self.sight.tiles_of(self):
+                pygame.draw.rect(screen, (255, 255, 0), camera.transform_rect(pygame.Rect(tx * TILE, ty * TILE, TILE, TILE)), 1)
 
     def _set_direction(self, direction: Direction) -> None:
         self.direction = direction
@@ -85,62 +96,25 @@ class EnemyTrainer(Entity):
         else:
             self.animation.switch("up")
         self.los_direction = self.direction
+        self._update_sight()
 
-    def _get_los_rect(self) -> pygame.Rect | None:
-        npc_rect = self.get_rect()
-
-        tile = GameSettings.TILE_SIZE
-        los_length = tile * 2  # Trainer sees 2 tiles ahead
-        los_width = tile // 4  
-        #make a rect in front of enemy trainer line of sight
-        if self.direction == Direction.UP:
-            return pygame.Rect(
-                npc_rect.centerx - los_width // 2,
-                npc_rect.top - los_length,
-                los_width,
-                los_length
-            )
-
-        elif self.direction == Direction.DOWN:
-            return pygame.Rect(
-                npc_rect.centerx - los_width // 2,
-                npc_rect.bottom,
-                los_width,
-                los_length
-            )
-
-        elif self.direction == Direction.LEFT:
-            return pygame.Rect(
-                npc_rect.left - los_length,
-                npc_rect.centery - los_width // 2,
-                los_length,
-                los_width
-            )
+    def watch_from(self, sight: SightIndex) -> None:
+        """Register the tiles in front of the trainer, the index sets self.detected"""
+        self.sight = sight
+        self._update_sight()
 
-        elif self.direction == Direction.RIGHT:
-            return pygame.Rect(
-                npc_rect.right,
-                npc_rect.centery - los_width // 2,
-                los_length,
-                los_width
-            )
-
-        return None
-        
+    @override
+    def _tile_changed(self) -> None:
+        self._update_sight()
 
-    def _has_los_to_player(self) -> None:
-        player = self.game_manager.player
-        if player is None:
-            self.detected = False
+    def _update_sight(self) -> None:
+        if self.sight is None:
             return
-        los_rect = self._get_los_rect()
-        if los_rect is None:
-            self.detected = False
+        step = _SIGHT_STEPS.get(self.direction)
+        if step is None:
+            self.sight.unwatch(self)    # not facing anywhere, sees nothing
             return
-        if los_rect.colliderect(player.get_rect()):
-            self.detected = True
-        else:
-            self.detected = False
+        self.sight.watch(self, self._position_tile(), step, self.sight_tiles)
 
     @classmethod
     @override
@@ -4,6 +4,10 @@ from typing import override
 from src.sprites import Animation
 from src.utils import Position, PositionCamera, Direction, GameSettings
 from src.core import GameManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.maps.spatial_hash import SpatialHash
 
 
 class Entity:
@@ -23,6 +27,8 @@ class Entity:
         self.direction = Direction.DOWN
         self.animation.update_pos(self.position)
         self.game_manager = game_manager
+        self.spatial: SpatialHash | None = None   # set by Map.add_entity
+        self._tile = self._position_tile()
         
     def get_rect(self):
         return pg.Rect(
@@ -32,26 +38,43 @@ class Entity:
             GameSettings.TILE_SIZE
         )
     
+    @property
+    def render_position(self) -> Position:
+        """Where the entity is drawn, subclasses may smooth it away from the simulated position"""
+        return self.position
+
     def update(self, dt: float) -> None:
-        self.animation.update_pos(self.position)
+        self.animation.update_pos(self.render_position)
         self.animation.update(dt)
+        self._sync_spatial()
+
+    def _sync_spatial(self) -> None:
+        if self.spatial is not None:
+            self.spatial.move(self, self.animation.rect)
+        tile = self._position_tile()
+        if tile != self._tile:
+            self._tile = tile
+            self._tile_changed()
+
+    def _position_tile(self) -> tuple[int, int]:
+        return int(self.position.x // GameSettings.TILE_SIZE), int(self.position.y // GameSettings.TILE_SIZE)
+
+    def _tile_changed(self) -> None:
+        """Called from _sync_spatial when the entity moved to another tile"""
         
     def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
         self.animation.draw(screen, camera)
         if GameSettings.DRAW_HITBOXES:
             self.animation.draw_hitbox(screen, camera)
          
-    @staticmethod
-    def _snap_to_grid(value: float) -> int:
-        return round(value / GameSettings.TILE_SIZE) * GameSettings.TILE_SIZE
-    
     @property
     def camera(self) -> PositionCamera:
         half_screen_w = GameSettings.SCREEN_WIDTH // 2
         half_screen_h = GameSettings.SCREEN_HEIGHT // 2
 
-        cam_x = self.position.x - half_screen_w + GameSettings.TILE_SIZE // 2
-        cam_y = self.position.y - half_screen_h + GameSettings.TILE_SIZE // 2
+        pos = self.render_position
+        cam_x = pos.x - half_screen_w + GameSettings.TILE_SIZE // 2
+        cam_y = pos.y - half_screen_h + GameSettings.TILE_SIZE // 2
 
         map_w = self.game_manager.current_map.pixel_w
         map_h = self.game_manager.current_map.pixel_h
@@ -62,7 +85,7 @@ class Entity:
         [TODO HACKATHON 3]
         Implement the correct algorithm of player camera
         '''
-        return PositionCamera(cam_x, cam_y)
+        return PositionCamera(int(cam_x), int(cam_y))
         
     def to_dict(self) -> dict[str, object]:
         return {
@@ -1,135 +1,141 @@
 from __future__ import annotations
 
-import copy
 import math
 from collections import deque
-from typing import override
+from dataclasses import dataclass
+from typing import override, TYPE_CHECKING
 
 import pygame as pg
 
 from .entity import Entity
-from src.core.services import input_manager
+from src.core.services import input_manager, path_service
 from src.utils import Position, PositionCamera, GameSettings, Direction
 from src.core import GameManager
+from src.maps.tile_grid import PC
+from src.maps.sweep import contact_offset
+
+if TYPE_CHECKING:
+    from src.core import OnlineManager, OnlineProcessManager
+
+
+@dataclass
+class InputCommand:
+    """One frame of player input, replayed by the server and during reconciliation"""
+    seq: int
+    mx: float                                   # movement direction, length <= 1
+    my: float
+    dt: float
+    resync: tuple[float, float, str] | None = None   # start position/map after a teleport
 
 
 class Player(Entity):
     speed: float = 4.0 * GameSettings.TILE_SIZE
+    TELEPORT_COOLDOWN = 1.0
     game_manager: GameManager
 
     def __init__(self, x: float, y: float, game_manager: GameManager) -> None:
         super().__init__(x, y, game_manager)
 
-        self.teleport_cooldown = 0.0
         self.next_teleport_pos: Position | None = None
+        # (map, tile) the player stood on last frame, teleports only fire when this changes
+        self._last_tile: tuple[str, int, int] | None = None
+        # Seconds left before teleports work again after arriving, so the player can't bounce back
+        self.teleport_cooldown = self.TELEPORT_COOLDOWN
 
         # Navigation state
         self.nav_path_tiles: list[tuple[int, int]] = []
         self.nav_auto_move: bool = False
+        # Final map of a multi-hop route, the path only ever covers the current map
+        self.nav_target_map: str | None = None
+        self.nav_route: list[str] = []
+        self._nav_ticket = None         # leg being solved by the path service
         # Threshold to account for speed/dt variance
         self.nav_stop_distance_px: float = 4.0 
 
+        # Online prediction / reconciliation state (net is set by GameScene when playing online)
+        self.net: OnlineManager | OnlineProcessManager | None = None
+        self._input_seq = 0
+        self._pending_inputs: deque[InputCommand] = deque()
+        self._net_player_id = -1
+        self._net_expected: tuple[float, float, str] | None = None
+        self._correction = Position(0, 0)       # visual offset left over from a server correction
+        self.correction_snap_distance: float = 3 * GameSettings.TILE_SIZE
+        self.correction_decay: float = 12.0     # 1/s, how fast the offset is blended away
+        self.is_moving = False
+
+    @property
+    def current_tile(self) -> tuple[int, int]:
+        """Tile under the center of the player"""
+        TILE = GameSettings.TILE_SIZE
+        return int((self.position.x + TILE // 2) // TILE), int((self.position.y + TILE // 2) // TILE)
+
+    def reset_tile_tracking(self) -> None:
+        """Call after placing the player, so the tile it lands on doesn't count as entered"""
+        self._last_tile = (self.game_manager.current_map_key, *self.current_tile)
+        self.teleport_cooldown = self.TELEPORT_COOLDOWN
+        self.game_manager.current_map.sight.move_target(self.current_tile)
+
     # -------------------------
     # PC / NPC interaction
     # -------------------------
     def is_facing_pc(self):
         TILE = GameSettings.TILE_SIZE
-        player_rect = self.get_rect()
-
-        for pc_rect in self.game_manager.current_map.pc_tiles:
-            rect = copy.deepcopy(pc_rect)
-            rect.y += TILE
-            if player_rect.colliderect(rect):
-                return True
-        return False
+        # Facing = standing right below a PC tile
+        return self.game_manager.current_map.grid.rect_hits(self.get_rect().move(0, -TILE), PC)
 
     def try_interact_with_npc(self):
         TILE = GameSettings.TILE_SIZE
-        player_rect = self.get_rect()
-
-        if hasattr(self.game_manager.current_map, "npcs"):
-            for npc in self.game_manager.current_map.npcs:
-                nx = npc.position.x
-                ny = npc.position.y + TILE
-                rect = pg.Rect(nx, ny, TILE, TILE)
-                if player_rect.colliderect(rect):
-                    npc.interact()
-                    return
+        # Same test as before (player overlaps the tile below the NPC), asked the other way around
+        probe = self.get_rect().move(0, -TILE)
+        for entity in self.game_manager.current_map.entities.query(probe):
+            if hasattr(entity, "interact"):
+                entity.interact()
+                return
 
     # -------------------------
-    # Navigation (BFS -> teleport tile)
+    # Navigation (world graph -> next map, distance field -> teleport tile)
     # -------------------------
     def cancel_navigation(self) -> None:
         self.nav_path_tiles = []
         self.nav_auto_move = False
-
-    def _is_walkable_tile(self, tx: int, ty: int) -> bool:
-        TILE = GameSettings.TILE_SIZE
-        m = self.game_manager.current_map
-        
-        # 1. Basic boundary check
-        w, h = getattr(m, "width", None), getattr(m, "height", None)
-        if isinstance(w, int) and isinstance(h, int):
-            max_tx, max_ty = (w // TILE, h // TILE) if w > 512 else (w, h)
-            if tx < 0 or ty < 0 or tx >= max_tx or ty >= max_ty:
-                return False
-
-        # 2. Check for solid collisions (Walls, Houses)
-        rect = pg.Rect(tx * TILE, ty * TILE, TILE, TILE)
-        if self.game_manager.check_collision(rect):
-            return False
-
-        # 3. Avoid Bushes (Preventing catch scenes during auto-navigation)
-        # We use a Position object because your Map.check_bush expects one
-        test_pos = Position(tx * TILE, ty * TILE)
-        if m.check_bush(test_pos):
-            return False
-
-        return True
-
-    def _bfs_to_destination_teleport(self, dest_map: str) -> list[tuple[int, int]]:
-        TILE = GameSettings.TILE_SIZE
-        start = (int(self.position.x // TILE), int(self.position.y // TILE))
-
-        q = deque([start])
-        came_from: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
-        MAX_VISITS = 40000
-        visits = 0
-
-        while q:
-            cx, cy = q.popleft()
-            visits += 1
-            if visits > MAX_VISITS: break
-
-            wp = Position(cx * TILE, cy * TILE)
-            tp = self.game_manager.current_map.check_teleport(wp)
-            if tp and getattr(tp, "destination", None) == dest_map:
-                path: list[tuple[int, int]] = []
-                cur: tuple[int, int] | None = (cx, cy)
-                while cur is not None and cur != start:
-                    path.append(cur)
-                    cur = came_from[cur]
-                path.reverse()
-                return path
-
-            for nx, ny in ((cx+1, cy), (cx-1, cy), (cx, cy+1), (cx, cy-1)):
-                if (nx, ny) not in came_from and self._is_walkable_tile(nx, ny):
-                    came_from[(nx, ny)] = (cx, cy)
-                    q.append((nx, ny))
-        return []
+        self.nav_target_map = None
+        self.nav_route = []
+        if self._nav_ticket is not None:
+            self._nav_ticket.cancel()
+            self._nav_ticket = None
 
     def start_navigation_to_map(self, map_name: str, auto_move: bool = True) -> None:
         if not self.game_manager.current_map or map_name == self.game_manager.current_map.path_name:
             self.cancel_navigation()
             return
 
-        path = self._bfs_to_destination_teleport(map_name)
-        if not path:
+        self.nav_target_map = map_name
+        self.nav_auto_move = auto_move
+        self._plan_navigation_leg()
+
+    def _plan_navigation_leg(self) -> None:
+        """Path to the teleporter of the next map on the route, called again after each teleport"""
+        gm = self.game_manager
+        if gm.current_map_key == self.nav_target_map:
             self.cancel_navigation()
             return
 
-        self.nav_path_tiles = path
-        self.nav_auto_move = auto_move
+        # Route and tile path are both solved off the game thread, on snapshots of the maps
+        map_key = gm.current_map_key
+
+        def on_route(result: tuple[list[str], list[tuple[int, int]]]) -> None:
+            self._nav_ticket = None
+            if self.nav_target_map is None or gm.current_map_key != map_key:
+                return  # navigation was cancelled or we left the map meanwhile
+            route, path = result or ([], [])
+            if not route or not path:
+                self.cancel_navigation()
+                return
+            self.nav_route = route
+            self.nav_path_tiles = path
+
+        self._nav_ticket = path_service.plan_route(gm.world, map_key, self.current_tile, self.nav_target_map,
+                                                   on_route, owner=self)
 
     def _step_navigation(self, dt: float) -> Position:
         if not self.nav_auto_move or not self.nav_path_tiles:
@@ -147,12 +153,14 @@ class Player(Entity):
         dist = math.sqrt(dx * dx + dy * dy)
 
         if dist <= self.nav_stop_distance_px:
-            self.position.x = target_x
-            self.position.y = target_y
             self.nav_path_tiles.pop(0)
-            if not self.nav_path_tiles:
+            if not self.nav_path_tiles and self.nav_target_map is None:
                 self.nav_auto_move = False
-            return Position(0, 0)
+            # Land on the tile center with a short regular move, so the server simulates it too
+            step = self.speed * dt
+            if dist == 0 or step <= 0:
+                return Position(0, 0)
+            return Position(dx / step, dy / step)
 
         vx, vy = dx / dist, dy / dist
         if abs(dx) > abs(dy):
@@ -162,16 +170,113 @@ class Player(Entity):
 
         return Position(vx, vy)
 
+    # -------------------------
+    # Movement / prediction
+    # -------------------------
+    def _simulate_step(self, x: float, y: float, cmd: InputCommand) -> tuple[int, int]:
+        """
+        Move along x then y, each axis swept so the player stops flush against what it hits
+        instead of tunnelling through it on a long frame. Mirrored by server/world.py simulate_step.
+        """
+        TILE = GameSettings.TILE_SIZE
+        dt = max(0.0, min(cmd.dt, 0.25))
+        mx, my = cmd.mx, cmd.my
+        length = math.hypot(mx, my)
+        if length > 1.0:
+            mx, my = mx / length, my / length
+
+        ix, iy = int(x), int(y)
+        nx = math.floor(x + mx * self.speed * dt + 0.5)
+        hit = self.game_manager.sweep(pg.Rect(ix, iy, TILE, TILE), nx - ix, 0)
+        if hit.hit:
+            nx = ix + contact_offset(nx - ix, hit.time)
+        ny = math.floor(y + my * self.speed * dt + 0.5)
+        hit = self.game_manager.sweep(pg.Rect(nx, iy, TILE, TILE), 0, ny - iy)
+        if hit.hit:
+            ny = iy + contact_offset(ny - iy, hit.time)
+        return nx, ny
+
+    def _send_input(self, cmd: InputCommand) -> None:
+        net = self.net
+        if net is None or net.player_id < 0:
+            self._pending_inputs.clear()
+            return
+        resync = None
+        if cmd.resync:
+            resync = {"x": cmd.resync[0], "y": cmd.resync[1], "map": cmd.resync[2]}
+        if not net.send_input({"seq": cmd.seq, "mx": cmd.mx, "my": cmd.my, "dt": cmd.dt, "resync": resync}):
+            return
+        self._pending_inputs.append(cmd)
+
+    def _needs_resync(self) -> bool:
+        """True if the position changed outside of _simulate_step (teleport, load, new connection)"""
+        net = self.net
+        if net is None:
+            return False
+        current = (self.position.x, self.position.y, self.game_manager.current_map_key)
+        return net.player_id != self._net_player_id or current != self._net_expected
+
+    def _reconcile(self) -> None:
+        """Rewind to the server state and replay the inputs it has not processed yet"""
+        if self.net is None:
+            return
+        state = self.net.pop_authoritative_state()
+        if state is None:
+            return
+        ack = state["ack"]
+        while self._pending_inputs and self._pending_inputs[0].seq <= ack:
+            self._pending_inputs.popleft()
+
+        x, y, map_name = state["x"], state["y"], state["map"]
+        for cmd in self._pending_inputs:
+            if cmd.resync:
+                x, y, map_name = cmd.resync
+            x, y = self._simulate_step(x, y, cmd)
+        if map_name != self.game_manager.current_map_key:
+            if self._needs_resync() or self.game_manager.should_change_scene or map_name not in self.game_manager.maps:
+                return  # Server is still on the previous map, wait for it to catch up
+            # The server refused our teleport (or put us somewhere else): go where it says
+            self.next_teleport_pos = Position(x, y)
+            self.game_manager.switch_map(map_name)
+            return
+
+        ex, ey = self.position.x - x, self.position.y - y
+        if ex == 0 and ey == 0:
+            return
+        if math.hypot(ex, ey) > self.correction_snap_distance:
+            self._correction = Position(0, 0)
+        else:
+            # Keep drawing where we were and blend towards the corrected position
+            self._correction.x += ex
+            self._correction.y += ey
+        self.position.x, self.position.y = x, y
+        self._net_expected = (x, y, map_name)
+
+    @property
+    @override
+    def render_position(self) -> Position:
+        if self._correction.x == 0 and self._correction.y == 0:
+            return self.position
+        return Position(self.position.x + self._correction.x, self.position.y + self._correction.y)
+
     # -------------------------
     # Update
     # -------------------------
     @override
     def update(self, dt: float) -> None:
+        # 0. Apply the latest authoritative state from the server
+        self._reconcile()
+
         # 1. Check for manual override
         manual_keys = (pg.K_UP, pg.K_w, pg.K_DOWN, pg.K_s, pg.K_LEFT, pg.K_a, pg.K_RIGHT, pg.K_d)
         if any(input_manager.key_down(k) for k in manual_keys) and self.nav_auto_move:
             self.cancel_navigation()
 
+        # Next leg of a multi-map route, once the teleport to this map is done
+        if (self.nav_target_map and not self.nav_path_tiles and self._nav_ticket is None
+                and not self.game_manager.should_change_scene):
+            self._plan_navigation_leg()
+
         # 2. Determine Movement Vector
         dis = Position(0, 0)
         self.is_moving = False
@@ -191,28 +296,31 @@ class Player(Entity):
             if input_manager.key_down(pg.K_RIGHT) or input_manager.key_down(pg.K_d):
                 dis.x += 1; self.direction = Direction.RIGHT; self.is_moving = True
 
-        # Apply speed and dt
-        if dis.x != 0 or dis.y != 0:
-            length = math.sqrt(dis.x**2 + dis.y**2)
-            dis.x = (dis.x / length) * self.speed * dt
-            dis.y = (dis.y / length) * self.speed * dt
-
-        # 3. Collision with Axis Snapping (Original Logic)
-        rect = self.get_rect()
-        
-        # X-Axis
-        rect.x += dis.x
-        if self.game_manager.check_collision(rect):
-            rect.x -= dis.x
-            rect.x = self._snap_to_grid(rect.x)
-        
-        # Y-Axis
-        rect.y += dis.y
-        if self.game_manager.check_collision(rect):
-            rect.y -= dis.y
-            rect.y = self._snap_to_grid(rect.y)
-            
-        self.position.x, self.position.y = rect.x, rect.y
+        # Normalize (navigation may already give a shorter vector for the last few pixels)
+        length = math.sqrt(dis.x**2 + dis.y**2)
+        if length > 1.0:
+            dis.x, dis.y = dis.x / length, dis.y / length
+
+        # 3. Collision with Axis Snapping, predicted locally and sent to the server
+        resync = None
+        if self._needs_resync():
+            self._pending_inputs.clear()
+            self._net_player_id = self.net.player_id
+            resync = (self.position.x, self.position.y, self.game_manager.current_map_key)
+        if dis.x != 0 or dis.y != 0 or resync:
+            cmd = InputCommand(self._input_seq, dis.x, dis.y, dt, resync)
+            self._input_seq += 1
+            self.position.x, self.position.y = self._simulate_step(self.position.x, self.position.y, cmd)
+            self._send_input(cmd)
+        self._net_expected = (self.position.x, self.position.y, self.game_manager.current_map_key)
+
+        # Blend away any correction offset
+        if self._correction.x != 0 or self._correction.y != 0:
+            k = math.exp(-self.correction_decay * dt)
+            self._correction.x *= k
+            self._correction.y *= k
+            if abs(self._correction.x) < 0.5 and abs(self._correction.y) < 0.5:
+                self._correction = Position(0, 0)
 
         # 4. Interaction & Teleport
         if input_manager.key_pressed(pg.K_f):
@@ -220,17 +328,24 @@ class Player(Entity):
                 self.game_manager.pc_box.open(self.game_manager)
             self.try_interact_with_npc()
 
-        if self.teleport_cooldown > 0:
-            self.teleport_cooldown -= dt
-        else:
-            tp = self.game_manager.current_map.check_teleport(self.position)
+        cooling = self.teleport_cooldown > 0
+        if cooling:
+            self.teleport_cooldown = max(0.0, self.teleport_cooldown - dt)
+        tile = (self.game_manager.current_map_key, *self.current_tile)
+        entered = tile != self._last_tile
+        if entered:
+            self._last_tile = tile
+            self.game_manager.current_map.sight.move_target(tile[1:])
+        # On entering a tile, or on the tile the player is still standing on when the cooldown ends
+        if self.teleport_cooldown == 0 and (entered or cooling):
+            tp = self.game_manager.current_map.teleport_at(tile[1], tile[2])
             if tp:
-                self.cancel_navigation()
+                # Keep nav_target_map, the next leg is planned on arrival
+                self.nav_path_tiles = []
                 dest = tp.destination
                 if dest in self.game_manager.maps:
                     self.next_teleport_pos = tp.dest_pos.copy() if hasattr(tp, "dest_pos") and tp.dest_pos else None
                     self.game_manager.switch_map(dest)
-                    self.teleport_cooldown = 1.0
 
         # 5. Animation
         self.animation.set_state(self.direction.name.lower())
@@ -1,3 +1,4 @@
 from .button import Button
+from .panel import Panel
 
 from .component import UIComponent
\ No newline at end of file
@@ -26,6 +26,7 @@ class Button(UIComponent):
         self.img_button = self.img_button_default
         self.on_click = on_click
         self.hitbox = pg.Rect(x,y,width,height)
+        self._drawn: Sprite | None = None  # image on screen since the last draw
         '''
         [TODO HACKATHON 1]
         Initialize the properties
@@ -66,6 +67,13 @@ class Button(UIComponent):
         You might want to change this too
         '''
         _ = screen.blit(self.img_button.image, self.hitbox)
+        self._drawn = self.img_button
+
+    def dirty_rect(self) -> pg.Rect | None:
+        """The hitbox if the button changed (hovered/unhovered) since it was last drawn"""
+        if self.img_button is self._drawn:
+            return None
+        return self.hitbox
 
 
 def main():
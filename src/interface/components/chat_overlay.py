@@ -2,7 +2,7 @@ from __future__ import annotations
 import pygame as pg
 from typing import Optional, Callable, List, Dict
 from .component import UIComponent
-from src.core.services import input_manager
+from src.core.services import input_manager, resource_manager
 from src.utils import Logger
 
 
@@ -15,8 +15,7 @@ class ChatOverlay(UIComponent):
     _just_opened: bool
     _send_callback: Callable[[str], bool] | None    #  NOTE: This is a callable function, you need to give it a function that sends the message
     _get_messages: Callable[[int], list[dict]] | None # NOTE: This is a callable function, you need to give it a function that gets the messages
-    _font_msg: pg.font.Font
-    _font_input: pg.font.Font
+    _font: str      # font file path, or a system font if it fails to load
 
     def __init__(
         self,
@@ -34,11 +33,10 @@ class ChatOverlay(UIComponent):
         self._get_messages = get_messages
 
         try:
-            self._font_msg = pg.font.Font(font_path, 18)
-            self._font_input = pg.font.Font(font_path, 20)
+            resource_manager.get_font(font_path, 18)
+            self._font = font_path
         except Exception:
-            self._font_msg = pg.font.SysFont("Arial", 18)
-            self._font_input = pg.font.SysFont("Arial", 20) 
+            self._font = "Arial"
 
     def open(self) -> None:
         if not self.is_open:
@@ -159,7 +157,7 @@ class ChatOverlay(UIComponent):
 
             # last N messages, bottom-aligned
             visible = msgs[-8:]
-            line_h = self._font_msg.get_linesize()
+            line_h = resource_manager.get_font(self._font, 18).get_linesize()
 
             total_height = len(visible) * line_h
             bottom_padding = 8
@@ -168,7 +166,7 @@ class ChatOverlay(UIComponent):
             for m in visible:
                 sender = str(m.get("from", ""))
                 text = str(m.get("text", ""))
-                surf = self._font_msg.render(f"{sender}: {text}", True, (255, 255, 255))
+                surf = resource_manager.render_text(f"{sender}: {text}", 18, (255, 255, 255), font=self._font)
                 screen.blit(surf, (x + 10, draw_y))
                 draw_y += line_h
 
@@ -187,7 +185,7 @@ class ChatOverlay(UIComponent):
 
         # Text
         txt = self._input_text
-        text_surf = self._font_input.render(txt, True, (255, 255, 255))
+        text_surf = resource_manager.render_text(txt, 20, (255, 255, 255), font=self._font)
         screen.blit(text_surf, (x + 8, box_y + 4))
 
         # Caret
@@ -0,0 +1,69 @@
+import pygame as pg
+from typing import Any, Callable
+
+from src.utils import GameSettings
+
+
+class Panel:
+    """
+    Retained overlay panel (bag, PC box, shop, settings, nav...).
+
+    The shadow, rounded panel, border and everything the overlay paints on it are kept
+    in a cached surface, repainted only when the overlay's state key changes (hover,
+    scroll, counts...). An open overlay then costs the dim layer and one blit per frame.
+    paint(surface) draws in screen coordinates, clipped to the panel and its shadow. It
+    paints on a full-screen scratch surface shared by all panels, and only the panel's
+    bounds are kept in its cache.
+    """
+
+    _dims: dict[int, pg.Surface] = {}   # full-screen dim layers by alpha, shared by all panels
+    _scratch: pg.Surface | None = None  # full-screen surface the panels are painted on
+
+    def __init__(self, size: tuple[int, int], color: tuple = (255, 165, 0), radius: int = 20,
+                 dim: int = 160, shadow: bool = True):
+        W, H = GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT
+        self.rect = pg.Rect((W - size[0]) // 2, (H - size[1]) // 2, *size)
+        self.bounds = (self.rect.union(self.rect.move(6, 6)) if shadow else self.rect.copy()).clip(0, 0, W, H)
+        self.color = color
+        self.radius = radius
+        self.dim = dim
+        self.shadow = shadow
+        self._surface: pg.Surface | None = None
+        self._key: Any = None
+
+    def changed(self, key: Any) -> bool:
+        """True if the next draw with this key repaints the panel"""
+        return self._surface is None or key != self._key
+
+    def invalidate(self) -> None:
+        self._surface = None
+
+    def _repaint(self, paint: Callable[[pg.Surface], None]) -> None:
+        if Panel._scratch is None:
+            Panel._scratch = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
+        surface = Panel._scratch
+        surface.set_clip(self.bounds)
+        surface.fill((0, 0, 0, 0))
+        if self.shadow:
+            pg.draw.rect(surface, (50, 50, 50), self.rect.move(6, 6), border_radius=self.radius)
+        pg.draw.rect(surface, self.color, self.rect, border_radius=self.radius)
+        pg.draw.rect(surface, (0, 0, 0), self.rect, 3, border_radius=self.radius)
+        paint(surface)
+        surface.set_clip(None)
+        self._surface = surface.subsurface(self.bounds).copy()
+
+    def draw_dim(self, screen: pg.Surface) -> None:
+        dim = Panel._dims.get(self.dim)
+        if dim is None:
+            dim = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
+            dim.fill((0, 0, 0, self.dim))
+            Panel._dims[self.dim] = dim
+        screen.blit(dim, (0, 0))
+
+    def draw(self, screen: pg.Surface, key: Any, paint: Callable[[pg.Surface], None], dim: bool = True) -> None:
+        if self.changed(key):
+            self._repaint(paint)
+            self._key = key
+        if dim:
+            self.draw_dim(screen)
+        screen.blit(self._surface, self.bounds.topleft)
@@ -13,19 +13,12 @@ class Minimap:
         self.map = game_map
         self.player = player
 
+        # Scaled map surfaces, built once per map on first visit (path_name -> (map, surface))
+        self._bases: dict[str, tuple[object, pg.Surface]] = {}
+
         # --- DYNAMIC MINIMAP SIZE BASED ON REAL MAP RATIO ---
         self.h = max_height
-        self.w = int(self.h * (self.map.pixel_w / self.map.pixel_h))
-
-        # Create scaled minimap surface once
-        self.minimap_surface = pg.transform.smoothscale(
-            self.map._surface,
-            (self.w, self.h)
-        )
-
-        # Scaling factors (world → minimap)
-        self.scale_x = self.w / self.map.pixel_w
-        self.scale_y = self.h / self.map.pixel_h
+        self._use_map(game_map)
 
         # Minimap screen position
         self.x = 10
@@ -35,32 +28,47 @@ class Minimap:
         self.player_color = (0, 255, 255)   # cyan
         self.shop_color = (255, 255, 0)     # yellow
         self.enemy_color = (255, 0, 0)      # red
+        self.remote_color = (255, 128, 0)   # orange
 
         self.radius = 3
 
         #enemy
         self.enemy_trainers = None
+        #other online players on this map, dicts with "x"/"y" like OnlineManager.get_list_players
+        self.remote_players: list[dict] = []
     #get enemy trainer(game scene)
     def update_enemy_trainers(self, trainers):
         self.enemy_trainers = trainers
     # -------------------------------------------------------------------------
+    def update_remote_players(self, players):
+        self.remote_players = players
+    # -------------------------------------------------------------------------
     def update_map(self, new_map):
-        """Rebuild minimap when switching maps."""
+        """Switch to another map's minimap, cheap when the map didn't change."""
+        if new_map is self.map:
+            return
+        self._use_map(new_map)
+
+    def _use_map(self, new_map):
         self.map = new_map
 
         # Recompute minimap dimensions
         self.w = int(self.h * (new_map.pixel_w / new_map.pixel_h))
-
-        # Recreate scaled minimap
-        self.minimap_surface = pg.transform.smoothscale(
-            new_map._surface,
-            (self.w, self.h)
-        )
+        self.minimap_surface = self._base_for(new_map)
 
         # Update scaling
         self.scale_x = self.w / new_map.pixel_w
         self.scale_y = self.h / new_map.pixel_h
 
+    def _base_for(self, game_map) -> pg.Surface:
+        cached = self._bases.get(game_map.path_name)
+        # A loaded save has new Map objects, rebuild for those
+        if cached is not None and cached[0] is game_map:
+            return cached[1]
+        surface = game_map.render_thumbnail((self.w, self.h))
+        self._bases[game_map.path_name] = (game_map, surface)
+        return surface
+
     # -------------------------------------------------------------------------
     def draw_npcs(self, screen):
         """
@@ -101,10 +109,16 @@ class Minimap:
             width=2
         )
 
-        # 3. Draw NPCs
+        # 3. Markers, drawn over the cached base every frame
         self.draw_npcs(screen)
 
-        # 4. Draw player
+        # 4. Other online players
+        for p in self.remote_players:
+            px = int(p["x"] * self.scale_x) + self.x
+            py = int(p["y"] * self.scale_y) + self.y
+            pg.draw.circle(screen, self.remote_color, (px, py), self.radius)
+
+        # 5. Draw player
         world_x = self.player.position.x
         world_y = self.player.position.y
 
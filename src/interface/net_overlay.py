@@ -0,0 +1,63 @@
+import pygame as pg
+from typing import Callable
+from src.core.managers.net_diagnostics import NetStats
+from src.core.services import resource_manager
+
+
+class NetStatsOverlay:
+    """Small on-screen panel with the connection quality numbers (toggle with F3)."""
+
+    def __init__(self, get_stats: Callable[[], NetStats], x: int = 10, y: int = 170):
+        self.get_stats = get_stats
+        self.visible = False
+        self.x = x
+        self.y = y
+        # Text is refreshed a few times per second so the numbers stay readable
+        self.refresh_interval = 0.25
+        self._timer = 0.0
+        self._lines: list[str] = []
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._timer = 0.0
+
+    def update(self, dt: float):
+        if not self.visible:
+            return
+        self._timer -= dt
+        if self._timer <= 0:
+            self._timer = self.refresh_interval
+            self._lines = self._format(self.get_stats())
+
+    def _format(self, s: NetStats) -> list[str]:
+        lines = [
+            f"NET  {'connected' if s.connected else 'offline'}  reconnects: {s.reconnects}",
+            f"RTT  {s.rtt_ms:.0f} ms  (min {s.rtt_min_ms:.0f}, last {s.rtt_last_ms:.0f})",
+            f"Jitter  {s.jitter_ms:.1f} ms   lost pings: {s.pings_lost}",
+            f"In  {s.bytes_in_per_s / 1024:.1f} KB/s   Out  {s.bytes_out_per_s / 1024:.1f} KB/s",
+            "Snapshot age  " + (f"{s.snapshot_age_ms:.0f} ms" if s.snapshot_age_ms >= 0 else "-")
+            + ("   delay " + (f"{s.snapshot_delay_ms:.0f} ms" if s.snapshot_delay_ms >= 0 else "-")),
+            f"Clock  {'synced' if s.clock_synced else 'syncing'}  drift {s.clock_drift_ppm:.0f} ppm"
+            + f"   interp {s.interp_delay_ms:.0f} ms",
+        ]
+        for label, rates in (("in", s.msgs_in_per_s), ("out", s.msgs_out_per_s)):
+            for msg_type, rate in sorted(rates.items()):
+                lines.append(f"  {label} {msg_type}: {rate:.1f}/s")
+        return lines
+
+    def draw(self, screen: pg.Surface):
+        if not self.visible or not self._lines:
+            return
+        line_h = resource_manager.get_font(None, 20).get_linesize()
+        w = 300
+        h = line_h * len(self._lines) + 12
+
+        bg = pg.Surface((w, h), pg.SRCALPHA)
+        bg.fill((0, 0, 0, 170))
+        screen.blit(bg, (self.x, self.y))
+
+        y = self.y + 6
+        for line in self._lines:
+            text = resource_manager.render_text(line, 20, (255, 255, 255))
+            screen.blit(text, (self.x + 8, y))
+            y += line_h
@@ -3,9 +3,8 @@ from typing import TYPE_CHECKING
 
 # Assuming these imports are correct based on your file structure
 from src.utils import GameSettings, Position
-from src.interface.components import Button
-from src.core.services import input_manager
-from src.sprites import Sprite
+from src.interface.components import Button, Panel
+from src.core.services import input_manager, resource_manager
 
 # Type checking imports help with avoiding circular dependencies
 if TYPE_CHECKING:
@@ -24,11 +23,8 @@ class ShopOverlay:
         self.panel_x = (GameSettings.SCREEN_WIDTH - self.panel_w) // 2
         self.panel_y = (GameSettings.SCREEN_HEIGHT - self.panel_h) // 2
         self.panel_rect = pg.Rect(self.panel_x, self.panel_y, self.panel_w, self.panel_h)
+        self.panel = Panel((self.panel_w, self.panel_h), color=(240, 150, 50))
 
-        # UI fonts
-        self.font_title = pg.font.Font(None, 50)
-        self.font = pg.font.Font(None, 26)
-        self.font_price = pg.font.Font(None, 30) 
 
         # State - START IN NONE MODE
         self.is_open = True
@@ -162,8 +158,7 @@ class ShopOverlay:
             if self.scroll_area.collidepoint(mx, my):
                 if mouse_wheel != 0 :
                     self.scroll += mouse_wheel * self.scroll_speed
-                    # Quick clamp using max_scroll. Final clamping happens in draw()
-                    self.scroll = min(0, max(self.scroll, self.max_scroll))
+                    self._clamp_scroll()
             # --------------------
             
             self.hover_index = -1
@@ -224,30 +219,49 @@ class ShopOverlay:
     # ----------------------------------------------------
     # DRAW UI
     # ----------------------------------------------------
-    def draw(self, screen: pg.Surface):
-        # Dim background
-        dim = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
-        dim.fill((0, 0, 0, 160))
-        screen.blit(dim, (0, 0))
+    def _clamp_scroll(self):
+        """Recalculate max_scroll from the number of rows and clamp the current scroll"""
+        if self.mode == "buy":
+            rows = len(self.shop.items_for_sale)
+        elif self.mode == "sell":
+            rows = sum(1 for item in self.bag._items_data if item["name"].lower() != "coins")
+        else:
+            rows = 0
+        self.max_scroll = min(0, self.scroll_area.height - rows * self.item_spacing)
+        self.scroll = min(0, max(self.scroll, self.max_scroll))
+
+    def panel_state(self) -> tuple:
+        """Everything the panel shows, it is only repainted when this changes"""
+        # Selling can remove a row since the last update, clamp before scroll goes in the key
+        self._clamp_scroll()
+        mouse = pg.mouse.get_pos()
+        buttons = tuple(b.img_button for b in (self.close_button, self.back_button, *self.item_buttons))
+        # Bag items are shown in sell mode and give the coins line in every mode
+        bag_items = tuple((item["name"], item["count"], item.get("sell_price", 1), item["sprite_path"])
+                          for item in self.bag._items_data)
+        shop_items = ()
+        if self.mode == "buy":
+            shop_items = tuple((item.name, item.price, item.sprite_path) for item in self.shop.items_for_sale)
+        return (self.mode, self.hover_index, self.scroll, buttons, bag_items, shop_items,
+                self.buy_button_rect.collidepoint(mouse), self.sell_button_rect.collidepoint(mouse))
 
-        # Panel shadow and background
-        pg.draw.rect(screen, (50, 50, 50), self.panel_rect.move(6, 6), border_radius=20)
-        pg.draw.rect(screen, (240, 150, 50), self.panel_rect, border_radius=20)
-        pg.draw.rect(screen, (0, 0, 0), self.panel_rect, 3, border_radius=20)
+    def draw(self, screen: pg.Surface, dim: bool = True):
+        self.panel.draw(screen, self.panel_state(), self._paint, dim)
 
+    def _paint(self, surface: pg.Surface):
         # Title
         title = "Shop"
         if self.mode == "buy":
             title += " — Buy Items"
         elif self.mode == "sell":
             title += " — Sell Items"
-        txt = self.font_title.render(title, True, (0, 0, 0))
-        screen.blit(txt, (self.panel_rect.centerx - txt.get_width() // 2, self.panel_y + 30))
+        txt = resource_manager.render_text(title, 50)
+        surface.blit(txt, (self.panel_rect.centerx - txt.get_width() // 2, self.panel_y + 30))
         
         # --- MODE: NONE (Buy/Sell Menu) ---
         if self.mode is None:
-            self._draw_button(screen, self.buy_button_rect, "Buy Items", (255, 255, 255))
-            self._draw_button(screen, self.sell_button_rect, "Sell Items", (255, 255, 255))
+            self._draw_button(surface, self.buy_button_rect, "Buy Items", (255, 255, 255))
+            self._draw_button(surface, self.sell_button_rect, "Sell Items", (255, 255, 255))
 
         # --- MODE: BUY or SELL (Item List) ---
         elif self.mode in ["buy", "sell"]:
@@ -264,11 +278,6 @@ class ShopOverlay:
             list_visible_h = self.scroll_area.height
             total_content_h = len(entries) * self.item_spacing
             
-            # Recalculate max_scroll and clamp current scroll
-            # Add a small buffer (e.g., 5 pixels) to max_scroll for safety margin if needed
-            self.max_scroll = min(0, list_visible_h - total_content_h)
-            self.scroll = min(0, max(self.scroll, self.max_scroll))
-            
             # The surface must be large enough to hold all items
             item_list_surface = pg.Surface((self.scroll_area.width, max(list_visible_h, total_content_h)), pg.SRCALPHA)
             
@@ -296,13 +305,12 @@ class ShopOverlay:
                 text_center_y = row_rect_on_surface.centery
                 
                 # 3. Draw item sprite
-                item_sprite = Sprite(sprite_path, (new_sprite_size, new_sprite_size)) 
-                item_sprite.update_pos(Position(row_rect_on_surface.x + 15, text_center_y - new_sprite_size // 2))
-                item_sprite.draw(item_list_surface) 
+                item_list_surface.blit(resource_manager.get_image(sprite_path, (new_sprite_size, new_sprite_size)),
+                                       (row_rect_on_surface.x + 15, text_center_y - new_sprite_size // 2))
 
                 # 4 & 5. Draw name and quantity (Directly onto the temporary surface)
-                name_txt = self.font.render(item_name, True, (0, 0, 0)) 
-                count_txt = self.font.render(f"x{item_count}", True, (0, 0, 0))
+                name_txt = resource_manager.render_text(item_name, 26) 
+                count_txt = resource_manager.render_text(f"x{item_count}", 26)
                 
                 name_y = text_center_y - name_txt.get_height() // 2
                 
@@ -315,7 +323,7 @@ class ShopOverlay:
                 
                 # 6. Draw Price
                 price_text = f"${item_price}" 
-                price_txt = self.font_price.render(price_text, True, (255, 0, 0))
+                price_txt = resource_manager.render_text(price_text, 30, (255, 0, 0))
                 price_y = text_center_y - price_txt.get_height() // 2
                 price_x = row_rect_on_surface.x + row_rect_on_surface.width - price_txt.get_width() - 80
                 item_list_surface.blit(price_txt, (price_x, price_y))
@@ -340,9 +348,9 @@ class ShopOverlay:
                     self.item_buttons[idx].hitbox.x = original_x
                     self.item_buttons[idx].hitbox.y = original_y
             
-            # 4. Blit the scrolled portion of the surface onto the screen
+            # 4. Blit the scrolled portion of the surface onto the surface
             # This is where the magic happens: only a scrolled section is visible
-            screen.blit(
+            surface.blit(
                 item_list_surface, 
                 self.scroll_area.topleft, 
                 (0, -self.scroll, self.scroll_area.width, self.scroll_area.height)
@@ -356,18 +364,16 @@ class ShopOverlay:
         
         if coin_data:
             coins = coin_data["count"]
-            coin_sprite = Sprite(coin_data["sprite_path"], (20, 20))
-            coin_sprite.update_pos(coin_pos)
-            
-            coin_txt = self.font.render(f"Coins: {coins}", True, (0, 0, 0))
-            coin_sprite.draw(screen)
-            screen.blit(coin_txt, (coin_pos.x + 25, coin_pos.y + 2))
+            coin_txt = resource_manager.render_text(f"Coins: {coins}", 26)
+            surface.blit(resource_manager.get_image(coin_data["sprite_path"], (20, 20)),
+                         (round(coin_pos.x), round(coin_pos.y)))
+            surface.blit(coin_txt, (coin_pos.x + 25, coin_pos.y + 2))
 
         # Draw persistent buttons LAST to ensure they are on top of the list
         if self.mode in ["buy", "sell"]:
-            self.back_button.draw(screen) 
+            self.back_button.draw(surface) 
             
-        self.close_button.draw(screen)
+        self.close_button.draw(surface)
 
     # ----------------------------------------------------
     # Draw a Button (manual button without image)
@@ -381,6 +387,6 @@ class ShopOverlay:
         else:
             pg.draw.rect(screen, (0, 0, 0), rect, 2, border_radius=10) 
 
-        button_text = self.font_title.render(text, True, (0, 0, 0))
+        button_text = resource_manager.render_text(text, 50)
         text_rect = button_text.get_rect(center=rect.center)
         screen.blit(button_text, text_rect)
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .bake import main
+
+main()
@@ -0,0 +1,206 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+
+import pygame as pg
+import pytmx
+
+from src.utils import load_tmx, GameSettings, Logger
+from src.utils.loader import ASSETS_DIR
+from .tile_grid import TileGrid, SOLID, BUSH, PC
+from .collision_shapes import CollisionShape, load_object_shapes
+
+"""
+Offline bake of the .tmx maps.
+
+Parsing a tmx and its tilesets then compositing every tile is the slow part of loading
+a map, so it is done once and stored under cache/maps/<name>-<hash>-<TILE_SIZE>/:
+  base.png    the ground layers composited over black, opaque (at the tmx tile size
+              when TILE_SIZE is a multiple of it, the chunks scale it up when drawn)
+  above.png   layers drawn over the entities (roofs, tree tops), only if the map has some
+  grid.bin    the TileGrid flags, one byte per tile
+  meta.json   sizes and the object layer collision shapes
+The hash covers the tmx, its tilesets and their images, so editing a map in Tiled
+just makes the next load bake it again. Teleporters come from the save file, not
+the tmx, so they are indexed at load time (Map._build_teleport_index).
+
+CLI: python -m src.maps [map.tmx ...] [--force]  (see __main__.py)
+"""
+
+CACHE_DIR = ASSETS_DIR.parent / "cache" / "maps"   # repo root, like assets/
+BAKE_VERSION = 2    # bump when the output format changes
+
+
+@dataclass
+class BakedMap:
+    width: int                  # in tiles
+    height: int
+    base: pg.Surface            # opaque ground, image_tile pixels per tile
+    above: pg.Surface | None    # alpha layer drawn after the entities
+    image_tile: int
+    grid: TileGrid
+    shapes: list[CollisionShape]
+
+
+def _dependencies(path: Path) -> list[Path]:
+    """Tilesets (.tsx) and images a tmx/tsx refers to, recursively"""
+    deps: list[Path] = []
+    root = ET.parse(path).getroot()
+    for node in root.iter():
+        source = node.get("source")
+        if source is None or node.tag not in ("tileset", "image"):
+            continue
+        dep = (path.parent / source).resolve()
+        deps.append(dep)
+        if dep.suffix == ".tsx":
+            deps.extend(_dependencies(dep))
+    return deps
+
+
+def source_hash(name: str) -> str:
+    path = ASSETS_DIR / "maps" / name
+    h = hashlib.sha1(f"{BAKE_VERSION}:{GameSettings.TILE_SIZE}".encode())
+    for file in [path, *_dependencies(path)]:
+        h.update(file.name.encode())
+        h.update(file.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def cache_path(name: str) -> Path:
+    stem = Path(name).stem
+    return CACHE_DIR / f"{stem}-{source_hash(name)}-{GameSettings.TILE_SIZE}"
+
+
+def bake_tile_grid(tmx: pytmx.TiledMap) -> TileGrid:
+    """One pass over the tile layers, same layer names as the old per-layer loaders"""
+    grid = TileGrid(tmx.width, tmx.height)
+    for layer in tmx.visible_layers:
+        if not isinstance(layer, pytmx.TiledTileLayer):
+            continue
+        name = layer.name.lower()
+        flag = 0
+        if "collision" in name or "house" in name:
+            flag |= SOLID
+        if "bush" in name:
+            flag |= BUSH
+        if "collisionpc" in name:
+            flag |= PC
+        if flag == 0:
+            continue
+        for x, y, gid in layer:
+            if gid != 0:
+                grid.set(x, y, flag)
+    return grid
+
+
+def is_above_layer(layer: pytmx.TiledTileLayer) -> bool:
+    """Layers named like roofs, or with a custom "above" property in Tiled, hide the entities"""
+    name = layer.name.lower()
+    return bool(layer.properties.get("above")) or "above" in name or "roof" in name
+
+
+def _composite(tmx: pytmx.TiledMap, tile: int, above: bool) -> pg.Surface | None:
+    """The tile layers of one group, None if the group is empty"""
+    layers = [l for l in tmx.visible_layers
+              if isinstance(l, pytmx.TiledTileLayer) and is_above_layer(l) == above]
+    if above and not layers:
+        return None
+    if above:
+        surface = pg.Surface((tmx.width * tile, tmx.height * tile), pg.SRCALPHA)
+    else:
+        # Same black the screen is cleared with, where no ground tile covers it
+        surface = pg.Surface((tmx.width * tile, tmx.height * tile))
+    scaled: dict[int, pg.Surface | None] = {}
+    for layer in layers:
+        for x, y, gid in layer:
+            if gid == 0:
+                continue
+            if gid not in scaled:
+                image = tmx.get_tile_image_by_gid(gid)
+                if image is not None and image.get_size() != (tile, tile):
+                    image = pg.transform.scale(image, (tile, tile))
+                scaled[gid] = image
+            if scaled[gid] is not None:
+                surface.blit(scaled[gid], (x * tile, y * tile))
+    return surface
+
+
+def bake(name: str) -> Path:
+    """Bake one map into the cache, returns its directory"""
+    out = cache_path(name)
+    Logger.info(f"Baking map: {name} -> {out}")
+    tmx = load_tmx(name)
+    # Nearest-neighbour scaling by a whole factor gives the same pixels whether it is
+    # done per tile or on the whole image, so keep the small image when we can
+    tile = tmx.tilewidth if GameSettings.TILE_SIZE % tmx.tilewidth == 0 else GameSettings.TILE_SIZE
+    grid = bake_tile_grid(tmx)
+    shapes = load_object_shapes(tmx, GameSettings.TILE_SIZE)
+
+    tmp = out.with_name(out.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    pg.image.save(_composite(tmx, tile, False), str(tmp / "base.png"))
+    above = _composite(tmx, tile, True)
+    if above is not None:
+        pg.image.save(above, str(tmp / "above.png"))
+    (tmp / "grid.bin").write_bytes(bytes(grid.cells))
+    meta = {
+        "width": tmx.width,
+        "height": tmx.height,
+        "image_tile": tile,
+        "above": above is not None,
+        "shapes": [{"rect": list(s.rect), "points": s.points} for s in shapes],
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta))
+
+    # Replace older bakes of the same map at this TILE_SIZE
+    # (exact <stem>-<hex hash>-<TILE> names, so "route" leaves "route-2" alone)
+    pattern = re.compile(rf"{re.escape(Path(name).stem)}-[0-9a-f]+-{GameSettings.TILE_SIZE}")
+    for old in CACHE_DIR.glob(f"{Path(name).stem}-*-{GameSettings.TILE_SIZE}"):
+        if old.is_dir() and pattern.fullmatch(old.name):
+            shutil.rmtree(old, ignore_errors=True)
+    os.replace(tmp, out)
+    return out
+
+
+def load_baked(name: str) -> BakedMap:
+    """Load a map from the cache, baking it first on a miss"""
+    out = cache_path(name)
+    if not (out / "meta.json").exists():
+        out = bake(name)
+    meta = json.loads((out / "meta.json").read_text())
+    grid = TileGrid(meta["width"], meta["height"])
+    grid.cells[:] = (out / "grid.bin").read_bytes()
+    base = pg.image.load(str(out / "base.png"))
+    above = pg.image.load(str(out / "above.png")) if meta["above"] else None
+    if pg.display.get_surface() is not None:
+        # Display pixel formats: plain blits for the ground, per-pixel alpha only above
+        base = base.convert()
+        above = above.convert_alpha() if above else None
+    shapes = [CollisionShape(pg.Rect(s["rect"]), [tuple(p) for p in s["points"]] if s["points"] else None)
+              for s in meta["shapes"]]
+    return BakedMap(meta["width"], meta["height"], base, above, meta["image_tile"], grid, shapes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bake .tmx maps into the render cache")
+    parser.add_argument("maps", nargs="*", help="map files in assets/maps (default: all)")
+    parser.add_argument("--force", action="store_true", help="bake even if the cache is up to date")
+    args = parser.parse_args()
+
+    # pytmx converts the tileset images, which needs a display mode
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+    names = args.maps or sorted(p.name for p in (ASSETS_DIR / "maps").glob("*.tmx"))
+    for name in names:
+        if not args.force and (cache_path(name) / "meta.json").exists():
+            print(f"{name}: up to date")
+            continue
+        print(f"{name}: baked into {bake(name)}")
@@ -0,0 +1,68 @@
+import pygame as pg
+from collections import OrderedDict
+from typing import Callable
+
+from src.utils import GameSettings, PositionCamera
+
+
+class ChunkCache:
+    """
+    The map image cut into chunk_size squares, each rendered the first time it is on screen.
+
+    Only the chunks overlapping the camera are drawn. Chunks are kept in drawing order and
+    the least recently drawn ones are dropped past max_chunks (by default two screens'
+    worth), so memory follows the window size instead of the map size.
+    """
+
+    def __init__(self, pixel_w: int, pixel_h: int, render: Callable[[pg.Surface, pg.Rect], None],
+                 chunk_size: int = 512, max_chunks: int | None = None, alpha: bool = True):
+        self.alpha = alpha  # False for layers that cover every pixel, they blit faster without alpha
+        self.bounds = pg.Rect(0, 0, pixel_w, pixel_h)
+        self.chunk_size = chunk_size
+        self.cols = (pixel_w + chunk_size - 1) // chunk_size
+        self.rows = (pixel_h + chunk_size - 1) // chunk_size
+        # render(surface, area): draw the world pixels of area into surface at (0, 0)
+        self._render = render
+        if max_chunks is None:
+            per_screen = (GameSettings.SCREEN_WIDTH // chunk_size + 2) * (GameSettings.SCREEN_HEIGHT // chunk_size + 2)
+            max_chunks = per_screen * 2
+        self.max_chunks = max_chunks
+        self._chunks: OrderedDict[tuple[int, int], pg.Surface] = OrderedDict()
+        self.rendered = 0   # chunks rendered so far, misses included after an eviction
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def _chunk(self, cx: int, cy: int) -> pg.Surface:
+        surface = self._chunks.get((cx, cy))
+        if surface is not None:
+            self._chunks.move_to_end((cx, cy))
+            return surface
+        size = self.chunk_size
+        area = pg.Rect(cx * size, cy * size, size, size).clip(self.bounds)
+        if self.alpha:
+            surface = pg.Surface(area.size, pg.SRCALPHA)
+        else:
+            surface = pg.Surface(area.size)
+            if pg.display.get_surface() is not None:
+                surface = surface.convert()
+        self._render(surface, area)
+        self._chunks[(cx, cy)] = surface
+        self.rendered += 1
+        return surface
+
+    def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
+        size = self.chunk_size
+        view = pg.Rect(int(camera.x), int(camera.y), screen.get_width(), screen.get_height())
+        cx0, cy0 = max(0, view.left // size), max(0, view.top // size)
+        cx1 = min(self.cols - 1, (view.right - 1) // size)
+        cy1 = min(self.rows - 1, (view.bottom - 1) // size)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                chunk = self._chunk(cx, cy)
+                screen.blit(chunk, camera.transform_rect(pg.Rect(cx * size, cy * size, 0, 0)).topleft)
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self._chunks.clear()
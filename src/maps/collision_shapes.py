@@ -0,0 +1,174 @@
+import pygame as pg
+import pytmx
+from typing import Iterator
+
+"""
+Sub-tile collision geometry from Tiled object layers.
+
+Object layers whose name contains "collision" or "house" (same rule as tile layers)
+may hold rectangles and polygons. They are scaled from tmx pixels to game pixels and
+stored in a static AABB tree, so a query only descends into the boxes it overlaps.
+
+Also imported by server/world.py, keep it free of anything that needs a display.
+"""
+
+Point = tuple[float, float]
+
+
+class CollisionShape:
+    """A rectangle (points is None) or a polygon, with its bounding box in game pixels"""
+
+    def __init__(self, rect: pg.Rect, points: list[Point] | None = None):
+        self.rect = rect
+        self.points = points
+
+    @classmethod
+    def from_points(cls, points: list[Point]) -> "CollisionShape":
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        left, top = int(min(xs)), int(min(ys))
+        rect = pg.Rect(left, top, int(max(xs) + 0.999) - left, int(max(ys) + 0.999) - top)
+        return cls(rect, points)
+
+    def collides(self, rect: pg.Rect) -> bool:
+        if not self.rect.colliderect(rect):
+            return False
+        if self.points is None:
+            return True
+        return _polygon_hits_rect(self.points, rect)
+
+
+def _point_in_polygon(x: float, y: float, points: list[Point]) -> bool:
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        xi, yi = points[i]
+        xj, yj = points[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _segment_hits_rect(a: Point, b: Point, left: float, top: float, right: float, bottom: float) -> bool:
+    """Liang-Barsky clipping of segment a-b against the open box"""
+    t0, t1 = 0.0, 1.0
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    for p, q in ((-dx, a[0] - left), (dx, right - a[0]), (-dy, a[1] - top), (dy, bottom - a[1])):
+        if p == 0:
+            if q <= 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 >= t1:
+            return False
+    return True
+
+
+def _polygon_hits_rect(points: list[Point], rect: pg.Rect) -> bool:
+    """Works for concave polygons too: an edge crosses the rect, or one contains the other"""
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    x0, y0 = points[0]
+    if left < x0 < right and top < y0 < bottom:
+        return True
+    if _point_in_polygon(rect.centerx, rect.centery, points):
+        return True
+    for i in range(len(points)):
+        if _segment_hits_rect(points[i - 1], points[i], left, top, right, bottom):
+            return True
+    return False
+
+
+class AABBTree:
+    """
+    Static bounding-volume hierarchy, built once top-down by splitting the shapes at the
+    median of the longest axis. Queries are logarithmic in the number of shapes.
+    """
+
+    def __init__(self, shapes: list[CollisionShape], leaf_size: int = 4):
+        self.shapes = shapes
+        self.leaf_size = leaf_size
+        # Flat node list: (box, left child, right child, shapes of a leaf)
+        self.nodes: list[tuple[pg.Rect, int, int, list[CollisionShape]]] = []
+        if shapes:
+            self._build(list(shapes))
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def _build(self, shapes: list[CollisionShape]) -> int:
+        box = shapes[0].rect.unionall([s.rect for s in shapes[1:]])
+        index = len(self.nodes)
+        if len(shapes) <= self.leaf_size:
+            self.nodes.append((box, -1, -1, shapes))
+            return index
+        self.nodes.append((box, -1, -1, []))
+        if box.width >= box.height:
+            shapes.sort(key=lambda s: s.rect.centerx)
+        else:
+            shapes.sort(key=lambda s: s.rect.centery)
+        mid = len(shapes) // 2
+        left = self._build(shapes[:mid])
+        right = self._build(shapes[mid:])
+        self.nodes[index] = (box, left, right, [])
+        return index
+
+    def candidates(self, rect: pg.Rect) -> Iterator[CollisionShape]:
+        """Shapes whose bounding box overlaps rect"""
+        if not self.nodes:
+            return
+        stack = [0]
+        nodes = self.nodes
+        while stack:
+            box, left, right, leaf = nodes[stack.pop()]
+            if not box.colliderect(rect):
+                continue
+            if left < 0:
+                for shape in leaf:
+                    if shape.rect.colliderect(rect):
+                        yield shape
+            else:
+                stack.append(left)
+                stack.append(right)
+
+    def query(self, rect: pg.Rect) -> Iterator[CollisionShape]:
+        """Shapes that really overlap rect (not just their bounding box)"""
+        for shape in self.candidates(rect):
+            if shape.collides(rect):
+                yield shape
+
+    def any_hit(self, rect: pg.Rect) -> bool:
+        for _ in self.query(rect):
+            return True
+        return False
+
+
+def load_object_shapes(tmx: pytmx.TiledMap, tile_size: int) -> list[CollisionShape]:
+    """Collision rects and polygons of the object layers, scaled to tile_size pixels per tile"""
+    scale = tile_size / tmx.tilewidth
+    shapes: list[CollisionShape] = []
+    for layer in tmx.visible_layers:
+        if not isinstance(layer, pytmx.TiledObjectGroup):
+            continue
+        name = (layer.name or "").lower()
+        if "collision" not in name and "house" not in name:
+            continue
+        for obj in layer:
+            if getattr(obj, "closed", True) is False:
+                continue    # polylines are not solid
+            rotated = bool(getattr(obj, "rotation", 0))
+            if hasattr(obj, "points") or rotated:
+                points = [(p[0] * scale, p[1] * scale) for p in obj.apply_transformations()]
+                if len(points) >= 3:
+                    shapes.append(CollisionShape.from_points(points))
+            elif obj.width and obj.height:
+                # Rectangles (and ellipses, approximated by their box)
+                shapes.append(CollisionShape(pg.Rect(
+                    round(obj.x * scale), round(obj.y * scale),
+                    round(obj.width * scale), round(obj.height * scale)
+                )))
+    return shapes
@@ -1,151 +1,159 @@
 import pygame as pg
-import pytmx
 
-from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from src.utils import Position, GameSettings, PositionCamera, Teleport
+from .tile_grid import TileGrid, SOLID
+from .spatial_hash import SpatialHash
+from .collision_shapes import AABBTree
+from .bake import load_baked
+from .sight import SightIndex
+from .chunks import ChunkCache
+from .sweep import SweepHit, sweep_grid, sweep_shape
+from .pathfinding import WalkGrid, static_walk_cells, entity_tiles, build_walk_grid
 
 class Map:
     # Map Properties
     path_name: str
-    tmxdata: pytmx.TiledMap
     # Position Argument
     spawn: Position
     teleporters: list[Teleport]
     # Rendering Properties
-    _surface: pg.Surface
+    chunks: ChunkCache
+    above_chunks: ChunkCache | None
     _collision_map: list[pg.Rect]
+    # Collision Properties
+    grid: TileGrid
+    shapes: AABBTree
+    entities: SpatialHash
+    sight: SightIndex
 
     def __init__(self, path: str, tp: list[Teleport], spawn: Position):
         self.path_name = path
-        self.tmxdata = load_tmx(path)
         self.spawn = spawn
         self.teleporters = tp
-        self.bush_tiles = self._load_bush_tiles()
-
-        self.pixel_w = self.tmxdata.width * GameSettings.TILE_SIZE
-        self.pixel_h = self.tmxdata.height * GameSettings.TILE_SIZE
-
-        
-        self._surface = pg.Surface((self.pixel_w, self.pixel_h), pg.SRCALPHA)
-        self._render_all_layers(self._surface)
-        
-        self._collision_map = self._create_collision_map()
-        self.pc_tiles = self._load_pc_tiles()
+        self._teleport_index = self._build_teleport_index()
+        # Image, grids and shapes come from the bake cache (baked on the first load)
+        baked = load_baked(path)
+        self.width, self.height = baked.width, baked.height
+        self.grid = baked.grid
+        # Sub-tile walls and furniture drawn as rects/polygons in object layers
+        self.shapes = AABBTree(baked.shapes)
+
+        self.pixel_w = self.width * GameSettings.TILE_SIZE
+        self.pixel_h = self.height * GameSettings.TILE_SIZE
+
+        # The baked images are drawn in chunks, scaled up to TILE_SIZE when they were baked smaller.
+        # Opaque ground under the entities, roofs/tree tops (if any) over them.
+        self._base = baked.base
+        self._above = baked.above
+        self._image_scale = GameSettings.TILE_SIZE // baked.image_tile
+        self.chunks = ChunkCache(self.pixel_w, self.pixel_h,
+                                 lambda target, area: self._render_area(self._base, target, area), alpha=False)
+        self.above_chunks = None
+        if self._above is not None:
+            self.above_chunks = ChunkCache(self.pixel_w, self.pixel_h,
+                                           lambda target, area: self._render_area(self._above, target, area))
+
+        # Only kept for drawing hitboxes, queries use the grid
+        self._collision_map = self.grid.rects(SOLID)
         self.npcs = []
-    def _load_pc_tiles(self):
-        pcs = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and "collisionpc" in layer.name.lower():
-                for x, y, gid in layer:
-                    if gid != 0:
-                        pcs.append(pg.Rect(
-                            x * GameSettings.TILE_SIZE,
-                            y * GameSettings.TILE_SIZE,
-                            GameSettings.TILE_SIZE,
-                            GameSettings.TILE_SIZE
-                        ))
-        return pcs
-    def _load_bush_tiles(self):
-        bushes = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and "bush" in layer.name.lower():
-                for x, y, gid in layer:
-                    if gid != 0:
-                        bushes.append(
-                            pg.Rect(
-                                x * GameSettings.TILE_SIZE,
-                                y * GameSettings.TILE_SIZE,
-                                GameSettings.TILE_SIZE,
-                                GameSettings.TILE_SIZE
-                            )
-                        )
-        return bushes
-    
-    def check_bush(self, position):
-        px, py = position.x+ GameSettings.TILE_SIZE // 2, position.y+ GameSettings.TILE_SIZE // 2
-        for rect in self.bush_tiles:
-            if rect.collidepoint(px,py):
-                return True
-        return False
+        # Trainers and NPCs of this map, kept in sync by Entity.update
+        self.entities = SpatialHash()
+        # Tiles watched by the trainers of this map
+        self.sight = SightIndex(self.grid)
+        # Navigation caches: walls/shapes follow the grid version, trainers/NPCs are laid
+        # over them and only rebuild the walk grid when the tiles they stand on change
+        self._static_walk: tuple[int, bytes] | None = None      # (grid version, cells)
+        self._entity_tiles: tuple[int, frozenset] | None = None  # (entities version, tiles)
+        self._walk_version = 0
+        self._walk_grid: WalkGrid | None = None
+
+    def add_entity(self, entity) -> None:
+        entity.spatial = self.entities
+        self.entities.insert(entity, entity.get_rect())
+
+    def _build_teleport_index(self) -> dict[tuple[int, int], Teleport]:
+        """Tile -> Teleport, looked up with Player.current_tile (see Teleport.tile)"""
+        index: dict[tuple[int, int], Teleport] = {}
+        for tp in self.teleporters:
+            index.setdefault(tp.tile, tp)
+        return index
+
+    def teleport_at(self, tx: int, ty: int) -> Teleport | None:
+        return self._teleport_index.get((tx, ty))
+
+    def teleport_tiles(self) -> list[tuple[tuple[int, int], Teleport]]:
+        return list(self._teleport_index.items())
+
+    # Navigation
+    def walk_grid(self) -> WalkGrid:
+        """Immutable snapshot of the walkable tiles, cached until the grid or the tiles blocked by entities change"""
+        stale = self._walk_grid is None
+        if self._static_walk is None or self._static_walk[0] != self.grid.version:
+            self._static_walk = (self.grid.version, static_walk_cells(self.grid, self.shapes))
+            stale = True
+        # An NPC moving inside its tile bumps entities.version but blocks the same tiles
+        if self._entity_tiles is None or self._entity_tiles[0] != self.entities.version:
+            tiles = entity_tiles(self.grid, self.entities)
+            if self._entity_tiles is None or tiles != self._entity_tiles[1]:
+                stale = True
+            self._entity_tiles = (self.entities.version, tiles)
+        if stale:
+            self._walk_version += 1
+            self._walk_grid = build_walk_grid(self.grid, self._static_walk[1], self._entity_tiles[1], self._walk_version)
+        return self._walk_grid
+
     def update(self, dt: float):
         return
 
     def draw(self, screen: pg.Surface, camera: PositionCamera):
-        screen.blit(self._surface, camera.transform_position(Position(0, 0)))
-        
-        # Draw the hitboxes collision map
+        self.chunks.draw(screen, camera)
+
+    def draw_above(self, screen: pg.Surface, camera: PositionCamera):
+        """Roofs and tree tops, call after the entities are drawn"""
+        if self.above_chunks is not None:
+            self.above_chunks.draw(screen, camera)
+
+        # Draw the hitboxes collision map, over the roofs so they are never hidden
         if GameSettings.DRAW_HITBOXES:
             for rect in self._collision_map:
                 pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(rect), 1)
-        
+            for shape in self.shapes.shapes:
+                if shape.points is None:
+                    pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(shape.rect), 1)
+                else:
+                    offset = camera.transform_position(Position(0, 0))
+                    pg.draw.polygon(screen, (255, 0, 0), [(x + offset[0], y + offset[1]) for x, y in shape.points], 1)
+
     def check_collision(self, rect: pg.Rect) -> bool:
-        for hitbox in self._collision_map:
-            if(rect.colliderect(hitbox)):
-                return True
-        return False
-        '''
-        [TODO HACKATHON 4]
-        Return True if collide if rect param collide with self._collision_map
-        Hint: use API colliderect and iterate each rectangle to check
-        '''
-        return False
+        return self.grid.rect_hits(rect, SOLID) or self.shapes.any_hit(rect)
         
-    def check_teleport(self, pos: Position) -> Teleport | None:
-        for tp in self.teleporters:
-            tp_rect = pg.Rect(
-                tp.pos.x,
-                tp.pos.y,
-                GameSettings.TILE_SIZE,
-                GameSettings.TILE_SIZE
-            )
-            if tp_rect.collidepoint(pos.x, pos.y):
-                return tp
-        return None 
-        '''[TODO HACKATHON 6] 
-        Teleportation: Player can enter a building by walking into certain tiles defined inside saves/*.json, and the map will be changed
-        Hint: Maybe there is an way to switch the map using something from src/core/managers/game_manager.py called switch_... 
-        '''
-        return None
-
-    def _render_all_layers(self, target: pg.Surface) -> None:
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                self._render_tile_layer(target, layer)
-            # elif isinstance(layer, pytmx.TiledImageLayer) and layer.image:
-            #     target.blit(layer.image, (layer.x or 0, layer.y or 0))
- 
-    def _render_tile_layer(self, target: pg.Surface, layer: pytmx.TiledTileLayer) -> None:
-        for x, y, gid in layer:
-            if gid == 0:
-                continue
-            image = self.tmxdata.get_tile_image_by_gid(gid)
-            if image is None:
-                continue
-
-            image = pg.transform.scale(image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-            target.blit(image, (x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE))
-    
-    def _create_collision_map(self) -> list[pg.Rect]:
-        rects = []
-        for layer in self.tmxdata.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and ("collision" in layer.name.lower() or "house" in layer.name.lower()):
-                for x, y, gid in layer:
-                    if gid != 0:
-                        rects.append(
-                            pg.Rect(
-                                x * GameSettings.TILE_SIZE,
-                                y * GameSettings.TILE_SIZE,
-                                GameSettings.TILE_SIZE,
-                                GameSettings.TILE_SIZE
-                            )
-                        )
-                        '''
-                        [TODO HACKATHON 4]
-                        rects.append(pg.Rect(...))
-                        Append the collision rectangle to the rects[] array
-                        Remember scale the rectangle with the TILE_SIZE from settings
-                        '''
-                        pass
-        return rects
+    def sweep(self, rect: pg.Rect, dx: float, dy: float) -> SweepHit:
+        """First contact of rect moving by (dx, dy) with a wall or an object shape"""
+        hit = sweep_grid(self.grid, rect, dx, dy, SOLID)
+        if self.shapes:
+            for shape in self.shapes.candidates(rect.union(rect.move(dx, dy))):
+                shape_hit = sweep_shape(rect, dx, dy, shape)
+                if shape_hit.time < hit.time:
+                    hit = shape_hit
+        return hit
+
+    def _render_area(self, image: pg.Surface, target: pg.Surface, area: pg.Rect) -> None:
+        """Draw the world pixels of area from a baked image into target"""
+        k = self._image_scale
+        if k == 1:
+            target.blit(image, (0, 0), area)
+            return
+        src = pg.Rect(area.x // k, area.y // k, -(-area.width // k), -(-area.height // k))
+        scaled = pg.transform.scale(image.subsurface(src), (src.width * k, src.height * k))
+        target.blit(scaled, (src.x * k - area.x, src.y * k - area.y))
+
+    def render_thumbnail(self, size: tuple[int, int]) -> pg.Surface:
+        """Whole map scaled to size (for the minimap)"""
+        image = self._base
+        if self._above is not None:
+            image = image.copy()
+            image.blit(self._above, (0, 0))
+        return pg.transform.smoothscale(image, size)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Map":
@@ -173,6 +181,7 @@ class Map:
                         gm=None  # game_manager will be assigned later by GameManager
                     )
                     map_obj.npcs.append(npc)
+                    map_obj.add_entity(npc)
 
         return map_obj
     def to_dict(self):
@@ -0,0 +1,136 @@
+import pygame as pg
+from collections import deque
+from dataclasses import dataclass
+
+from src.utils import GameSettings
+from .tile_grid import TileGrid, SOLID, BUSH
+from .spatial_hash import SpatialHash
+from .collision_shapes import AABBTree
+
+"""
+Grid pathfinding for auto-navigation.
+
+Everything works on a WalkGrid, an immutable snapshot of which tiles can be walked
+on (no walls, no bushes, no trainers/NPCs). Maps cache their WalkGrid, and the world
+graph (on the PathService worker) caches one reverse distance field per teleport
+destination, so going to another map is a gradient walk down the field.
+"""
+
+Tile = tuple[int, int]
+
+# Same neighbour order as the old BFS: right, left, down, up
+_NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+@dataclass(frozen=True)
+class WalkGrid:
+    width: int
+    height: int
+    cells: bytes        # 1 = walkable, row by row
+    version: int        # bumped by the owning Map whenever the walkable tiles change
+
+    def walkable(self, tx: int, ty: int) -> bool:
+        return 0 <= tx < self.width and 0 <= ty < self.height and self.cells[ty * self.width + tx] == 1
+
+
+def static_walk_cells(grid: TileGrid, shapes: AABBTree | None = None) -> bytes:
+    """Walkable tiles ignoring trainers/NPCs (walls, bushes, object shapes), only changes with the grid"""
+    cells = bytearray(0 if c & (SOLID | BUSH) else 1 for c in grid.cells)
+    TILE = GameSettings.TILE_SIZE
+    # A tile the player can't fully stand on because of an object shape is not walkable
+    if shapes:
+        for shape in shapes.shapes:
+            r = shape.rect
+            for ty in range(max(0, r.top // TILE), min(grid.height, (r.bottom - 1) // TILE + 1)):
+                for tx in range(max(0, r.left // TILE), min(grid.width, (r.right - 1) // TILE + 1)):
+                    if shape.collides(pg.Rect(tx * TILE, ty * TILE, TILE, TILE)):
+                        cells[ty * grid.width + tx] = 0
+    return bytes(cells)
+
+
+def entity_tiles(grid: TileGrid, entities: SpatialHash) -> frozenset[Tile]:
+    """Tiles something is standing on, they block like the collision test does"""
+    TILE = GameSettings.TILE_SIZE
+    tiles = set()
+    for rect in entities.rects():
+        for ty in range(max(0, rect.top // TILE), min(grid.height, (rect.bottom - 1) // TILE + 1)):
+            for tx in range(max(0, rect.left // TILE), min(grid.width, (rect.right - 1) // TILE + 1)):
+                tiles.add((tx, ty))
+    return frozenset(tiles)
+
+
+def build_walk_grid(grid: TileGrid, static_cells: bytes, blocked: frozenset[Tile], version: int) -> WalkGrid:
+    """static_walk_cells with the entity tiles laid over them"""
+    cells = bytearray(static_cells)
+    for tx, ty in blocked:
+        cells[ty * grid.width + tx] = 0
+    return WalkGrid(grid.width, grid.height, bytes(cells), version)
+
+
+def distance_field(walk: WalkGrid, goals: list[Tile], avoid: list[Tile] = ()) -> list[int]:
+    """
+    Steps from every tile to the closest goal (-1 if unreachable), BFS outwards from the goals.
+    Tiles in avoid are treated as blocked, e.g. teleporters to other maps.
+    """
+    w, h = walk.width, walk.height
+    cells = walk.cells
+    if avoid:
+        cells = bytearray(cells)
+        for ax, ay in avoid:
+            if 0 <= ax < w and 0 <= ay < h:
+                cells[ay * w + ax] = 0
+    dist = [-1] * (w * h)
+    q: deque[int] = deque()
+    for gx, gy in goals:
+        if 0 <= gx < w and 0 <= gy < h and dist[gy * w + gx] < 0:
+            dist[gy * w + gx] = 0
+            q.append(gy * w + gx)
+    while q:
+        i = q.popleft()
+        d = dist[i] + 1
+        x, y = i % w, i // w
+        if x + 1 < w and dist[i + 1] < 0 and cells[i + 1]:
+            dist[i + 1] = d
+            q.append(i + 1)
+        if x > 0 and dist[i - 1] < 0 and cells[i - 1]:
+            dist[i - 1] = d
+            q.append(i - 1)
+        if y + 1 < h and dist[i + w] < 0 and cells[i + w]:
+            dist[i + w] = d
+            q.append(i + w)
+        if y > 0 and dist[i - w] < 0 and cells[i - w]:
+            dist[i - w] = d
+            q.append(i - w)
+    return dist
+
+
+def follow_field(walk: WalkGrid, field: list[int], start: Tile) -> list[Tile]:
+    """Walk downhill from start to a goal. The start tile itself is not included."""
+    w, h = walk.width, walk.height
+    x, y = start
+
+    def dist_at(tx: int, ty: int) -> int:
+        return field[ty * w + tx] if 0 <= tx < w and 0 <= ty < h else -1
+
+    path: list[Tile] = []
+    d = dist_at(x, y)
+    if d < 0:
+        # Standing on a tile the field doesn't cover (a bush, an edge): step onto the best neighbour
+        best = None
+        for dx, dy in _NEIGHBOURS:
+            nd = dist_at(x + dx, y + dy)
+            if nd >= 0 and (best is None or nd < best[0]):
+                best = (nd, x + dx, y + dy)
+        if best is None:
+            return []
+        d, x, y = best
+        path.append((x, y))
+    while d > 0:
+        for dx, dy in _NEIGHBOURS:
+            if dist_at(x + dx, y + dy) == d - 1:
+                x, y = x + dx, y + dy
+                break
+        d -= 1
+        path.append((x, y))
+    return path
+
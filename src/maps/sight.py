@@ -0,0 +1,92 @@
+from typing import Any
+
+from .tile_grid import TileGrid, SOLID
+
+"""
+Line of sight of the trainers of a map, as tiles.
+
+Each watcher (an EnemyTrainer) sees a straight line of tiles in front of it, cut at
+the first wall. The tiles are registered in a tile -> watchers index, so when the
+player steps on a new tile only that tile is looked up, however many trainers there
+are. Watchers get their `detected` attribute set/cleared by the index.
+"""
+
+Tile = tuple[int, int]
+
+
+def sight_line(grid: TileGrid, origin: Tile, step: Tile, length: int) -> list[Tile]:
+    """Tiles seen from origin looking along step, stopping before a solid tile"""
+    tiles: list[Tile] = []
+    x, y = origin
+    for _ in range(length):
+        x, y = x + step[0], y + step[1]
+        if not grid.in_bounds(x, y) or grid.has(x, y, SOLID):
+            break
+        tiles.append((x, y))
+    return tiles
+
+
+class SightIndex:
+    def __init__(self, grid: TileGrid):
+        self.grid = grid
+        self._version = grid.version
+        self._watchers: dict[Tile, list[Any]] = {}
+        self._lines: dict[Any, tuple[Tile, Tile, int]] = {}    # watcher -> (origin, step, length)
+        self._tiles: dict[Any, list[Tile]] = {}
+        self._target: Tile | None = None
+
+    def watch(self, watcher: Any, origin: Tile, step: Tile, length: int) -> None:
+        """Register (or move/turn) a watcher"""
+        self._forget(watcher)
+        self._lines[watcher] = (origin, step, length)
+        self._register(watcher)
+        watcher.detected = self._target is not None and self._target in self._tiles[watcher]
+
+    def unwatch(self, watcher: Any) -> None:
+        self._forget(watcher)
+        self._lines.pop(watcher, None)
+        watcher.detected = False
+
+    def tiles_of(self, watcher: Any) -> list[Tile]:
+        self._refresh()
+        return self._tiles.get(watcher, [])
+
+    def watchers_at(self, tile: Tile) -> list[Any]:
+        self._refresh()
+        return self._watchers.get(tile, [])
+
+    def move_target(self, tile: Tile | None) -> None:
+        """The player entered tile (None = left the map), update who detects it"""
+        self._refresh()
+        if tile == self._target:
+            return
+        for watcher in self._watchers.get(self._target, ()):
+            watcher.detected = False
+        self._target = tile
+        for watcher in self._watchers.get(tile, ()):
+            watcher.detected = True
+
+    def _register(self, watcher: Any) -> None:
+        tiles = sight_line(self.grid, *self._lines[watcher])
+        self._tiles[watcher] = tiles
+        for tile in tiles:
+            self._watchers.setdefault(tile, []).append(watcher)
+
+    def _forget(self, watcher: Any) -> None:
+        for tile in self._tiles.pop(watcher, ()):
+            bucket = self._watchers[tile]
+            bucket.remove(watcher)
+            if not bucket:
+                del self._watchers[tile]
+
+    def _refresh(self) -> None:
+        # Walls changed: cut every line again
+        if self.grid.version == self._version:
+            return
+        self._version = self.grid.version
+        self._watchers.clear()
+        self._tiles.clear()
+        for watcher in self._lines:
+            self._register(watcher)
+        for watcher in self._lines:
+            watcher.detected = self._target is not None and self._target in self._tiles[watcher]
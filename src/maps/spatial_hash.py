@@ -0,0 +1,109 @@
+import pygame as pg
+from typing import Any, Iterator
+
+from src.utils import GameSettings
+
+
+class SpatialHash:
+    """
+    Buckets the dynamic things of a map (trainers, NPCs, ...) by the cells their rect
+    overlaps, so a query only visits the few cells around the queried rect.
+    Each object keeps one pg.Rect that is updated in place when it moves, and it is only
+    moved to other buckets when it actually crosses a cell border.
+    """
+
+    def __init__(self, cell_size: int = GameSettings.TILE_SIZE * 4):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[Any]] = {}
+        self._rects: dict[Any, pg.Rect] = {}
+        self._spans: dict[Any, tuple[int, int, int, int]] = {}
+        self.version = 0    # bumped whenever something is added, removed or moved
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._rects
+
+    def _span(self, rect: pg.Rect) -> tuple[int, int, int, int]:
+        c = self.cell_size
+        return (rect.left // c, rect.top // c,
+                (rect.right - 1) // c, (rect.bottom - 1) // c)
+
+    def _add_to_cells(self, obj: Any, span: tuple[int, int, int, int]) -> None:
+        cx0, cy0, cx1, cy1 = span
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def _remove_from_cells(self, obj: Any, span: tuple[int, int, int, int]) -> None:
+        cx0, cy0, cx1, cy1 = span
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.remove(obj)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, obj: Any, rect: pg.Rect) -> None:
+        if obj in self._rects:
+            self.move(obj, rect)
+            return
+        rect = pg.Rect(rect)
+        span = self._span(rect)
+        self._rects[obj] = rect
+        self._spans[obj] = span
+        self._add_to_cells(obj, span)
+        self.version += 1
+
+    def remove(self, obj: Any) -> None:
+        if obj not in self._rects:
+            return
+        self._remove_from_cells(obj, self._spans.pop(obj))
+        del self._rects[obj]
+        self.version += 1
+
+    def move(self, obj: Any, rect: pg.Rect) -> None:
+        stored = self._rects.get(obj)
+        if stored is None:
+            self.insert(obj, rect)
+            return
+        if stored == rect:
+            return
+        stored.update(rect)
+        self.version += 1
+        span = self._span(stored)
+        if span != self._spans[obj]:
+            self._remove_from_cells(obj, self._spans[obj])
+            self._add_to_cells(obj, span)
+            self._spans[obj] = span
+
+    def rect_of(self, obj: Any) -> pg.Rect | None:
+        return self._rects.get(obj)
+
+    def rects(self) -> list[pg.Rect]:
+        return list(self._rects.values())
+
+    def query(self, rect: pg.Rect) -> Iterator[Any]:
+        """Objects whose rect collides with rect, each one once"""
+        cx0, cy0, cx1, cy1 = self._span(rect)
+        rects = self._rects
+        if cx0 == cx1 and cy0 == cy1:
+            for obj in self.cells.get((cx0, cy0), ()):
+                if rect.colliderect(rects[obj]):
+                    yield obj
+            return
+        seen = set()
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    if obj not in seen and rect.colliderect(rects[obj]):
+                        seen.add(obj)
+                        yield obj
+
+    def any_collides(self, rect: pg.Rect) -> bool:
+        for _ in self.query(rect):
+            return True
+        return False
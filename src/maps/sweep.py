@@ -0,0 +1,155 @@
+import math
+import pygame as pg
+from dataclasses import dataclass
+
+from src.utils import GameSettings
+from .tile_grid import TileGrid, SOLID
+from .collision_shapes import CollisionShape
+
+"""
+Swept collision: instead of testing where a rect ends up, find the first moment it
+touches something on the way, so a big dt can't tunnel through a thin wall.
+
+The grid sweep visits the rows/columns the leading edges of the rect enter, in time
+order, so it costs the number of tiles crossed whatever dt is. Boxes (entities, object
+rects) use the slab test and polygons are bisected. Rects that already overlap at the
+start are ignored, so something stuck in a wall can always walk out of it.
+server/world.py uses the same functions to replay the players' inputs.
+"""
+
+
+@dataclass(frozen=True)
+class SweepHit:
+    time: float                 # fraction of the move done before the contact, 1.0 = no contact
+    normal: tuple[int, int]     # normal of the surface that was hit, (0, 0) = no contact
+
+    @property
+    def hit(self) -> bool:
+        return self.time < 1.0
+
+
+NO_HIT = SweepHit(1.0, (0, 0))
+_EPS = 1e-9
+
+
+def _sign(v: float) -> int:
+    return (v > 0) - (v < 0)
+
+
+def _span(lo: float, hi: float, d: float, size: int) -> tuple[int, int]:
+    """Tiles overlapped by [lo, hi) right after an instant, while moving by d on that axis"""
+    lo, hi = lo / size, hi / size
+    first = math.floor(lo + _EPS) if d >= 0 else math.ceil(lo - _EPS) - 1
+    last = math.ceil(hi - _EPS) - 1 if d <= 0 else math.floor(hi + _EPS)
+    return first, last
+
+
+def _crossings(lo: int, hi: int, d: float, size: int) -> list[tuple[float, int]]:
+    """(time in [0, 1), tile) each time the leading edge of [lo, hi) enters a new tile"""
+    times = []
+    if d > 0:
+        edge = (hi - 1) // size + 1             # first tile not overlapped yet
+        while True:
+            t = (edge * size - hi) / d
+            if t >= 1:
+                break
+            times.append((max(t, 0.0), edge))
+            edge += 1
+    elif d < 0:
+        edge = lo // size - 1
+        while True:
+            t = ((edge + 1) * size - lo) / d
+            if t >= 1:
+                break
+            times.append((max(t, 0.0), edge))
+            edge -= 1
+    return times
+
+
+def sweep_grid(grid: TileGrid, rect: pg.Rect, dx: float, dy: float, flag: int = SOLID) -> SweepHit:
+    """First contact of rect moving by (dx, dy) with a tile having flag"""
+    TILE = GameSettings.TILE_SIZE
+    events = [(t, 0, c) for t, c in _crossings(rect.left, rect.right, dx, TILE)]
+    events += [(t, 1, r) for t, r in _crossings(rect.top, rect.bottom, dy, TILE)]
+    events.sort()   # ties: columns before rows
+    for t, axis, index in events:
+        if axis == 0:
+            top = rect.top + dy * t
+            r0, r1 = _span(top, top + rect.height, dy, TILE)
+            for r in range(r0, r1 + 1):
+                if grid.has(index, r, flag):
+                    return SweepHit(t, (-_sign(dx), 0))
+        else:
+            left = rect.left + dx * t
+            c0, c1 = _span(left, left + rect.width, dx, TILE)
+            for c in range(c0, c1 + 1):
+                if grid.has(c, index, flag):
+                    return SweepHit(t, (0, -_sign(dy)))
+    return NO_HIT
+
+
+def sweep_box(rect: pg.Rect, dx: float, dy: float, box: pg.Rect) -> SweepHit:
+    """Slab test of rect moving by (dx, dy) against a static box"""
+    if rect.colliderect(box):
+        return NO_HIT
+    if dx > 0:
+        x_entry, x_exit = (box.left - rect.right) / dx, (box.right - rect.left) / dx
+    elif dx < 0:
+        x_entry, x_exit = (box.right - rect.left) / dx, (box.left - rect.right) / dx
+    elif rect.right <= box.left or rect.left >= box.right:
+        return NO_HIT
+    else:
+        x_entry, x_exit = -math.inf, math.inf
+    if dy > 0:
+        y_entry, y_exit = (box.top - rect.bottom) / dy, (box.bottom - rect.top) / dy
+    elif dy < 0:
+        y_entry, y_exit = (box.bottom - rect.top) / dy, (box.top - rect.bottom) / dy
+    elif rect.bottom <= box.top or rect.top >= box.bottom:
+        return NO_HIT
+    else:
+        y_entry, y_exit = -math.inf, math.inf
+
+    entry, exit = max(x_entry, y_entry), min(x_exit, y_exit)
+    if entry >= exit or entry < 0 or entry >= 1:
+        return NO_HIT
+    if x_entry > y_entry:
+        return SweepHit(entry, (-_sign(dx), 0))
+    return SweepHit(entry, (0, -_sign(dy)))
+
+
+def _moved(rect: pg.Rect, dx: float, dy: float, t: float) -> pg.Rect:
+    return rect.move(contact_offset(dx, t), contact_offset(dy, t))
+
+
+def sweep_shape(rect: pg.Rect, dx: float, dy: float, shape: CollisionShape) -> SweepHit:
+    """Like sweep_box, polygons are stepped one pixel at a time then bisected"""
+    if shape.points is None:
+        return sweep_box(rect, dx, dy, shape.rect)
+    if shape.collides(rect):
+        return NO_HIT
+    steps = max(1, math.ceil(max(abs(dx), abs(dy))))
+    lo = 0.0
+    for i in range(1, steps + 1):
+        hi = i / steps
+        if shape.collides(_moved(rect, dx, dy, hi)):
+            break
+        lo = hi
+    else:
+        return NO_HIT
+    for _ in range(12):
+        mid = (lo + hi) / 2
+        if shape.collides(_moved(rect, dx, dy, mid)):
+            hi = mid
+        else:
+            lo = mid
+    # Which axis blocks: keep the y of the contact and go back on x only
+    back_x = _moved(rect, dx, dy, hi)
+    back_x.x = _moved(rect, dx, dy, lo).x
+    if dx and not shape.collides(back_x):
+        return SweepHit(lo, (-_sign(dx), 0))
+    return SweepHit(lo, (0, -_sign(dy)))
+
+
+def contact_offset(d: float, t: float) -> int:
+    """Whole pixels moved along an axis before a contact at time t (never past it)"""
+    return math.floor(d * t + _EPS) if d > 0 else math.ceil(d * t - _EPS)
@@ -0,0 +1,63 @@
+import pygame as pg
+
+from src.utils import GameSettings
+
+# Tile flags, several can be set on the same tile
+SOLID = 1   # collision / house layers
+BUSH = 2    # wild encounter zone
+PC = 4      # PC box (also solid)
+
+
+class TileGrid:
+    """
+    One byte per tile holding the flags above, baked once when the map is loaded.
+    Queries only look at the tiles they overlap, so their cost doesn't depend on the
+    size of the map or on how many walls it has.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        self.version = 0    # bumped on every change, caches built from the grid compare it
+
+    def in_bounds(self, tx: int, ty: int) -> bool:
+        return 0 <= tx < self.width and 0 <= ty < self.height
+
+    def set(self, tx: int, ty: int, flag: int) -> None:
+        self.cells[ty * self.width + tx] |= flag
+        self.version += 1
+
+    def has(self, tx: int, ty: int, flag: int) -> bool:
+        """False outside the map, like the old rect lists that only covered the map"""
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return False
+        return bool(self.cells[ty * self.width + tx] & flag)
+
+    def has_at(self, x: float, y: float, flag: int) -> bool:
+        """Flag of the tile containing the pixel (x, y)"""
+        TILE = GameSettings.TILE_SIZE
+        return self.has(int(x // TILE), int(y // TILE), flag)
+
+    def rect_hits(self, rect: pg.Rect, flag: int) -> bool:
+        """True if any tile overlapped by rect has the flag"""
+        TILE = GameSettings.TILE_SIZE
+        tx0 = max(0, rect.left // TILE)
+        ty0 = max(0, rect.top // TILE)
+        tx1 = min(self.width - 1, (rect.right - 1) // TILE)
+        ty1 = min(self.height - 1, (rect.bottom - 1) // TILE)
+        cells = self.cells
+        for ty in range(ty0, ty1 + 1):
+            row = ty * self.width
+            for tx in range(tx0, tx1 + 1):
+                if cells[row + tx] & flag:
+                    return True
+        return False
+
+    def tiles(self, flag: int) -> list[tuple[int, int]]:
+        """All tiles with the flag, row by row"""
+        return [(i % self.width, i // self.width) for i, c in enumerate(self.cells) if c & flag]
+
+    def rects(self, flag: int) -> list[pg.Rect]:
+        TILE = GameSettings.TILE_SIZE
+        return [pg.Rect(tx * TILE, ty * TILE, TILE, TILE) for tx, ty in self.tiles(flag)]
@@ -0,0 +1,163 @@
+import heapq
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.utils import GameSettings
+from .pathfinding import WalkGrid, distance_field, follow_field
+
+if TYPE_CHECKING:
+    from .map import Map
+
+Tile = tuple[int, int]
+Entry = tuple[str, Tile]    # where a teleporter drops the player: (map, tile)
+
+
+@dataclass(frozen=True)
+class MapSnapshot:
+    """What the planner needs from a Map, safe to hand to the PathService worker"""
+    walk: WalkGrid
+    teleports: dict[Tile, tuple[str, Tile | None]]    # tile -> (destination, arrival tile or None if not loaded)
+
+
+class WorldGraph:
+    """
+    Maps connected by their teleporters, for navigation across several maps.
+
+    Nodes are the entry points (map, arrival tile) of every teleporter. Walking from an
+    entry to a teleporter costs the distance field value of that map, taking the
+    teleporter costs one step. Shortest routes from every entry to every map are
+    precomputed with Dijkstra and rebuilt only when a map's walkable grid changes.
+
+    The game thread only calls snapshot(); route() and reachable_from() run on the
+    PathService worker (see PathService.plan_route), which also owns the caches.
+    """
+
+    def __init__(self, maps: dict[str, "Map"]):
+        self.maps = maps
+        self._snapshots: dict[str, MapSnapshot] = {}
+        # Worker thread only
+        self._version: tuple | None = None
+        # entry -> target map -> (steps, first map to teleport to)
+        self._routes: dict[Entry, dict[str, tuple[int, str]]] = {}
+        # (map, destination) -> (walk grid it was computed on, distance field)
+        self._fields: dict[tuple[str, str], tuple[WalkGrid, list[int]]] = {}
+
+    def _arrival(self, tp, dest: str) -> Tile:
+        TILE = GameSettings.TILE_SIZE
+        pos = tp.dest_pos if tp.dest_pos else self.maps[dest].spawn
+        # Tile under the player's center, like Player.current_tile
+        return int((pos.x + TILE // 2) // TILE), int((pos.y + TILE // 2) // TILE)
+
+    def snapshot(self) -> dict[str, MapSnapshot]:
+        """Immutable view of every map (game thread), only rebuilt for maps whose walk grid changed"""
+        for name, m in self.maps.items():
+            walk = m.walk_grid()
+            snap = self._snapshots.get(name)
+            if snap is None or snap.walk is not walk:
+                teleports = {}
+                for tile, tp in m.teleport_tiles():
+                    arrival = self._arrival(tp, tp.destination) if tp.destination in self.maps else None
+                    teleports[tile] = (tp.destination, arrival)
+                self._snapshots[name] = MapSnapshot(walk, teleports)
+        return dict(self._snapshots)
+
+    # -------------------------
+    # Worker thread
+    # -------------------------
+    def _path(self, world: dict[str, MapSnapshot], map_name: str, start: Tile, dest: str) -> list[Tile]:
+        """Tiles from start to a teleporter leading to dest, [] if there is none"""
+        snap = world[map_name]
+        cached = self._fields.get((map_name, dest))
+        if cached is None or cached[0] is not snap.walk:
+            goals = [tile for tile, (to, _) in snap.teleports.items() if to == dest and snap.walk.walkable(*tile)]
+            # Stepping on any other teleporter on the way would leave the map
+            avoid = [tile for tile, (to, _) in snap.teleports.items() if to != dest]
+            cached = (snap.walk, distance_field(snap.walk, goals, avoid))
+            self._fields[(map_name, dest)] = cached
+        return follow_field(snap.walk, cached[1], start)
+
+    def _legs(self, world: dict[str, MapSnapshot], map_name: str, start: Tile) -> list[tuple[int, str, Entry, list[Tile]]]:
+        """(steps, destination, entry, path) for every map reachable by walking from start to a teleporter"""
+        legs = []
+        for dest in {to for to, _ in world[map_name].teleports.values()}:
+            if dest not in world or dest == map_name:
+                continue
+            path = self._path(world, map_name, start, dest)
+            goal = path[-1] if path else start
+            tp = world[map_name].teleports.get(goal)
+            if tp is None or tp[0] != dest:
+                continue    # no walkable way to that teleporter
+            legs.append((len(path) + 1, dest, (dest, tp[1]), path))
+        return legs
+
+    def _refresh(self, world: dict[str, MapSnapshot]) -> None:
+        version = tuple((name, snap.walk.version) for name, snap in world.items())
+        if version == self._version:
+            return
+        self._version = version
+
+        entries: set[Entry] = set()
+        for snap in world.values():
+            for dest, arrival in snap.teleports.values():
+                if dest in world:
+                    entries.add((dest, arrival))
+        edges = {e: self._legs(world, *e) for e in entries}
+
+        self._routes = {}
+        for source in entries:
+            best: dict[str, tuple[int, str]] = {}
+            dist = {source: 0}
+            heap: list[tuple[int, Entry, str]] = [(0, source, "")]
+            while heap:
+                d, entry, first = heapq.heappop(heap)
+                if d > dist.get(entry, 1 << 30):
+                    continue
+                if first and entry[0] not in best:
+                    best[entry[0]] = (d, first)
+                for steps, dest, nxt, _ in edges.get(entry, ()):
+                    nd = d + steps
+                    if nd < dist.get(nxt, 1 << 30):
+                        dist[nxt] = nd
+                        heapq.heappush(heap, (nd, nxt, first or dest))
+            self._routes[source] = best
+
+    def route(self, world: dict[str, MapSnapshot], map_name: str, start: Tile,
+              target: str) -> tuple[list[str], list[Tile]]:
+        """
+        (maps to teleport through, in order, ending with target; tile path to the first
+        teleporter). ([], []) if unreachable.
+        """
+        if map_name == target or target not in world:
+            return [], []
+        self._refresh(world)
+        best: tuple[int, str, Entry, list[Tile]] | None = None
+        for steps, dest, entry, path in self._legs(world, map_name, start):
+            if dest == target:
+                cost = steps
+            elif target in self._routes.get(entry, {}):
+                cost = steps + self._routes[entry][target][0]
+            else:
+                continue
+            if best is None or cost < best[0]:
+                best = (cost, dest, entry, path)
+        if best is None:
+            return [], []
+
+        hops = [best[1]]
+        entry = best[2]
+        while hops[-1] != target:
+            _, nxt = self._routes[entry][target]
+            leg = next(l for l in self._legs(world, *entry) if l[1] == nxt)
+            hops.append(nxt)
+            entry = leg[2]
+        return hops, best[3]
+
+    def reachable_from(self, world: dict[str, MapSnapshot], map_name: str, start: Tile) -> list[str]:
+        """Every other map the player can walk to from start, sorted by name"""
+        self._refresh(world)
+        reachable: set[str] = set()
+        for _, dest, entry, _ in self._legs(world, map_name, start):
+            reachable.add(dest)
+            reachable.update(self._routes.get(entry, {}))
+        reachable.discard(map_name)
+        return sorted(reachable)
@@ -1,7 +1,7 @@
 import pygame as pg
 import copy
 from src.scenes.scene import Scene
-from src.core.services import scene_manager, input_manager,sound_manager
+from src.core.services import scene_manager, input_manager,sound_manager, resource_manager
 from src.utils import GameSettings,Position
 from src.utils.definition import Monster
 from src.sprites import Sprite,BackgroundSprite
@@ -222,7 +222,6 @@ class BattleScene(Scene):
 
         self.bg = BackgroundSprite("backgrounds/background1.png")
         self.bg.image = pg.transform.scale(self.bg.image, (1280,530))
-        self.font = pg.font.Font(None, 28)
         self.message_box_text = None
         self.waiting_for_click = False
         self.battle_over = False
@@ -568,7 +567,7 @@ class BattleScene(Scene):
         pg.draw.rect(s, (40, 200, 40), (x+1, y+1, int(148 * ratio), 10))
 
     def _draw_button_text(self, screen, button: Button, text: str):
-        txt_surf = self.font.render(text, True, (0, 0, 0))
+        txt_surf = resource_manager.render_text(text, 28)
         # detect hover using the button's current image reference
         is_hover = (button.img_button is button.img_button_hover)
         y_offset = 5 if is_hover else 0   # drop 5px when hovered
@@ -585,7 +584,6 @@ class BattleScene(Scene):
         elem_icon.draw(screen)
 
     def draw(self, screen):
-        self.font_small = pg.font.Font(None, 22)
         if not self.ready:
             return
 
@@ -604,10 +602,10 @@ class BattleScene(Scene):
         #enemy element
         self._draw_element_icon(screen,self.enemy_data.get("type", "Normal"),e_card.right - 30,e_card.top + 5)
         #enemy name
-        e_name = self.font_small.render(self.enemy_data["name"], True, (0, 0, 0))
+        e_name = resource_manager.render_text(self.enemy_data["name"], 22)
         screen.blit(e_name, (e_card.left + 80, e_card.top + 7))
         #enemy level
-        e_level = self.font_small.render(f"Lv.{self.enemy_data['level']}", True, (0, 0, 0))
+        e_level = resource_manager.render_text(f"Lv.{self.enemy_data['level']}", 22)
         screen.blit(e_level, (e_card.right - 60, e_card.top + 7))
         #enemy max hp
         e_hp_bg = pg.Rect(e_card.left + 80, e_card.top + 35, 130, 10)
@@ -618,7 +616,7 @@ class BattleScene(Scene):
         pg.draw.rect(screen, (50, 200, 50), e_hp_fill)
         pg.draw.rect(screen, (0, 0, 0), e_hp_fill, 2)
         #enemy hp text
-        e_hp_text = self.font_small.render(f"{self.enemy_data['hp']}/{self.enemy_data['max_hp']}", True, (0, 0, 0))
+        e_hp_text = resource_manager.render_text(f"{self.enemy_data['hp']}/{self.enemy_data['max_hp']}", 22)
         screen.blit(
             e_hp_text,
             (
@@ -641,10 +639,10 @@ class BattleScene(Scene):
         #player element
         self._draw_element_icon(screen,self.player_pokemon.get("type", "Normal"),p_card.right - 30,p_card.top + 5)
         #player name
-        p_name = self.font_small.render(self.player_pokemon["name"], True, (0, 0, 0))
+        p_name = resource_manager.render_text(self.player_pokemon["name"], 22)
         screen.blit(p_name, (p_card.left + 80, p_card.top + 7))
         #player level
-        p_level = self.font_small.render(f"Lv.{self.player_pokemon['level']}", True, (0, 0, 0))
+        p_level = resource_manager.render_text(f"Lv.{self.player_pokemon['level']}", 22)
         screen.blit(p_level, (p_card.right - 60, p_card.top + 7))
         #player max hp
         p_hp_bg = pg.Rect(p_card.left + 80, p_card.top + 35, 130, 10)
@@ -655,7 +653,7 @@ class BattleScene(Scene):
         pg.draw.rect(screen, (50, 200, 50), p_hp_fill)
         pg.draw.rect(screen, (0, 0, 0), p_hp_fill, 2)
         #player hp text
-        p_hp_text = self.font_small.render(f"{self.player_pokemon['hp']}/{self.player_pokemon['max_hp']}", True, (0, 0, 0))
+        p_hp_text = resource_manager.render_text(f"{self.player_pokemon['hp']}/{self.player_pokemon['max_hp']}", 22)
         screen.blit(
             p_hp_text,
             (
@@ -690,7 +688,7 @@ class BattleScene(Scene):
             self._draw_button_text(screen, self.item_button, "ITEM") 
             self._draw_button_text(screen, self.run_button, "RUN")
         if self.enemy_should_attack and self.waiting_for_click == False:
-            txt = self.font.render("ENEMY TURN", True, (255, 255, 255))
+            txt = resource_manager.render_text("ENEMY TURN", 28, (255, 255, 255))
             screen.blit(txt, (640 - txt.get_width()//2,
                             GameSettings.SCREEN_HEIGHT - 120))
             
@@ -727,10 +725,10 @@ class BattleScene(Scene):
 
                 # Text
                 count = self.get_item_count(data_name)
-                txt_surf = self.font.render(f"{display_name}  (x{count})", True, (0, 0, 0))
+                txt_surf = resource_manager.render_text(f"{display_name}  (x{count})", 28)
                 screen.blit(txt_surf, (menu_x + 60, row_rect.centery - txt_surf.get_height() // 2))
 
         if self.message_box_text:
-            txt = self.font.render(self.message_box_text, True, (255, 255, 255))
+            txt = resource_manager.render_text(self.message_box_text, 28, (255, 255, 255))
             screen.blit(txt, (640 - txt.get_width()//2, 615-txt.get_height()//2))   # Position inside battle menu
            
\ No newline at end of file
@@ -1,7 +1,7 @@
 import random
 import pygame as pg
 from src.scenes.scene import Scene
-from src.core.services import scene_manager, input_manager,sound_manager
+from src.core.services import scene_manager, input_manager,sound_manager, resource_manager
 from src.utils import GameSettings,Position
 from src.sprites import Sprite,BackgroundSprite
 from src.interface.components import Button
@@ -108,7 +108,6 @@ class CatchScene(Scene):
         self.enemy_should_attack = False
         self.hp_animate_speed = 80 
 
-        self.font = pg.font.Font(None, 36)
         normal_btn = "UI/raw/UI_Flat_Button02a_3.png"
         hover_btn  = "UI/raw/UI_Flat_Button02a_2.png"
         self.message_text = None
@@ -617,7 +616,7 @@ class CatchScene(Scene):
             self.waiting_for_click = True
             self.enemy_should_attack = True
     def _draw_button_text(self, screen, button: Button, text: str):
-        txt_surf = self.font.render(text, True, (0, 0, 0))
+        txt_surf = resource_manager.render_text(text, 36)
 
         # Hover detection based on Button’s current image
         is_hover = (button.img_button is button.img_button_hover)
@@ -637,8 +636,6 @@ class CatchScene(Scene):
 
 
     def draw(self, screen):
-        self.font_small = pg.font.Font(None,22)
-        self.font_tiny = pg.font.Font(None, 28)
 
         self.bg.draw(screen)
         
@@ -656,10 +653,10 @@ class CatchScene(Scene):
         #player element
         self._draw_element_icon(screen,self.player_pokemon.get("type", "Normal"),p_card.right - 30,p_card.top + 5)
         #player name
-        p_name = self.font_small.render(self.player_pokemon["name"], True, (0, 0, 0))
+        p_name = resource_manager.render_text(self.player_pokemon["name"], 22)
         screen.blit(p_name, (p_card.left + 80, p_card.top + 7))
         #player level
-        p_level = self.font_small.render(f"Lv.{self.player_pokemon['level']}", True, (0, 0, 0))
+        p_level = resource_manager.render_text(f"Lv.{self.player_pokemon['level']}", 22)
         screen.blit(p_level, (p_card.right - 60, p_card.top + 7))
         #player max hp
         p_hp_bg = pg.Rect(p_card.left + 80, p_card.top + 35, 130, 10)
@@ -670,7 +667,7 @@ class CatchScene(Scene):
         pg.draw.rect(screen, (50, 200, 50), p_hp_fill)
         pg.draw.rect(screen, (0, 0, 0), p_hp_fill, 2)
         #player hp text
-        p_hp_text = self.font_small.render(f"{self.player_pokemon['hp']}/{self.player_pokemon['max_hp']}", True, (0, 0, 0))
+        p_hp_text = resource_manager.render_text(f"{self.player_pokemon['hp']}/{self.player_pokemon['max_hp']}", 22)
         screen.blit(
             p_hp_text,
             (
@@ -692,10 +689,10 @@ class CatchScene(Scene):
         #wild element icon
         self._draw_element_icon(screen,self.wild_pokemon.get("type", "Normal"),e_card.right - 30,e_card.top + 5)
         #wild poke name
-        e_name = self.font_small.render(self.wild_pokemon["name"], True, (0, 0, 0))
+        e_name = resource_manager.render_text(self.wild_pokemon["name"], 22)
         screen.blit(e_name, (e_card.left + 80, e_card.top + 7))
         #wild poke level
-        e_level = self.font_small.render(f"Lv.{self.wild_pokemon['level']}", True, (0, 0, 0))
+        e_level = resource_manager.render_text(f"Lv.{self.wild_pokemon['level']}", 22)
         screen.blit(e_level, (e_card.right - 60, e_card.top + 7))
         #wild poke max hp
         e_hp_bg = pg.Rect(e_card.left + 80, e_card.top + 35, 130, 10)
@@ -706,7 +703,7 @@ class CatchScene(Scene):
         pg.draw.rect(screen, (50, 200, 50), e_hp_fill)
         pg.draw.rect(screen, (0, 0, 0), e_hp_fill, 2)
         #wild poke hp text
-        e_hp_text = self.font_small.render(f"{self.wild_pokemon['hp']}/{self.wild_pokemon['max_hp']}", True, (0, 0, 0))
+        e_hp_text = resource_manager.render_text(f"{self.wild_pokemon['hp']}/{self.wild_pokemon['max_hp']}", 22)
         screen.blit(
             e_hp_text,
             (
@@ -737,12 +734,12 @@ class CatchScene(Scene):
             #pokeball
             ball_count = self._get_pokeball_count()
             self.pokeball_icon.draw(screen)
-            count_text = self.font.render(f"x {ball_count}", True, (255, 255, 255))
+            count_text = resource_manager.render_text(f"x {ball_count}", 36, (255, 255, 255))
             screen.blit(count_text, (self.catch_button.hitbox.left + 50, self.catch_button.hitbox.top - 35))
             #catch button
             self.catch_button.draw(screen)
             #chance text
-            chance_text = self.font.render(f"{self.ratio*100:.2f}%",True,(255,255,255))
+            chance_text = resource_manager.render_text(f"{self.ratio*100:.2f}%", 36, (255,255,255))
             screen.blit(chance_text, (self.catch_button.hitbox.left , self.catch_button.hitbox.bottom + 10))
             #run button
             self.run_button.draw(screen)
@@ -791,15 +788,15 @@ class CatchScene(Scene):
 
                 # Text
                 count = self.get_item_count(data_name)
-                txt_surf = self.font_tiny.render(f"{display_name}  (x{count})", True, (0, 0, 0))
+                txt_surf = resource_manager.render_text(f"{display_name}  (x{count})", 28)
                 screen.blit(txt_surf, (menu_x + 60, row_rect.centery - txt_surf.get_height() // 2))
         if self.enemy_should_attack and self.waiting_for_click == False:
-            txt = self.font.render("ENEMY TURN", True, (255, 255, 255))
+            txt = resource_manager.render_text("ENEMY TURN", 36, (255, 255, 255))
             screen.blit(txt, (640 - txt.get_width()//2,
                             GameSettings.SCREEN_HEIGHT - 120))
             
         if self.message_text:
-            txt = self.font.render(self.message_text, True, (255, 255, 255))
+            txt = resource_manager.render_text(self.message_text, 36, (255, 255, 255))
             screen.blit(txt, (
                 640 - txt.get_width() // 2,
                 615 - txt.get_height() // 2
@@ -3,19 +3,21 @@ import threading
 import time
 
 from src.scenes.scene import Scene
-from src.core import GameManager, OnlineManager
+from src.core import GameManager, OnlineManager, OnlineProcessManager, TickScheduler
 from src.core.services import scene_manager
 from src.utils import Logger, PositionCamera, GameSettings, Position, Direction
-from src.core.services import sound_manager, input_manager
+from src.core.services import sound_manager, input_manager, path_service, resource_manager
 from src.sprites import Sprite
 from typing import override
-from src.interface.components import Button
+from src.interface.components import Button, Panel
 from src.interface.minimap import Minimap
 from src.interface.components.chat_overlay import ChatOverlay
+from src.interface.net_overlay import NetStatsOverlay
+from src.maps.tile_grid import BUSH
 
 class GameScene(Scene):
     game_manager: GameManager
-    online_manager: OnlineManager | None
+    online_manager: OnlineManager | OnlineProcessManager | None
     sprite_online: Sprite
     
     def __init__(self):
@@ -29,27 +31,33 @@ class GameScene(Scene):
         
         # Online Manager
         if GameSettings.IS_ONLINE:
-            self.online_manager = OnlineManager()
+            if GameSettings.ONLINE_SUBPROCESS:
+                self.online_manager = OnlineProcessManager()
+            else:
+                self.online_manager = OnlineManager()
             
             self.chat_overlay = ChatOverlay(
                 send_callback=self.online_manager.send_chat,
                 get_messages=self.online_manager.get_recent_chat    
             )
+            self.net_overlay = NetStatsOverlay(self.online_manager.get_net_stats)
 
         else:
             self.online_manager = None
             self.chat_overlay = None
+            self.net_overlay = None
         self._chat_bubbles = {}          # { player_id : (text, expire_time) }
         self._last_chat_id_seen = 0      # last chat message ID seen
         self._chat_last_activity = time.monotonic()   # last time chat happened
         self._chat_visible = False                    # controls chatbox visibility
+        self._last_bush_tile: tuple[str, int, int] | None = None
+        # Trainers/NPCs far from the camera are updated less often or not at all
+        self.ticks = TickScheduler()
         #nav
         self.nav_overlay_open = False
         self.nav_map_buttons: list[tuple[str, Button]] = []
         self.nav_btn_normal = "UI/raw/UI_Flat_Button02a_3.png"
         self.nav_btn_hover = "UI/raw/UI_Flat_Button02a_2.png"
-        self.nav_font = pg.font.Font(None, 28)
-        self.nav_small_font = pg.font.Font(None, 24)
 
         self.cooldown = 0
         #nav button 
@@ -134,6 +142,14 @@ class GameScene(Scene):
         self.item_scroll = 0
         self.item_scroll_speed = 20
         self.minimap = Minimap(self.game_manager.current_map, self.game_manager.player)
+        self._drawn_view: tuple | None = None   # (camera, open overlay) of the last drawn frame
+        # Overlays drawn by the scene itself, repainted only when their state changes
+        self.settings_panel = Panel((550, 400))
+        self.nav_panel = Panel((420, 360), radius=16, dim=180, shadow=False)
+        # Dimmed world under the open modal overlay (see _overlay_snapshot)
+        self._snapshot: pg.Surface | None = None
+        self._snapshot_key: tuple | None = None
+        self._snapshot_time = 0.0
 
 
 
@@ -170,12 +186,19 @@ class GameScene(Scene):
             new_manager = self.game_manager.load("saves/game0.json")
             if new_manager:
                 self.game_manager = new_manager
+                self.ticks.clear()
+                self._bind_online_player()
                 print("[INFO] Game loaded successfully.")
             else:
                 print("[WARN] No save file found.")
         except Exception as e:
             print(f"[ERROR] Failed to load game: {e}")
 
+    def _bind_online_player(self):
+        # The local player predicts its movement and reconciles with the server
+        if self.game_manager.player:
+            self.game_manager.player.net = self.online_manager
+
     def _toggle_nav_overlay(self):
         if self.nav_overlay_open:
             self._close_nav_overlay()
@@ -193,31 +216,25 @@ class GameScene(Scene):
     def _on_click_map_destination(self, map_name: str):
         self._close_nav_overlay()
         if self.game_manager.player:
-            # compute BFS to teleport that leads to map_name
+            # route over the teleport graph, walked one map at a time
             self.game_manager.player.start_navigation_to_map(map_name)
 
     def _rebuild_nav_buttons(self):
-        # ONLY show destinations that current map can teleport to
+        # Every map reachable from here, possibly through several teleports
         cur_map = self.game_manager.current_map
-        if not cur_map:
+        player = self.game_manager.player
+        if not cur_map or not player:
             self.nav_map_buttons = []
             return
 
-        # get unique destination names from current map teleports
-        names = []
-        seen = set()
-        for tp in cur_map.teleporters:
-            dest = tp.destination
-            if dest == cur_map.path_name:
-                continue
-            if dest in seen:
-                continue
-            seen.add(dest)
-            names.append(dest)
-
-        # (optional) sort for stable order
-        names.sort()
+        # Solved by the path service, the buttons appear once it is done
+        self.nav_map_buttons = []
+        path_service.find_reachable(self.game_manager.world, cur_map.path_name, player.current_tile,
+                                    self._set_nav_buttons, owner=self)
 
+    def _set_nav_buttons(self, names: list[str]):
+        if not self.nav_overlay_open:
+            return
         panel_w, panel_h = 420, 360
         panel_x = (GameSettings.SCREEN_WIDTH - panel_w) // 2
         panel_y = (GameSettings.SCREEN_HEIGHT - panel_h) // 2
@@ -251,14 +268,24 @@ class GameScene(Scene):
             sound_manager.pause_all()
         if self.online_manager:
             self.online_manager.enter()
+        self._bind_online_player()
         
     @override
     def exit(self) -> None:
         if self.online_manager:
             self.online_manager.exit()
         
+    def _tick_entities(self) -> list:
+        return self.game_manager.current_enemy_trainers + self.game_manager.current_map.npcs
+
     @override
     def update(self, dt: float):
+        # Finished path requests (navigation legs)
+        path_service.poll()
+        # Messages from the network process (player id, server state, chat), once per frame
+        if self.online_manager:
+            self.online_manager.poll()
+
         #navigation
         if not self.show_settings:
             self.nav_open_button.update(dt)
@@ -287,6 +314,12 @@ class GameScene(Scene):
                     self.toggle_settings()
 
         
+        #network diagnostics (F3)
+        if self.net_overlay:
+            if input_manager.key_pressed(pg.K_F3) and (not self.chat_overlay or not self.chat_overlay.is_open):
+                self.net_overlay.toggle()
+            self.net_overlay.update(dt)
+
         #if bag overlay open, dont update the rest 
         self.bag_button.update(dt)
         self.game_manager.bag.update(dt)
@@ -359,23 +392,30 @@ class GameScene(Scene):
 
             return
         # Check if there is assigned next scene
+        map_key = self.game_manager.current_map_key
         self.game_manager.try_switch_map()
+        if self.game_manager.current_map_key != map_key:
+            self.ticks.clear()   # don't keep the previous map's trainers/NPCs alive
         
         # Update player and other data
         if not self.chat_overlay or not self.chat_overlay.is_open:
             if self.game_manager.player:
                 self.game_manager.player.update(dt)
-            for enemy in self.game_manager.current_enemy_trainers:
-                enemy.update(dt)    
+            if self.game_manager.player:
+                self.ticks.update(self._tick_entities(), self.game_manager.player.camera, dt)
             self.cooldown -= dt
 
-        #minimap
+        #minimap, only does work after a map change
         self.minimap.update_map(self.game_manager.current_map)
         self.minimap.update_enemy_trainers(self.game_manager.current_enemy_trainers)
 
         
-        #bush
-        if self.game_manager.current_map.check_bush(self.game_manager.player.position):
+        #bush, only when the player steps onto a new tile
+        player = self.game_manager.player
+        tile = (self.game_manager.current_map_key, *player.current_tile)
+        entered = tile != self._last_bush_tile
+        self._last_bush_tile = tile
+        if entered and self.game_manager.current_map.grid.has(tile[1], tile[2], BUSH):
             if(self.cooldown <=0):
                 catch_scene = scene_manager.get_scene("catch")
                 catch_scene.start_catch(self.game_manager)
@@ -417,8 +457,107 @@ class GameScene(Scene):
                 player.animation.current_frame
             )
         
+    def _modal(self) -> tuple[Panel, tuple] | None:
+        """(panel, state) of the overlay that freezes the world, None if there is none (or several)"""
+        gm = self.game_manager
+        open_panels = []
+        if self.nav_overlay_open:
+            open_panels.append((self.nav_panel, self._nav_state))
+        if self.show_settings:
+            open_panels.append((self.settings_panel, self._settings_state))
+        if gm.bag.visible:
+            open_panels.append((gm.bag.panel, gm.bag.panel_state))
+        if gm.current_shop_overlay:
+            open_panels.append((gm.current_shop_overlay.panel, gm.current_shop_overlay.panel_state))
+        if gm.pc_box.visible:
+            open_panels.append((gm.pc_box.panel, gm.pc_box.panel_state))
+        if len(open_panels) != 1:
+            return None
+        panel, state = open_panels[0]
+        return panel, state()
+
+    def _view_key(self) -> tuple:
+        camera = self.game_manager.player.camera if self.game_manager.player else PositionCamera(0, 0)
+        modal = self._modal()
+        return int(camera.x), int(camera.y), self.game_manager.current_map_key, modal and modal[0]
+
+    @override
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        # Static-camera fallback: offline, an open overlay freezes the world and the camera,
+        # so only the overlay panel (when its state changed) and the HUD buttons can change.
+        # Anything else is a full frame.
+        if self.online_manager or self._drawn_view != self._view_key():
+            return None
+        modal = self._modal()
+        if modal is None:
+            return None
+        panel, state = modal
+        rects = [panel.bounds] if panel.changed(state) else []
+        if self._modal_under_hud():
+            # Otherwise the HUD is part of the dimmed snapshot
+            for button in (self.nav_open_button, self.bag_button, self.settings_button):
+                rect = button.dirty_rect()
+                if rect:
+                    rects.append(rect)
+        return rects
+
     @override
     def draw(self, screen: pg.Surface):        
+        self._drawn_view = self._view_key()
+        gm = self.game_manager
+        snapshot = self._overlay_snapshot(screen)
+        if snapshot is None:
+            self._draw_world(screen)
+            #bag and pc
+            gm.bag.draw(screen)
+            gm.pc_box.draw(screen)
+            self._draw_hud(screen)
+            self._draw_top_overlays(screen)
+            return
+
+        # A modal overlay is open: the dimmed world (and the HUD, for the overlays drawn over it)
+        # comes from the snapshot, only the overlay itself is drawn
+        screen.blit(snapshot, (0, 0))
+        if self._modal_under_hud():
+            gm.bag.draw(screen, dim=False)
+            gm.pc_box.draw(screen, dim=False)
+            self._draw_hud(screen)
+        else:
+            self._draw_top_overlays(screen, dim=False)
+
+    def _modal_under_hud(self) -> bool:
+        """The bag and the PC box are drawn under the HUD buttons, the other overlays over them"""
+        return self.game_manager.bag.visible or self.game_manager.pc_box.visible
+
+    def _overlay_snapshot(self, screen: pg.Surface) -> pg.Surface | None:
+        """
+        Composited, already dimmed picture of everything under the open modal overlay.
+        Offline the world is frozen while an overlay is open, so it is taken once per overlay.
+        Online the other players keep moving: it is retaken every OVERLAY_SNAPSHOT_REFRESH
+        seconds, or not used at all if that is 0.
+        """
+        modal = self._modal()
+        refresh = GameSettings.OVERLAY_SNAPSHOT_REFRESH
+        if modal is None or (self.online_manager and refresh <= 0):
+            self._snapshot = None
+            return None
+        key = self._view_key()
+        now = time.monotonic()
+        stale = self.online_manager is not None and now - self._snapshot_time >= refresh
+        if self._snapshot is None or self._snapshot_key != key or stale:
+            if self._snapshot is None:
+                self._snapshot = pg.Surface(screen.get_size()).convert(screen)
+            surface = self._snapshot
+            surface.fill((0, 0, 0))
+            self._draw_world(surface)
+            if not self._modal_under_hud():
+                self._draw_hud(surface)
+            modal[0].draw_dim(surface)
+            self._snapshot_key = key
+            self._snapshot_time = now
+        return self._snapshot
+
+    def _draw_world(self, screen: pg.Surface):
         if self.game_manager.player:
             '''
             [TODO HACKATHON 3]
@@ -439,11 +578,10 @@ class GameScene(Scene):
         if hasattr(self.game_manager.current_map, "npcs"):
             for npc in self.game_manager.current_map.npcs:
                 npc.draw(screen, self.game_manager.player.camera)
+        # Roofs/tree tops over everything standing on the map
+        self.game_manager.current_map.draw_above(screen, camera)
 
-        #bag and pc
-        self.game_manager.bag.draw(screen)
-        self.game_manager.pc_box.draw(screen)
-
+    def _draw_hud(self, screen: pg.Surface):
         #chat box
         if self.chat_overlay and self._chat_visible:
             self.chat_overlay.draw(screen)
@@ -454,6 +592,8 @@ class GameScene(Scene):
                 self.remote_players = {}  # id → Animation
 
             list_online = self.online_manager.get_list_players()
+            self.minimap.update_remote_players(
+                [p for p in list_online if p["map"] == self.game_manager.current_map.path_name])
 
             for p in list_online:
                 if p["map"] != self.game_manager.current_map.path_name:
@@ -489,12 +629,16 @@ class GameScene(Scene):
                 anim.draw(screen)
 
             try:
-                self._draw_chat_bubbles(screen, camera)
+                self._draw_chat_bubbles(screen, self.game_manager.player.camera)
             except Exception as e:
                 Logger.error(f"Bubble error: {e}")    
 
         #minimap
         self.minimap.draw(screen)
+
+        #network diagnostics
+        if self.net_overlay:
+            self.net_overlay.draw(screen)
         
         #BAG OVERLAY
         self.bag_button.draw(screen)
@@ -504,7 +648,7 @@ class GameScene(Scene):
 
         # NAV open button + text
         self.nav_open_button.draw(screen)
-        nav_text = self.nav_small_font.render("NAV", True, (0, 0, 0))
+        nav_text = resource_manager.render_text("NAV", 24)
         is_hover = (self.nav_open_button.img_button is self.nav_open_button.img_button_hover)
         if is_hover:
             screen.blit(
@@ -523,9 +667,10 @@ class GameScene(Scene):
                 )
             )
 
+    def _draw_top_overlays(self, screen: pg.Surface, dim: bool = True):
         #shop
         if self.game_manager.current_shop_overlay:
-            self.game_manager.current_shop_overlay.draw(screen)
+            self.game_manager.current_shop_overlay.draw(screen, dim)
             if not self.game_manager.current_shop_overlay.is_open:
                 self.game_manager.close_shop()
                 
@@ -534,124 +679,81 @@ class GameScene(Scene):
 
         #SETTING OVERLAY
         if self.show_settings:
-            #Dim the background
-            dim_surface = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
-            dim_surface.fill((0, 0, 0, 160))
-            screen.blit(dim_surface, (0, 0))
-
-            # panel setup
-            panel_width, panel_height = 550, 400  # wider panel
-            panel_x = (GameSettings.SCREEN_WIDTH - panel_width) // 2
-            panel_y = (GameSettings.SCREEN_HEIGHT - panel_height) // 2
-            panel_rect = pg.Rect(panel_x, panel_y, panel_width, panel_height)
-
-            # Shadow (simple bottom-right offset) 
-            shadow_rect = panel_rect.move(6, 6)
-            pg.draw.rect(screen, (50, 50, 50), shadow_rect, border_radius=20)
-
-            # Main orange panel 
-            pg.draw.rect(screen, (255, 165, 0), panel_rect, border_radius=20)
-
-            # Border outline
-            pg.draw.rect(screen, (0, 0, 0), panel_rect, 3, border_radius=20)
-
-            #Title text
-            font = pg.font.Font(None, 50)
-            title = font.render("SETTINGS", True, (0, 0, 0))
-            screen.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 30))
-            # Volume Text
-            small_font = pg.font.Font(None, 36)
-            vol_text = small_font.render(f"Volume: {int(self.volume * 100)}%", True, (0, 0, 0))
-            screen.blit(vol_text, (self.slider_rect.left, self.slider_rect.top - 30))
-
-            # Slider
-            pg.draw.rect(screen, (255, 255, 255), self.slider_rect, border_radius=5)
-            pg.draw.rect(screen, (0, 0, 0), self.slider_rect, 1, border_radius=5)
-            pg.draw.circle(screen, (0, 0, 0), self.slider_knob_rect.center, 12)
-            pg.draw.circle(screen, (255, 255, 255), self.slider_knob_rect.center, 10)
-
-            # Mute Text
-            mute_text = small_font.render(f"Mute: {'On' if self.muted else 'Off'}", True, (0, 0, 0))
-            screen.blit(mute_text, (self.toggle_rect.left, self.toggle_rect.top - 30))
-
-            # Mute button
-            bg_color = (0, 180, 0) if self.muted else (180, 0, 0)
-            pg.draw.rect(screen, bg_color, self.toggle_rect, border_radius=10)
-            pg.draw.rect(screen, (0, 0, 0), self.toggle_rect, 2, border_radius=10)
-            knob_x = self.toggle_rect.right - 20 if self.muted else self.toggle_rect.left + 20 
-            pg.draw.circle(screen, (255, 255, 255), (knob_x, self.toggle_rect.centery), 10)
-
-            #save and load text
-            
-            save_text = small_font.render("SAVE", True, (0, 0, 0))
-            load_text = small_font.render("LOAD", True, (0, 0, 0))
-
-            screen.blit(save_text,
-                        (
-                            self.save_button.hitbox.left +3 ,
-                            self.save_button.hitbox.top - save_text.get_height()
-                        )
-                    )
-
-            screen.blit(load_text,
-                        (
-                            self.load_button.hitbox.left + 3,
-                            self.load_button.hitbox.top - load_text.get_height()
-                        )
-                    )
-            
-            #save and load button
-            self.save_button.draw(screen)
-            self.load_button.draw(screen)
-
-
-            # Back button
-            self.back_button.draw(screen)
-            self.x_button.draw(screen)
+            self.settings_panel.draw(screen, self._settings_state(), self._paint_settings, dim)
 
         #navigation
         if self.nav_overlay_open:
-            dim = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
-            dim.fill((0, 0, 0, 180))
-            screen.blit(dim, (0, 0))
-
-            panel_w, panel_h = 420, 360
-            panel_x = (GameSettings.SCREEN_WIDTH - panel_w) // 2
-            panel_y = (GameSettings.SCREEN_HEIGHT - panel_h) // 2
-            panel = pg.Rect(panel_x, panel_y, panel_w, panel_h)
-
-            pg.draw.rect(screen, (255, 165, 0), panel, border_radius=16)
-            pg.draw.rect(screen, (0, 0, 0), panel, 3, border_radius=16)
-
-            title = self.nav_font.render("Select Destination", True, (0, 0, 0))
-            screen.blit(title, (panel.centerx - title.get_width() // 2, panel.top + 26))
-
-            hint = self.nav_small_font.render("Click a map to auto-walk", True, (20, 20, 20))
-            screen.blit(hint, (panel.centerx - hint.get_width() // 2, panel.top + 56))
-
-            # draw map buttons + text labels
-            for name, btn in self.nav_map_buttons:
-                btn.draw(screen)
-                label = self.nav_small_font.render(name, True, (0, 0, 0))
-                is_hover = (btn.img_button is btn.img_button_hover)
-                if is_hover:
-                    screen.blit(
-                        label,
-                        (
-                            btn.hitbox.centerx - label.get_width() // 2,
-                            btn.hitbox.centery + 4 - label.get_height() // 2
-                        )
-                    )
-                else:
-                    screen.blit(
-                        label,
-                        (
-                            btn.hitbox.centerx - label.get_width() // 2,
-                            btn.hitbox.centery - label.get_height() // 2
-                        )
-                    )
-
-
+            self.nav_panel.draw(screen, self._nav_state(), self._paint_nav, dim)
+
+    def _settings_state(self) -> tuple:
+        buttons = (self.back_button, self.x_button, self.save_button, self.load_button)
+        return self.slider_knob_rect.center, int(self.volume * 100), self.muted, tuple(b.img_button for b in buttons)
+
+    def _paint_settings(self, surface: pg.Surface):
+        panel_rect = self.settings_panel.rect
+
+        #Title text
+        title = resource_manager.render_text("SETTINGS", 50)
+        surface.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.top + 30))
+        # Volume Text
+        vol_text = resource_manager.render_text(f"Volume: {int(self.volume * 100)}%", 36)
+        surface.blit(vol_text, (self.slider_rect.left, self.slider_rect.top - 30))
+
+        # Slider
+        pg.draw.rect(surface, (255, 255, 255), self.slider_rect, border_radius=5)
+        pg.draw.rect(surface, (0, 0, 0), self.slider_rect, 1, border_radius=5)
+        pg.draw.circle(surface, (0, 0, 0), self.slider_knob_rect.center, 12)
+        pg.draw.circle(surface, (255, 255, 255), self.slider_knob_rect.center, 10)
+
+        # Mute Text
+        mute_text = resource_manager.render_text(f"Mute: {'On' if self.muted else 'Off'}", 36)
+        surface.blit(mute_text, (self.toggle_rect.left, self.toggle_rect.top - 30))
+
+        # Mute button
+        bg_color = (0, 180, 0) if self.muted else (180, 0, 0)
+        pg.draw.rect(surface, bg_color, self.toggle_rect, border_radius=10)
+        pg.draw.rect(surface, (0, 0, 0), self.toggle_rect, 2, border_radius=10)
+        knob_x = self.toggle_rect.right - 20 if self.muted else self.toggle_rect.left + 20 
+        pg.draw.circle(surface, (255, 255, 255), (knob_x, self.toggle_rect.centery), 10)
+
+        #save and load text
+        save_text = resource_manager.render_text("SAVE", 36)
+        load_text = resource_manager.render_text("LOAD", 36)
+        surface.blit(save_text, (self.save_button.hitbox.left + 3, self.save_button.hitbox.top - save_text.get_height()))
+        surface.blit(load_text, (self.load_button.hitbox.left + 3, self.load_button.hitbox.top - load_text.get_height()))
+
+        #save and load button
+        self.save_button.draw(surface)
+        self.load_button.draw(surface)
+
+        # Back button
+        self.back_button.draw(surface)
+        self.x_button.draw(surface)
+
+    def _nav_state(self) -> tuple:
+        return tuple((name, btn.img_button) for name, btn in self.nav_map_buttons)
+
+    def _paint_nav(self, surface: pg.Surface):
+        panel = self.nav_panel.rect
+
+        title = resource_manager.render_text("Select Destination", 28)
+        surface.blit(title, (panel.centerx - title.get_width() // 2, panel.top + 26))
+
+        hint = resource_manager.render_text("Click a map to auto-walk", 24, (20, 20, 20))
+        surface.blit(hint, (panel.centerx - hint.get_width() // 2, panel.top + 56))
+
+        # draw map buttons + text labels (pushed down 4px while hovered)
+        for name, btn in self.nav_map_buttons:
+            btn.draw(surface)
+            label = resource_manager.render_text(name, 24)
+            offset = 4 if btn.img_button is btn.img_button_hover else 0
+            surface.blit(
+                label,
+                (
+                    btn.hitbox.centerx - label.get_width() // 2,
+                    btn.hitbox.centery + offset - label.get_height() // 2
+                )
+            )
 
     def _draw_chat_bubbles(self, screen: pg.Surface, camera: PositionCamera):
         if not self.online_manager:
@@ -669,13 +771,12 @@ class GameScene(Scene):
 
         # draw local player first
         local_pid = self.online_manager.player_id
-        font = pg.font.SysFont("Arial", 16)
 
         # Local player bubble
         if local_pid in self._chat_bubbles:
             text, _ = self._chat_bubbles[local_pid]
             self._draw_chat_bubble_for_pos(
-                screen, camera, self.game_manager.player.position, text, font
+                screen, camera, self.game_manager.player.position, text
             )
 
         # Other players
@@ -688,10 +789,10 @@ class GameScene(Scene):
             text, _ = self._chat_bubbles[pid]
 
             self._draw_chat_bubble_for_pos(
-                screen, camera, world_pos, text, font
+                screen, camera, world_pos, text
             )
 
-    def _draw_chat_bubble_for_pos(self, screen, camera, world_pos, text, font):
+    def _draw_chat_bubble_for_pos(self, screen, camera, world_pos, text):
         # Convert world → screen pos
         screen_pos = camera.transform_position_as_position(world_pos)
         sx = screen_pos.x + 32
@@ -700,7 +801,7 @@ class GameScene(Scene):
         # Bubble appears slightly above head
         sy -= 20
 
-        text_surf = font.render(text, True, (255,255,255))
+        text_surf = resource_manager.render_text(text, 16, (255,255,255), font="Arial")
         padding = 6
         w = text_surf.get_width() + padding * 2
         h = text_surf.get_height() + padding * 2
@@ -48,6 +48,11 @@ class MenuScene(Scene):
         self.play_button.update(dt)
         self.setting_button.update(dt)
 
+    @override
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        # The background never changes, only the buttons hover
+        return [r for r in (self.play_button.dirty_rect(), self.setting_button.dirty_rect()) if r]
+
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
@@ -15,4 +15,11 @@ class Scene:
         ...
 
     def draw(self, screen: pg.Surface) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """
+        Screen regions that will look different on the next draw, asked right before it.
+        None means redraw the whole screen (the default), [] means nothing changed.
+        """
+        return None
@@ -3,8 +3,8 @@ import pygame as pg
 from src.utils import GameSettings
 from src.sprites import BackgroundSprite
 from src.scenes.scene import Scene
-from src.interface.components import Button
-from src.core.services import scene_manager, sound_manager, input_manager
+from src.interface.components import Button, Panel
+from src.core.services import scene_manager, sound_manager, input_manager, resource_manager
 from typing import override
 
 class SettingScene(Scene):
@@ -13,7 +13,6 @@ class SettingScene(Scene):
         self.panel_width = 550
         self.panel_height = 400
         self.panel_color = (255, 165, 0)  
-        self.shadow_color = (50, 50, 50) 
 
         self.panel_rect = pg.Rect(
             (GameSettings.SCREEN_WIDTH - self.panel_width) // 2,
@@ -21,6 +20,8 @@ class SettingScene(Scene):
             self.panel_width,
             self.panel_height,
         )
+        # Shadow, panel and widgets are kept in a surface, repainted when _state() changes
+        self.panel = Panel((self.panel_width, self.panel_height), color=self.panel_color)
 
         self.back_button = Button(
             "UI/button_back.png",
@@ -46,6 +47,9 @@ class SettingScene(Scene):
 
         self.dragging = False
 
+    def _state(self) -> tuple:
+        return self.slider_knob_rect.center, int(self.volume * 100), self.muted, self.back_button.img_button
+
     def _update_knob_pos(self):
         self.slider_knob_rect.center = (
             self.slider_rect.left + int(self.volume * self.slider_rect.width),
@@ -100,51 +104,46 @@ class SettingScene(Scene):
             if self.toggle_rect.collidepoint(mouse_x, mouse_y):
                 self.toggle_mute()
     @override
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        # Slider knob, volume text, mute toggle and back button are all inside the panel
+        if self.panel.changed(self._state()):
+            return [self.panel.bounds]
+        return []
+
+    @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
-        #Dim background
-        dim_surface = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), pg.SRCALPHA)
-        dim_surface.fill((0, 0, 0, 160))  
-        screen.blit(dim_surface, (0, 0))
-
-        #Draw shadow 
-        shadow_rect = self.panel_rect.move(6, 6)
-        pg.draw.rect(screen, self.shadow_color, shadow_rect, border_radius=20)
-
-        #Draw main orange panel
-        pg.draw.rect(screen, self.panel_color, self.panel_rect, border_radius=20)
-        pg.draw.rect(screen, (0, 0, 0), self.panel_rect, 3, border_radius=20)
+        self.panel.draw(screen, self._state(), self._paint)
 
+    def _paint(self, surface: pg.Surface) -> None:
         #Title
-        font = pg.font.Font(None, 50)
-        title = font.render("SETTINGS", True, (0, 0, 0))
-        screen.blit(title, (self.panel_rect.centerx - title.get_width() // 2, self.panel_rect.top + 45))
+        title = resource_manager.render_text("SETTINGS", 50)
+        surface.blit(title, (self.panel_rect.centerx - title.get_width() // 2, self.panel_rect.top + 45))
 
         #Back button 
-        self.back_button.draw(screen)
+        self.back_button.draw(surface)
 
 
         #volume text
-        small_font = pg.font.Font(None, 36)
-        vol_text = small_font.render(f"Volume: {int(self.volume * 100)}%", True, (0, 0, 0))
-        screen.blit(vol_text, (self.slider_rect.left, self.slider_rect.top - 30))
+        vol_text = resource_manager.render_text(f"Volume: {int(self.volume * 100)}%", 36)
+        surface.blit(vol_text, (self.slider_rect.left, self.slider_rect.top - 30))
         #volume slider
-        pg.draw.rect(screen, (255, 255, 255), self.slider_rect, border_radius=5)
-        pg.draw.rect(screen, (0, 0, 0), self.slider_rect,1,border_radius=5)
-        pg.draw.circle(screen, (0, 0, 0), self.slider_knob_rect.center, 12)
-        pg.draw.circle(screen, (255, 255, 255), self.slider_knob_rect.center, 10)
+        pg.draw.rect(surface, (255, 255, 255), self.slider_rect, border_radius=5)
+        pg.draw.rect(surface, (0, 0, 0), self.slider_rect,1,border_radius=5)
+        pg.draw.circle(surface, (0, 0, 0), self.slider_knob_rect.center, 12)
+        pg.draw.circle(surface, (255, 255, 255), self.slider_knob_rect.center, 10)
 
         #Mute Label
-        mute_text = small_font.render(f"Mute: {'On' if self.muted else 'Off'}", True, (0, 0, 0))
-        screen.blit(mute_text, (self.slider_rect.left, self.slider_rect.top + 27))
+        mute_text = resource_manager.render_text(f"Mute: {'On' if self.muted else 'Off'}", 36)
+        surface.blit(mute_text, (self.slider_rect.left, self.slider_rect.top + 27))
 
         #mute button
         bg_color = (0, 180, 0) if self.muted else (180, 0, 0)
-        pg.draw.rect(screen, bg_color, self.toggle_rect, border_radius=10)
-        pg.draw.rect(screen, (0, 0, 0), self.toggle_rect, 2, border_radius=10)
+        pg.draw.rect(surface, bg_color, self.toggle_rect, border_radius=10)
+        pg.draw.rect(surface, (0, 0, 0), self.toggle_rect, 2, border_radius=10)
         # knob inside toggle
         knob_x = self.toggle_rect.right - 20 if self.muted else self.toggle_rect.left + 20
-        pg.draw.circle(screen, (255, 255, 255), (knob_x, self.toggle_rect.centery), 10)
+        pg.draw.circle(surface, (255, 255, 255), (knob_x, self.toggle_rect.centery), 10)
 '''
 [TODO HACKATHON 5]
 Try to mimic the menu_scene.py or game_scene.py to create this new scene
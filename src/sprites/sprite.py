@@ -8,9 +8,8 @@ class Sprite:
     rect: pg.Rect
     
     def __init__(self, img_path: str, size: tuple[int, int] | None = None):
-        self.image = resource_manager.get_image(img_path)
-        if size is not None:
-            self.image = pg.transform.scale(self.image, size)
+        # The (scaled) image is shared through the resource manager, a Sprite only owns its rect
+        self.image = resource_manager.get_image(img_path, size)
         self.rect = self.image.get_rect()
         
     def update(self, dt: float):
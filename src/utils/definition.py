@@ -1,3 +1,4 @@
+import math
 from pygame import Rect
 from .settings import GameSettings
 from dataclasses import dataclass
@@ -64,6 +65,15 @@ class Teleport:
             self.pos = Position(x, y)
             self.destination = dest
             self.dest_pos = Position(dest_x, dest_y) if dest_x is not None and dest_y is not None else None
+
+    @property
+    def tile(self) -> tuple[int, int]:
+        """
+        Tile the player's center (Player.current_tile) has to enter. Off-grid teleporters
+        round up, y=27.2 is half inside the house wall and the tile past it is the door.
+        """
+        TILE = GameSettings.TILE_SIZE
+        return math.ceil(self.pos.x / TILE), math.ceil(self.pos.y / TILE)
     
     def to_dict(self):
         data = {
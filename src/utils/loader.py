@@ -3,7 +3,7 @@ from pytmx import load_pygame, TiledMap
 from pathlib import Path
 from .logger import Logger
 
-ASSETS_DIR = Path("assets")
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 
 def load_img(path: str) -> pg.Surface:
     Logger.info(f"Loading image: {path}")
@@ -10,6 +10,7 @@ class Settings:
     DEBUG: bool = True          # Debug mode
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = True  # Draw hitboxes for debugging
+    DIRTY_RECTS: bool = True    # Only redraw the changed parts of the screen when the scene allows it
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5 
@@ -17,5 +18,7 @@ class Settings:
     # Online
     IS_ONLINE: bool = False
     ONLINE_SERVER_URL: str = "http://localhost:8989"
+    ONLINE_SUBPROCESS: bool = False     # run the network stack in its own process
+    OVERLAY_SNAPSHOT_REFRESH: float = 0.5   # seconds between world snapshots under an open overlay when online (0 = draw the world live)
     
 GameSettings = Settings()
\ No newline at end of file